@@ -2,19 +2,23 @@
 
 import re
 from typing import List
-from framework.rubric import RubricItem
+from framework.rubric import RubricItem, get_item
 from framework.java_ast_analyzer import JavaASTAnalyzer
+from framework.source_probes import ProbeSet
 
 # Types that are acceptable as numeric types for this assignment
 NUMERIC_TYPES = {'double', 'float', 'Double', 'Float'}
 INT_TYPES = {'int', 'Integer', 'long', 'Long'}
 
-
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
+# Match new <Class>(<5000 variant>) - handles underscores, suffixes, decimals
+PROBES = ProbeSet(
+    math_pow=(r'Math\.pow', re.IGNORECASE),
+    new_loan1=r'new\s+\w+\s*\(\s*5[_,]?000(?:\.\d*)?\s*[dfDF]?\s*\)',
+    new_loan2=r'new\s+\w+\s*\(\s*31[_,]?000(?:\.\d*)?\s*[dfDF]?\s*\)',
+    amount1=r'5[_,]?000(?:\.\d*)?',
+    amount2=r'31[_,]?000(?:\.\d*)?',
+    new_object=r'new\s+\w+\s*\(',
+)
 
 
 def check_class_structure(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
@@ -144,7 +148,7 @@ def _check_calculate_monthly_payment(methods, analyzer: JavaASTAnalyzer, items:
 
     # Check (d.i): formula check via AST - look for Math.pow usage
     formula_item = get_item(items, "class_d_i")
-    has_math_pow = analyzer.source_contains(r'Math\.pow', re.IGNORECASE)
+    has_math_pow = analyzer.probe(PROBES)["math_pow"]
 
     if not has_math_pow:
         formula_item.deduction = formula_item.max_deduction
@@ -194,18 +198,15 @@ def _check_loan_objects(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
     """
     item = get_item(items, "main_a")
 
-    # Match new <Class>(<5000 variant>) - handles underscores, suffixes, decimals
-    loan1_pattern = r'new\s+\w+\s*\(\s*5[_,]?000(?:\.\d*)?\s*[dfDF]?\s*\)'
-    loan2_pattern = r'new\s+\w+\s*\(\s*31[_,]?000(?:\.\d*)?\s*[dfDF]?\s*\)'
-
-    has_loan1 = analyzer.source_contains(loan1_pattern)
-    has_loan2 = analyzer.source_contains(loan2_pattern)
+    hits = analyzer.probe(PROBES)
+    has_loan1 = hits["new_loan1"]
+    has_loan2 = hits["new_loan2"]
 
     # Also check for variable-based construction (e.g., double amt = 5000; new Loan(amt))
     if not has_loan1:
-        has_loan1 = analyzer.source_contains(r'5[_,]?000(?:\.\d*)?') and analyzer.source_contains(r'new\s+\w+\s*\(')
+        has_loan1 = hits["amount1"] and hits["new_object"]
     if not has_loan2:
-        has_loan2 = analyzer.source_contains(r'31[_,]?000(?:\.\d*)?') and analyzer.source_contains(r'new\s+\w+\s*\(')
+        has_loan2 = hits["amount2"] and hits["new_object"]
 
     if not has_loan1 and not has_loan2:
         item.deduction = item.max_deduction
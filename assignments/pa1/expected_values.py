@@ -21,6 +21,10 @@ for rate in RATES:
             val = compute_monthly_payment(principal, rate, months)
             EXPECTED[(rate, months, label)] = round(val, 2)
 
+# Report labels for class-wide analytics
+LABELED_VALUES = {f"{label} at {rate}%, {months} months": value
+                  for (rate, months, label), value in EXPECTED.items()}
+
 # Convenient lookup: all expected values as formatted strings
 EXPECTED_STRINGS = {k: f"{v:.2f}" for k, v in EXPECTED.items()}
 
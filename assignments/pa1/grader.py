@@ -7,8 +7,8 @@ from framework.base_grader import BaseGrader
 from framework.rubric import RubricItem
 from assignments.pa1.rubric_items import create_pa1_rubric
 from assignments.pa1.ast_checks import check_class_structure as pa1_ast_checks
-from assignments.pa1.output_checks import check_output as pa1_output_checks
-from assignments.pa1.expected_values import get_expected_output_text
+from assignments.pa1.output_checks import TOLERANCE, check_output as pa1_output_checks
+from assignments.pa1.expected_values import LABELED_VALUES, get_expected_output_text
 
 # Fields already covered by PA1 rubric items - skip in OOP checks to avoid double-counting
 PA1_RUBRIC_FIELDS = {'annualInterestRate', 'principal'}
@@ -17,6 +17,9 @@ PA1_RUBRIC_FIELDS = {'annualInterestRate', 'principal'}
 class PA1Grader(BaseGrader):
     """Grader for Programming Assignment 1: Loan Account."""
 
+    expected_values = LABELED_VALUES
+    value_tolerance = TOLERANCE
+
     def define_rubric(self) -> List[RubricItem]:
         return create_pa1_rubric()
 
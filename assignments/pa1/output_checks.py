@@ -3,58 +3,40 @@
 import re
 from typing import List
 
-from framework.rubric import RubricItem
+from framework.output_index import OutputIndex
+from framework.overrides import OutputContext, Outcome, Override, OverridePlan, PredicateSet
+from framework.rubric import RubricItem, get_item
+from assignments.pa1.rubric_items import PA1_RUBRIC
 from assignments.pa1.expected_values import EXPECTED, EXPECTED_STRINGS, RATES, TERMS, PRINCIPALS
 
 # Tolerance for floating point comparison (covers Math.round differences)
 TOLERANCE = 0.02
 
 
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
-
-
-def _extract_all_numbers(output: str) -> List[float]:
-    """Extract all decimal numbers from output as floats."""
-    return [float(x) for x in re.findall(r'\d+\.\d+', output)]
-
-
-def _value_in_output(expected_val: float, output_numbers: List[float]) -> bool:
-    """Check if an expected value appears in the output numbers within tolerance."""
-    for num in output_numbers:
-        if abs(num - expected_val) <= TOLERANCE:
-            return True
-    return False
-
-
-def _count_matches(output: str) -> dict:
+def _count_matches(index: OutputIndex) -> dict:
     """Count how many expected values match in the output, grouped by rate and term."""
-    output_numbers = _extract_all_numbers(output)
     matches = {"total": 0, "by_rate": {1: 0, 5: 0}, "by_term": {36: 0, 60: 0, 72: 0}}
 
-    for (rate, months, label), expected_val in EXPECTED.items():
-        if _value_in_output(expected_val, output_numbers):
-            matches["total"] += 1
-            matches["by_rate"][rate] += 1
-            matches["by_term"][months] += 1
+    for rate, months, _ in index.matched(EXPECTED, TOLERANCE):
+        matches["total"] += 1
+        matches["by_rate"][rate] += 1
+        matches["by_term"][months] += 1
 
     return matches
 
 
 def check_output(items: List[RubricItem], output: str):
     """Run all output verification checks for PA1."""
-    matches = _count_matches(output)
+    index = OutputIndex(output)
+    values = OVERRIDES.evaluate(OutputContext(output, index))
+    matches = values["matches"]
 
     _check_headings(items, output)
     _check_columnar_format(items, output)
-    _check_decimal_places(items, output)
+    _check_decimal_places(items, index)
     _check_interest_rates(items, output, matches)
     _check_loan_terms(items, output, matches)
-    _check_formula_via_output(items, output, matches)
-    _check_loan_objects_via_output(items, output, matches)
+    OVERRIDES.apply(items, values)
 
 
 def _check_headings(items: List[RubricItem], output: str):
@@ -107,19 +89,12 @@ def _check_columnar_format(items: List[RubricItem], output: str):
         item.notes = f"Only {len(data_lines)} data lines found, expected at least 4"
 
 
-def _check_decimal_places(items: List[RubricItem], output: str):
+def _check_decimal_places(items: List[RubricItem], index: OutputIndex):
     """Check (main_d): 2 decimal places for all dollar amounts."""
     item = get_item(items, "main_d")
 
-    # Extract numbers that look like payment amounts (not principal amounts in headings)
-    all_numbers = re.findall(r'\d+\.\d+', output)
-
-    # Filter to only payment-range values (roughly 50-1000)
-    payment_numbers = []
-    for num_str in all_numbers:
-        val = float(num_str)
-        if 50 <= val <= 1000:
-            payment_numbers.append(num_str)
+    # Only payment-range values (roughly 50-1000), not principal amounts in headings
+    payment_numbers = index.between(50, 1000)
 
     if not payment_numbers:
         item.deduction = item.max_deduction
@@ -127,11 +102,7 @@ def _check_decimal_places(items: List[RubricItem], output: str):
         item.notes = "No payment values found in output"
         return
 
-    bad_format = []
-    for num_str in payment_numbers:
-        decimal_part = num_str.split('.')[1]
-        if len(decimal_part) != 2:
-            bad_format.append(num_str)
+    bad_format = [n.text for n in payment_numbers if n.decimals != 2]
 
     if bad_format:
         item.deduction = item.max_deduction
@@ -179,39 +150,26 @@ def _check_loan_terms(items: List[RubricItem], output: str, matches: dict):
         item.notes = f"Missing payment values for: {', '.join(missing)}"
 
 
-def _check_formula_via_output(items: List[RubricItem], output: str, matches: dict):
-    """
-    Check (class_d_i): verify formula correctness by comparing output values.
-    If expected values appear in output (with tolerance), formula is correct.
-    This overrides the AST-only Math.pow check.
-    """
-    item = get_item(items, "class_d_i")
-    total_expected = len(EXPECTED)
-
-    if matches["total"] == total_expected:
-        item.deduction = 0
-        item.passed = True
-        item.notes = "Formula verified: all output values match expected"
-    elif matches["total"] > total_expected // 2:
-        item.deduction = 0
-        item.passed = True
-        item.notes = f"Formula mostly correct: {matches['total']}/{total_expected} values match"
-    elif matches["total"] > 0:
-        item.deduction = 5
-        item.passed = False
-        item.notes = f"Formula partially correct: only {matches['total']}/{total_expected} values match"
-    # If matches["total"] == 0, keep whatever was set by the AST check
-
-
-def _check_loan_objects_via_output(items: List[RubricItem], output: str, matches: dict):
-    """
-    Override loan object AST check if output proves objects were created correctly.
-    If we see correct values for both loan1 and loan2, the objects exist.
-    """
-    item = get_item(items, "main_a")
-
-    if not item.passed and matches["total"] >= 8:
-        # At least 8 out of 12 values match - both loans are clearly working
-        item.deduction = 0
-        item.passed = True
-        item.notes = "Loan objects verified via output (correct payment values present)"
+# --- Output evidence that overrides AST results ---
+
+PREDICATES = PredicateSet(
+    matches=lambda ctx: _count_matches(ctx.index),
+)
+
+OVERRIDES = OverridePlan(PA1_RUBRIC, PREDICATES, [
+    # (class_d_i) Formula correctness from the output values overrides the AST-only
+    # Math.pow check; with no matching values, the AST result stands
+    Override("class_d_i", item="class_d_i", cases=[
+        (lambda p: p["matches"]["total"] == len(EXPECTED),
+         Outcome(0, True, "Formula verified: all output values match expected")),
+        (lambda p: p["matches"]["total"] > len(EXPECTED) // 2,
+         Outcome(0, True, f"Formula mostly correct: {{matches[total]}}/{len(EXPECTED)} values match")),
+        (lambda p: p["matches"]["total"] > 0,
+         Outcome(5, False, f"Formula partially correct: only {{matches[total]}}/{len(EXPECTED)} values match")),
+    ]),
+    # (main_a) At least 8 out of 12 values match - both loan objects are clearly working
+    Override("main_a", item="main_a", only_if_passed=False, cases=[
+        (lambda p: p["matches"]["total"] >= 8,
+         Outcome(0, True, "Loan objects verified via output (correct payment values present)")),
+    ]),
+])
@@ -1,91 +1,65 @@
 """PA2-specific AST/static analysis checks for the Loan Account Hierarchy."""
 
 import re
-from typing import List, Dict, Optional
-from framework.rubric import RubricItem
-from framework.java_ast_analyzer import JavaASTAnalyzer
-from pathlib import Path
+from typing import List, Optional
+from framework.rubric import RubricItem, get_item
+from framework.project_model import ClassSymbol, ProjectModel
+from framework.source_bundle import SourceBundle
+from framework.source_probes import ProbeSet
 
 NUMERIC_TYPES = {'double', 'float', 'Double', 'Float'}
 INT_TYPES = {'int', 'Integer', 'long', 'Long'}
 STRING_TYPES = {'String', 'string'}
 
-
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
-
-
-def _build_class_map(java_files: List[Path], all_sources: dict) -> Dict[str, JavaASTAnalyzer]:
-    """Map lowercase class names to their analyzers."""
-    class_map = {}
-    for f in java_files:
-        source = all_sources.get(f, f.read_text(errors='ignore'))
-        analyzer = JavaASTAnalyzer(source)
-        for name in analyzer.get_class_names():
-            class_map[name.lower()] = analyzer
-    return class_map
-
-
-def _find_analyzer(class_map: dict, *names) -> Optional[JavaASTAnalyzer]:
-    """Find analyzer for a class by trying exact names, then substring match."""
-    # Exact match first
-    for name in names:
-        if name.lower() in class_map:
-            return class_map[name.lower()]
-    # Substring match: find any class whose name contains one of the search terms
-    for name in names:
-        key = name.lower()
-        for class_name, analyzer in class_map.items():
-            if key in class_name:
-                return analyzer
-    return None
+PROBES = ProbeSet(
+    math_pow=(r'Math\.pow', re.IGNORECASE),
+    tostring=r'toString\s*\(',
+    tostring_any_case=(r'toString\s*\(', re.IGNORECASE),
+    vin=(r'(?:vehicleVIN|vin|VIN)\b', re.IGNORECASE),
+)
 
 
-def _find_base_loan_class(class_map: dict):
-    """Find the base loan account class by name variants or by characteristic properties.
-    Returns (lowercase_name, analyzer) or (None, None)."""
+def find_base_loan_class(project: ProjectModel) -> Optional[ClassSymbol]:
+    """Find the base loan account class by name variants or by characteristic properties."""
     # Try known name variants first
     for name in ('loanaccount', 'loanaccounthierarchy', 'loan', 'loanclass', 'baseloan'):
-        if name in class_map:
-            return name, class_map[name]
+        symbol = project.get(name)
+        if symbol:
+            return symbol
 
     # Fallback: find by characteristic properties (principal + rate + months)
     skip = {'address', 'carloan', 'primarymortgage', 'unsecuredloan',
             'main', 'test', 'customer'}
-    for name, analyzer in class_map.items():
-        if name in skip:
+    for symbol in project:
+        if symbol.key in skip:
             continue
-        fields = analyzer.get_fields()
-        field_names = {f.name.lower() for f in fields}
+        field_names = {f.name.lower() for f in project.fields(symbol)}
         has_principal = any(n in field_names for n in ('principal', 'principle', 'loanamount'))
         has_rate = any(n in field_names for n in ('annualinterestrate', 'annualinterest', 'interestrate', 'rate'))
         has_months = any(n in field_names for n in ('months', 'numberofmonths', 'term', 'nummonths', 'loanterm'))
         if has_principal and has_rate and has_months:
-            return name, analyzer
+            return symbol
 
-    return None, None
+    return None
 
 
-def check_class_structure(java_files: List[Path], all_sources: dict, items: List[RubricItem]):
+def check_class_structure(bundle: SourceBundle, items: List[RubricItem]):
     """Run all PA2 class structure checks."""
-    class_map = _build_class_map(java_files, all_sources)
+    project = bundle.project
 
-    base_name = _check_loan_account(class_map, items)
-    _check_car_loan(class_map, items, base_name)
-    _check_primary_mortgage(class_map, items, base_name)
-    _check_unsecured_loan(class_map, items, base_name)
-    _check_address(class_map, items)
+    base_name = _check_loan_account(project, items)
+    _check_car_loan(project, items, base_name)
+    _check_primary_mortgage(project, items, base_name)
+    _check_unsecured_loan(project, items, base_name)
+    _check_address(project, items)
 
 
 # ---- LoanAccount Class ----
 
-def _check_loan_account(class_map: dict, items: List[RubricItem]) -> str:
+def _check_loan_account(project: ProjectModel, items: List[RubricItem]) -> str:
     """Check LoanAccount class structure. Returns the lowercase name of the found base class."""
-    base_name, analyzer = _find_base_loan_class(class_map)
-    if not analyzer:
+    symbol = find_base_loan_class(project)
+    if not symbol:
         for item_id in ('la_props', 'la_constructor', 'la_calculate', 'la_getters', 'la_tostring'):
             item = get_item(items, item_id)
             item.deduction = item.max_deduction
@@ -93,17 +67,17 @@ def _check_loan_account(class_map: dict, items: List[RubricItem]) -> str:
             item.notes = "LoanAccount class not found"
         return 'loanaccount'
 
-    _check_la_properties(analyzer, items)
-    _check_la_constructor(analyzer, items)
-    _check_la_calculate(analyzer, items)
-    _check_la_getters(analyzer, items)
-    _check_la_tostring(analyzer, items)
-    return base_name
+    _check_la_properties(project, symbol, items)
+    _check_la_constructor(project, symbol, items)
+    _check_la_calculate(project, symbol, items)
+    _check_la_getters(project, symbol, items)
+    _check_la_tostring(project, symbol, items)
+    return symbol.key
 
 
-def _check_la_properties(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_la_properties(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "la_props")
-    fields = analyzer.get_fields()
+    fields = project.fields(symbol)
     field_names = {f.name.lower() for f in fields}
 
     missing = []
@@ -120,9 +94,9 @@ def _check_la_properties(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
         item.notes = f"Missing properties: {', '.join(missing)}"
 
 
-def _check_la_constructor(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_la_constructor(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "la_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
 
     matching = [c for c in constructors if len(c.param_types) == 3]
     if not matching:
@@ -136,9 +110,9 @@ def _check_la_constructor(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
             item.notes = "No constructor found"
 
 
-def _check_la_calculate(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_la_calculate(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "la_calculate")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
 
     matching = [m for m in methods if m.name.lower() == "calculatemonthlypayment"]
     if not matching:
@@ -157,7 +131,7 @@ def _check_la_calculate(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
         issues.append(f"should take no parameters, found {len(method.param_types)}")
 
     # Check for Math.pow in the formula
-    if not analyzer.source_contains(r'Math\.pow', re.IGNORECASE):
+    if not symbol.analyzer.probe(PROBES)["math_pow"]:
         issues.append("formula may not use Math.pow()")
 
     if issues:
@@ -166,9 +140,9 @@ def _check_la_calculate(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
         item.notes = "calculateMonthlyPayment: " + "; ".join(issues)
 
 
-def _check_la_getters(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_la_getters(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "la_getters")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     method_names = {m.name.lower() for m in methods}
 
     getters_found = 0
@@ -191,13 +165,13 @@ def _check_la_getters(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
         item.notes = f"Only {getters_found} getter(s) found, expected 3"
 
 
-def _check_la_tostring(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_la_tostring(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "la_tostring")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
 
     has_tostring = any(m.name == "toString" or m.name == "tostring" for m in methods)
     if not has_tostring:
-        has_tostring = analyzer.source_contains(r'toString\s*\(', re.IGNORECASE)
+        has_tostring = symbol.analyzer.probe(PROBES)["tostring_any_case"]
 
     if not has_tostring:
         item.deduction = item.max_deduction
@@ -207,9 +181,9 @@ def _check_la_tostring(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
 
 # ---- CarLoan Class ----
 
-def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: str = 'loanaccount'):
-    analyzer = _find_analyzer(class_map, 'CarLoan', 'Carloan', 'carloan')
-    if not analyzer:
+def _check_car_loan(project: ProjectModel, items: List[RubricItem], base_class_name: str = 'loanaccount'):
+    symbol = project.find('CarLoan', 'Carloan', 'carloan')
+    if not symbol:
         for item_id in ('cl_extends', 'cl_props', 'cl_constructor', 'cl_tostring'):
             item = get_item(items, item_id)
             item.deduction = item.max_deduction
@@ -219,7 +193,7 @@ def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: s
 
     # Check extends
     item = get_item(items, "cl_extends")
-    parent = analyzer.get_parent_class()
+    parent = project.parent_name(symbol)
     if not parent or parent.lower() != base_class_name:
         item.deduction = item.max_deduction
         item.passed = False
@@ -227,11 +201,11 @@ def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: s
 
     # Check vehicleVIN property
     item = get_item(items, "cl_props")
-    fields = analyzer.get_fields()
+    fields = project.fields(symbol)
     has_vin = any(f.name.lower() in ('vehiclevin', 'vin', 'vehicle_vin', 'vinnumber')
                   for f in fields)
     if not has_vin:
-        has_vin = analyzer.source_contains(r'(?:vehicleVIN|vin|VIN)\b', re.IGNORECASE)
+        has_vin = symbol.analyzer.probe(PROBES)["vin"]
     if not has_vin:
         item.deduction = item.max_deduction
         item.passed = False
@@ -239,7 +213,7 @@ def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: s
 
     # Check constructor (4 params)
     item = get_item(items, "cl_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
     matching = [c for c in constructors if len(c.param_types) == 4]
     if not matching:
         item.deduction = item.max_deduction
@@ -249,10 +223,10 @@ def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: s
 
     # Check toString
     item = get_item(items, "cl_tostring")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     has_tostring = any(m.name.lower() == "tostring" for m in methods)
     if not has_tostring:
-        has_tostring = analyzer.source_contains(r'toString\s*\(')
+        has_tostring = symbol.analyzer.probe(PROBES)["tostring"]
     if not has_tostring:
         item.deduction = item.max_deduction
         item.passed = False
@@ -261,10 +235,10 @@ def _check_car_loan(class_map: dict, items: List[RubricItem], base_class_name: s
 
 # ---- PrimaryMortgage Class ----
 
-def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class_name: str = 'loanaccount'):
-    analyzer = _find_analyzer(class_map, 'PrimaryMortgage', 'Primarymortgage',
-                              'primarymortgage', 'Mortgage', 'MortgageLoan')
-    if not analyzer:
+def _check_primary_mortgage(project: ProjectModel, items: List[RubricItem], base_class_name: str = 'loanaccount'):
+    symbol = project.find('PrimaryMortgage', 'Primarymortgage',
+                          'primarymortgage', 'Mortgage', 'MortgageLoan')
+    if not symbol:
         for item_id in ('pm_extends', 'pm_props', 'pm_constructor', 'pm_tostring'):
             item = get_item(items, item_id)
             item.deduction = item.max_deduction
@@ -274,7 +248,7 @@ def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class
 
     # Check extends
     item = get_item(items, "pm_extends")
-    parent = analyzer.get_parent_class()
+    parent = project.parent_name(symbol)
     if not parent or parent.lower() != base_class_name:
         item.deduction = item.max_deduction
         item.passed = False
@@ -282,7 +256,7 @@ def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class
 
     # Check properties (PMIMonthlyAmount and Address)
     item = get_item(items, "pm_props")
-    fields = analyzer.get_fields()
+    fields = project.fields(symbol)
     field_names = {f.name.lower() for f in fields}
     field_types = {f.type_name.lower() for f in fields}
 
@@ -303,7 +277,7 @@ def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class
 
     # Check constructor (5 params)
     item = get_item(items, "pm_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
     matching = [c for c in constructors if len(c.param_types) == 5]
     if not matching:
         # Also accept 4 params if address is composed differently
@@ -316,10 +290,10 @@ def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class
 
     # Check toString
     item = get_item(items, "pm_tostring")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     has_tostring = any(m.name.lower() == "tostring" for m in methods)
     if not has_tostring:
-        has_tostring = analyzer.source_contains(r'toString\s*\(')
+        has_tostring = symbol.analyzer.probe(PROBES)["tostring"]
     if not has_tostring:
         item.deduction = item.max_deduction
         item.passed = False
@@ -328,10 +302,10 @@ def _check_primary_mortgage(class_map: dict, items: List[RubricItem], base_class
 
 # ---- UnsecuredLoan Class ----
 
-def _check_unsecured_loan(class_map: dict, items: List[RubricItem], base_class_name: str = 'loanaccount'):
-    analyzer = _find_analyzer(class_map, 'UnsecuredLoan', 'Unsecuredloan',
-                              'unsecuredloan', 'PersonalLoan')
-    if not analyzer:
+def _check_unsecured_loan(project: ProjectModel, items: List[RubricItem], base_class_name: str = 'loanaccount'):
+    symbol = project.find('UnsecuredLoan', 'Unsecuredloan',
+                          'unsecuredloan', 'PersonalLoan')
+    if not symbol:
         for item_id in ('ul_extends', 'ul_constructor', 'ul_tostring'):
             item = get_item(items, item_id)
             item.deduction = item.max_deduction
@@ -341,7 +315,7 @@ def _check_unsecured_loan(class_map: dict, items: List[RubricItem], base_class_n
 
     # Check extends
     item = get_item(items, "ul_extends")
-    parent = analyzer.get_parent_class()
+    parent = project.parent_name(symbol)
     if not parent or parent.lower() != base_class_name:
         item.deduction = item.max_deduction
         item.passed = False
@@ -349,7 +323,7 @@ def _check_unsecured_loan(class_map: dict, items: List[RubricItem], base_class_n
 
     # Check constructor (3 params)
     item = get_item(items, "ul_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
     matching = [c for c in constructors if len(c.param_types) == 3]
     if not matching:
         item.deduction = item.max_deduction
@@ -359,10 +333,10 @@ def _check_unsecured_loan(class_map: dict, items: List[RubricItem], base_class_n
 
     # Check toString
     item = get_item(items, "ul_tostring")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     has_tostring = any(m.name.lower() == "tostring" for m in methods)
     if not has_tostring:
-        has_tostring = analyzer.source_contains(r'toString\s*\(')
+        has_tostring = symbol.analyzer.probe(PROBES)["tostring"]
     if not has_tostring:
         item.deduction = item.max_deduction
         item.passed = False
@@ -371,9 +345,9 @@ def _check_unsecured_loan(class_map: dict, items: List[RubricItem], base_class_n
 
 # ---- Address Class ----
 
-def _check_address(class_map: dict, items: List[RubricItem]):
-    analyzer = _find_analyzer(class_map, 'Address', 'address')
-    if not analyzer:
+def _check_address(project: ProjectModel, items: List[RubricItem]):
+    symbol = project.find('Address', 'address')
+    if not symbol:
         for item_id in ('addr_props', 'addr_constructor', 'addr_getters', 'addr_tostring'):
             item = get_item(items, item_id)
             item.deduction = item.max_deduction
@@ -383,7 +357,7 @@ def _check_address(class_map: dict, items: List[RubricItem]):
 
     # Check properties
     item = get_item(items, "addr_props")
-    fields = analyzer.get_fields()
+    fields = project.fields(symbol)
     field_names = {f.name.lower() for f in fields}
 
     missing = []
@@ -403,7 +377,7 @@ def _check_address(class_map: dict, items: List[RubricItem]):
 
     # Check constructor (4 params)
     item = get_item(items, "addr_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
     matching = [c for c in constructors if len(c.param_types) == 4]
     if not matching:
         item.deduction = item.max_deduction
@@ -413,7 +387,7 @@ def _check_address(class_map: dict, items: List[RubricItem]):
 
     # Check getters (4 getters)
     item = get_item(items, "addr_getters")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     method_names = {m.name.lower() for m in methods}
 
     getters_found = 0
@@ -434,10 +408,10 @@ def _check_address(class_map: dict, items: List[RubricItem]):
 
     # Check toString
     item = get_item(items, "addr_tostring")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
     has_tostring = any(m.name.lower() == "tostring" for m in methods)
     if not has_tostring:
-        has_tostring = analyzer.source_contains(r'toString\s*\(')
+        has_tostring = symbol.analyzer.probe(PROBES)["tostring"]
     if not has_tostring:
         item.deduction = item.max_deduction
         item.passed = False
@@ -46,6 +46,14 @@ EXPECTED_PAYMENTS = {
     "unsecured": UNSECURED_LOAN["payment"],   # 128.62
 }
 
+# Report labels for class-wide analytics
+LABELED_VALUES = {
+    "Car loan payment": CAR_LOAN["payment"],
+    "Mortgage payment": PRIMARY_MORTGAGE["payment"],
+    "Mortgage PMI": PRIMARY_MORTGAGE["pmi"],
+    "Unsecured loan payment": UNSECURED_LOAN["payment"],
+}
+
 TOLERANCE = 0.02
 
 
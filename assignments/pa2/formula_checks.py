@@ -0,0 +1,147 @@
+"""PA2 formula check that evaluates calculateMonthlyPayment from its source, for programs that cannot run."""
+
+from typing import Dict, List, Optional
+
+from framework.formula_eval import MethodTranslator, find_class, numpy_available
+from framework.property_checks import amortized_payments
+from framework.rubric import RubricItem, get_item
+from framework.source_bundle import SourceBundle
+from assignments.pa2.ast_checks import find_base_loan_class
+from assignments.pa2.expected_values import TOLERANCE
+
+try:
+    import javalang
+except ImportError:
+    javalang = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Every combination is checked at once: 4 x 5 x 5 = 100 loans
+GRID_PRINCIPALS = (1000.0, 5000.0, 25000.0, 250000.0)
+GRID_RATES = (0.5, 3.1, 4.25, 10.75, 24.99)
+GRID_MONTHS = (6, 12, 48, 72, 360)
+
+ROLES = ("principal", "rate", "months")  # Constructor parameter order
+
+
+def _payment_method(class_node) -> Optional[str]:
+    methods = [m for m in class_node.methods if not m.parameters]
+    for method in methods:
+        if method.name.lower() == "calculatemonthlypayment":
+            return method.name
+    for method in methods:
+        if "monthly" in method.name.lower() and "payment" in method.name.lower():
+            return method.name
+    return None
+
+
+def _assigned_field(assignment) -> Optional[str]:
+    """The field `this.field = ...` or `field = ...` assigns, if any."""
+    target = assignment.expressionl
+    if isinstance(target, javalang.tree.This) and len(target.selectors or []) == 1:
+        target = target.selectors[0]
+    if not isinstance(target, javalang.tree.MemberReference) or target.qualifier:
+        return None
+    return target.member
+
+
+def _bare_parameter(assignment, params: List[str]) -> Optional[str]:
+    """The parameter a plain `=` assigns unchanged, if it does."""
+    value = assignment.value
+    if assignment.type != '=' or not isinstance(value, javalang.tree.MemberReference):
+        return None
+    if value.qualifier or value.selectors or getattr(value, 'prefix_operators', None):
+        return None
+    return value.member if value.member in params else None
+
+
+def _field_roles(class_node, fields: Dict[str, str]) -> Optional[Dict[str, str]]:
+    """
+    Role -> field name, from a 3-parameter constructor that stores each
+    parameter unchanged in a field. None when any field is assigned
+    anything else there (`rate = rate / 100`, say): the grid's values
+    would not be what the method sees, so nothing can be concluded.
+    """
+    for constructor in class_node.constructors:
+        if len(constructor.parameters) != len(ROLES):
+            continue
+        params = [p.name for p in constructor.parameters]
+        roles: Dict[str, str] = {}
+        for _, assignment in constructor.filter(javalang.tree.Assignment):
+            field = _assigned_field(assignment)
+            if field in params and not isinstance(assignment.expressionl, javalang.tree.This):
+                return None  # The parameter itself is changed before it is stored
+            if field not in fields:
+                continue
+            param = _bare_parameter(assignment, params)
+            if param is None or field in roles.values():
+                return None
+            roles[ROLES[params.index(param)]] = field
+        if len(roles) == len(ROLES):
+            return roles
+    return None
+
+
+def check_formula(items: List[RubricItem], bundle: SourceBundle):
+    """
+    Check (la_calculate) by evaluating the method's own arithmetic over a
+    grid of loans. Only used when the program could not be run; leaves
+    the item alone when the method uses Java the evaluator does not model
+    or the constructor does not store its parameters as they are. Never
+    deducts more than the structural checks already did.
+    """
+    if not numpy_available() or javalang is None:
+        return
+    symbol = find_base_loan_class(bundle.project)
+    if symbol is None:
+        return
+    class_node = find_class(symbol.analyzer.tree, symbol.name)
+    if class_node is None:
+        return
+    name = _payment_method(class_node)
+    if name is None:
+        return
+    try:
+        translator = MethodTranslator(class_node)
+        payment = translator.compile(name)
+        roles = _field_roles(class_node, translator.fields)
+        if roles is None:
+            return
+        principal, rate, months = (a.ravel() for a in np.meshgrid(GRID_PRINCIPALS, GRID_RATES, GRID_MONTHS))
+        computed = payment({roles["principal"]: principal, roles["rate"]: rate, roles["months"]: months})
+    except Exception:
+        # UnsupportedFormula, or source (usually not compiling) the
+        # translator did not anticipate: either way the item is left alone
+        return
+
+    expected = amortized_payments(principal, rate, months)
+    correct = np.abs(computed - expected) <= TOLERANCE  # NaN compares False
+    matched, total = int(correct.sum()), len(expected)
+    mismatch = ""
+    if matched < total:
+        i = int(np.argmin(correct))
+        mismatch = (f"for ({principal[i]:.2f}, {rate[i]:.2f}%, {int(months[i])}) it computes "
+                    f"{computed[i]:.2f}, expected {expected[i]:.2f}")
+
+    item = get_item(items, "la_calculate")
+    if matched == total:
+        item.deduction = 0
+        item.passed = True
+        item.notes = f"Formula verified from source on {total} loans (program could not be run)"
+        return
+    if 3 * matched >= 2 * total:
+        deduction, verdict = 3, "Formula partially correct"
+    elif matched:
+        deduction, verdict = 5, "Formula may be incorrect"
+    else:
+        deduction, verdict = item.max_deduction, "Formula incorrect"
+    notes = f"{verdict} (evaluated from source): {matched}/{total} loans match; {mismatch}"
+    if item.passed or deduction >= item.deduction:
+        # The evaluation may misread the source; only the structural result is scored
+        item.notes = f"{item.notes}; {notes}" if item.notes else notes
+        return
+    item.deduction = deduction
+    item.notes = notes
@@ -3,11 +3,14 @@
 from typing import List
 
 from framework.base_grader import BaseGrader
+from framework.property_checks import PaymentProperty
 from framework.rubric import RubricItem
 from assignments.pa2.rubric_items import create_pa2_rubric
 from assignments.pa2.ast_checks import check_class_structure as pa2_ast_checks
 from assignments.pa2.output_checks import check_output as pa2_output_checks
-from assignments.pa2.expected_values import get_expected_output_text
+from assignments.pa2.method_checks import CALLS, SCORED as METHOD_CHECKS_SCORED, check_methods
+from assignments.pa2.formula_checks import check_formula
+from assignments.pa2.expected_values import LABELED_VALUES, TOLERANCE, get_expected_output_text
 
 # Fields already covered by PA2 rubric items - skip in OOP checks
 PA2_RUBRIC_FIELDS = {'principal', 'annualinterestrate', 'months', 'vehiclevin',
@@ -17,14 +20,28 @@ PA2_RUBRIC_FIELDS = {'principal', 'annualinterestrate', 'months', 'vehiclevin',
 class PA2Grader(BaseGrader):
     """Grader for Programming Assignment 2: Loan Account Hierarchy."""
 
+    expected_values = LABELED_VALUES
+    value_tolerance = TOLERANCE
+    payment_property = PaymentProperty("LoanAccount", "calculateMonthlyPayment")
+    method_batch = CALLS.batch
+
     def define_rubric(self) -> List[RubricItem]:
         return create_pa2_rubric()
 
     def check_class_structure(self, items: List[RubricItem]):
-        pa2_ast_checks(self.java_files, self.all_sources, items)
+        pa2_ast_checks(self.bundle, items)
 
     def check_output(self, items: List[RubricItem], output: str):
         pa2_output_checks(items, output)
+        check_methods(items, self.method_results)
+
+    def handle_no_output(self, items: List[RubricItem], compiled: bool):
+        super().handle_no_output(items, compiled)
+        # main may crash while the classes themselves still work; unless
+        # scored direct calls settled it, the formula is evaluated from source
+        check_methods(items, self.method_results)
+        if self.method_results is None or not METHOD_CHECKS_SCORED:
+            check_formula(items, self.bundle)
 
     def get_expected_output(self) -> str:
         return get_expected_output_text()
@@ -0,0 +1,198 @@
+"""PA2 checks made by calling the student's methods directly, many parameter sets in one JVM launch."""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from framework.method_harness import CallResult, MethodBatch
+from framework.output_index import OutputIndex
+from framework.overrides import MAX, OutputContext, Outcome, Override, OverridePlan, PredicateSet
+from framework.rubric import RubricItem
+from assignments.pa2.rubric_items import PA2_RUBRIC
+from assignments.pa2.expected_values import (
+    CAR_LOAN, PRIMARY_MORTGAGE, TOLERANCE, UNSECURED_LOAN, compute_monthly_payment
+)
+
+# (principal, annual rate %, months): the loans in main plus shapes main never exercises
+PARAMETER_SETS = [
+    (CAR_LOAN["principal"], CAR_LOAN["rate"], CAR_LOAN["months"]),
+    (PRIMARY_MORTGAGE["principal"], PRIMARY_MORTGAGE["rate"], PRIMARY_MORTGAGE["months"]),
+    (UNSECURED_LOAN["principal"], UNSECURED_LOAN["rate"], UNSECURED_LOAN["months"]),
+    (1000.0, 12.0, 12),
+    (180000.0, 6.5, 180),
+    (12000.0, 0.5, 24),
+    (750.0, 24.99, 6),
+]
+ADDRESS = (PRIMARY_MORTGAGE["street"], PRIMARY_MORTGAGE["city"],
+           PRIMARY_MORTGAGE["state"], PRIMARY_MORTGAGE["zipcode"])
+GETTERS = (("getPrincipal", 0), ("getAnnualInterestRate", 1), ("getMonths", 2))
+
+
+@dataclass
+class PaymentCall:
+    """One calculateMonthlyPayment() call and the value the formula gives for its loan."""
+    call_id: str
+    label: str  # e.g. "CarLoan(25000.00, 4.25%, 72)"
+    expected: float
+
+
+@dataclass
+class GetterCall:
+    call_id: str
+    label: str  # e.g. "LoanAccount(1000.00, 12.00%, 12).getMonths()"
+    expected: float
+
+
+@dataclass
+class MethodCalls:
+    """The PA2 batch and which call ids answer which question."""
+    batch: MethodBatch
+    payments: List[PaymentCall]
+    getters: List[GetterCall]
+    car_tostring: List[str]
+    address_tostring: str
+
+
+def _build_calls() -> MethodCalls:
+    batch = MethodBatch()
+    payments: List[PaymentCall] = []
+    getters: List[GetterCall] = []
+    car_tostring: List[str] = []
+
+    address = batch.new("Address", *ADDRESS)
+    address_tostring = batch.call(address, "toString")
+    for principal, rate, months in PARAMETER_SETS:
+        loans = [
+            ("LoanAccount", batch.new("LoanAccount", principal, rate, months)),
+            ("CarLoan", batch.new("CarLoan", principal, rate, months, CAR_LOAN["vin"])),
+            ("PrimaryMortgage", batch.new("PrimaryMortgage", principal, rate, months,
+                                          PRIMARY_MORTGAGE["pmi"], address)),
+            ("UnsecuredLoan", batch.new("UnsecuredLoan", principal, rate, months)),
+        ]
+        expected = compute_monthly_payment(principal, rate, months)
+        for class_name, loan in loans:
+            label = f"{class_name}({principal:.2f}, {rate:.2f}%, {months})"
+            payments.append(PaymentCall(batch.call(loan, "calculateMonthlyPayment"), label, expected))
+            if class_name == "CarLoan":
+                car_tostring.append(batch.call(loan, "toString"))
+        base = loans[0][1]
+        for getter, position in GETTERS:
+            label = f"LoanAccount({principal:.2f}, {rate:.2f}%, {months}).{getter}()"
+            getters.append(GetterCall(batch.call(base, getter), label, (principal, rate, months)[position]))
+
+    return MethodCalls(batch, payments, getters, car_tostring, address_tostring)
+
+
+CALLS = _build_calls()
+
+
+def _answered(methods: Dict[str, CallResult], call_id: str) -> Optional[float]:
+    """The numeric value a call returned, or None if it could not be made or returned no number."""
+    result = methods.get(call_id)
+    return result.number if result is not None and result.ok else None
+
+
+def _payment_results(ctx: OutputContext) -> Optional[List[Tuple[PaymentCall, float]]]:
+    """(call, returned value) for every payment call that ran; None without direct results."""
+    if ctx.methods is None:
+        return None
+    returned = [(call, _answered(ctx.methods, call.call_id)) for call in CALLS.payments]
+    return [(call, value) for call, value in returned if value is not None]
+
+
+def _payments_correct(ctx: OutputContext) -> int:
+    return sum(1 for call, value in _payment_results(ctx) or []
+               if abs(value - call.expected) <= TOLERANCE)
+
+
+def _payment_mismatch(ctx: OutputContext) -> str:
+    for call, value in _payment_results(ctx) or []:
+        if abs(value - call.expected) > TOLERANCE:
+            return f"{call.label} returned {value:.2f}, expected {call.expected:.2f}"
+    return ""
+
+
+def _getters_called(ctx: OutputContext) -> int:
+    if ctx.methods is None:
+        return 0
+    return sum(1 for call in CALLS.getters if _answered(ctx.methods, call.call_id) is not None)
+
+
+def _getter_mismatch(ctx: OutputContext) -> str:
+    for call in CALLS.getters if ctx.methods is not None else []:
+        value = _answered(ctx.methods, call.call_id)
+        if value is not None and abs(value - call.expected) > TOLERANCE:
+            return f"{call.label} returned {value:g}, expected {call.expected:g}"
+    return ""
+
+
+def _car_tostring_shows_vin(ctx: OutputContext) -> bool:
+    if ctx.methods is None:
+        return False
+    texts = [ctx.methods.get(call_id) for call_id in CALLS.car_tostring]
+    texts = [r.text for r in texts if r is not None and r.ok]
+    return bool(texts) and all(CAR_LOAN["vin"] in t for t in texts)
+
+
+def _address_parts(ctx: OutputContext) -> int:
+    result = ctx.methods.get(CALLS.address_tostring) if ctx.methods is not None else None
+    if result is None or not result.ok:
+        return 0
+    return sum(PRIMARY_MORTGAGE[part] in result.text for part in ("street", "city", "state", "zipcode"))
+
+
+PREDICATES = PredicateSet(
+    payments_called=lambda ctx: len(_payment_results(ctx) or []),
+    payments_correct=_payments_correct,
+    payment_mismatch=_payment_mismatch,
+    getters_called=_getters_called,
+    getter_mismatch=_getter_mismatch,
+    car_tostring_vin=_car_tostring_shows_vin,
+    address_parts=_address_parts,
+)
+
+# Whether direct-call evidence changes scores. MethodHarness.java has not
+# yet been run against a real JDK on sample submissions; until it has, the
+# rules below only add notes. Once verified, direct calls are the strongest
+# evidence available, and these rules run after the output overrides and
+# may reverse them.
+SCORED = False
+
+METHOD_OVERRIDES = OverridePlan(PA2_RUBRIC, PREDICATES, [
+    # No case applies when no call could be made (e.g. classes named differently)
+    Override("la_calculate_direct", item="la_calculate", cases=[
+        (lambda p: 0 < p["payments_correct"] == p["payments_called"],
+         Outcome(0, True, "Formula verified: {payments_correct} direct calls to calculateMonthlyPayment correct")),
+        (lambda p: p["payments_correct"] and 3 * p["payments_correct"] >= 2 * p["payments_called"],
+         Outcome(3, False, "Formula partially correct: {payments_correct}/{payments_called} direct calls "
+                           "match; {payment_mismatch}")),
+        (lambda p: p["payments_correct"] > 0,
+         Outcome(5, False, "Formula may be incorrect: {payments_correct}/{payments_called} direct calls "
+                           "match; {payment_mismatch}")),
+        (lambda p: p["payments_called"] > 0, Outcome(MAX, False, "Formula incorrect: {payment_mismatch}")),
+    ]),
+    Override("la_getters_direct", item="la_getters", only_if_passed=False, cases=[
+        (lambda p: p["getters_called"] == len(CALLS.getters) and not p["getter_mismatch"],
+         Outcome(0, True, "Getters verified by direct calls")),
+    ]),
+    Override("la_getters_wrong", item="la_getters", only_if_passed=True, cases=[
+        (lambda p: p["getter_mismatch"], Outcome(3, False, "Getter returns the wrong value: {getter_mismatch}")),
+    ]),
+    Override("cl_tostring_direct", item="cl_tostring", only_if_passed=False, cases=[
+        (lambda p: p["car_tostring_vin"], Outcome(0, True, "toString verified by direct call (VIN present)")),
+    ]),
+    Override("addr_tostring_direct", item="addr_tostring", only_if_passed=False, cases=[
+        (lambda p: p["address_parts"] >= 3, Outcome(0, True, "toString verified by direct call")),
+    ]),
+])
+
+
+def check_methods(items: List[RubricItem], methods: Optional[Dict[str, CallResult]]):
+    """Apply the direct-call evidence (as notes unless SCORED); nothing changes when the calls could not be run."""
+    if methods is None:
+        return
+    ctx = OutputContext("", OutputIndex(""), methods=methods)
+    values = METHOD_OVERRIDES.evaluate(ctx)
+    if SCORED:
+        METHOD_OVERRIDES.apply(items, values)
+    else:
+        METHOD_OVERRIDES.annotate(items, values, "Direct calls (not scored)")
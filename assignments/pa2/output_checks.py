@@ -1,62 +1,115 @@
 """PA2-specific output verification checks."""
 
 import re
-from typing import List
-
-from framework.rubric import RubricItem
+from typing import List, Optional
+
+from framework.literal_matcher import LiteralHits, LiteralMatcher
+from framework.output_index import OutputIndex
+from framework.output_records import ParsedOutput, RecordParser
+from framework.overrides import MAX, OutputContext, Outcome, Override, OverridePlan, PredicateSet
+from framework.rubric import RubricItem, get_item
+from assignments.pa2.rubric_items import PA2_RUBRIC
 from assignments.pa2.expected_values import (
     CAR_LOAN, PRIMARY_MORTGAGE, UNSECURED_LOAN, TOLERANCE
 )
 
+LITERALS = LiteralMatcher(
+    literals=['$', '%', CAR_LOAN["vin"], "321", PRIMARY_MORTGAGE["street"], PRIMARY_MORTGAGE["city"],
+              PRIMARY_MORTGAGE["state"], PRIMARY_MORTGAGE["zipcode"]],
+    ignore_case=["car loan", "mortgage", "unsecured", "pmi", "321 main"],
+)
 
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
+RECORDS = RecordParser(
+    sections={"car": r'car\s+loan', "mortgage": r'mortgage', "unsecured": r'unsecured'},
+    fields={
+        "principal": r'principal',
+        "rate": r'\brate\b',
+        "months": r'\bterm\b|\bmonths\b',
+        "payment": r'payment',
+        "pmi": r'\bpmi\b|mortgage\s+insurance',
+        "vin": r'\bvin\b',
+    },
+)
+MONEY_FIELDS = ("principal", "payment", "pmi")
 
+# (record kind, expected payment, label) for each loan in main
+PAYMENTS = [
+    ("car", CAR_LOAN["payment"], "car loan payment"),
+    ("mortgage", PRIMARY_MORTGAGE["payment"], "mortgage payment"),
+    ("unsecured", UNSECURED_LOAN["payment"], "unsecured loan payment"),
+]
 
-def _value_in_output(expected: float, output: str) -> bool:
+
+def _value_in_output(expected: float, index: OutputIndex) -> bool:
     """Check if a value appears in output within tolerance."""
-    for match in re.finditer(r'\d+\.\d+', output):
-        if abs(float(match.group()) - expected) <= TOLERANCE:
-            return True
-    return False
+    return index.contains(expected, TOLERANCE)
+
+
+def _printed_value_issue(records: ParsedOutput, index: OutputIndex, kind: str, name: str,
+                         expected: float, label: str, notes: Optional[List[str]] = None) -> Optional[str]:
+    """
+    None if the field printed in the kind's records matches expected, else
+    an issue naming what was printed there. Falls back to the whole output
+    when no record of that kind printed the field. A mismatch whose
+    expected value is printed elsewhere is not an issue: a toString that
+    prints the loan type after its fields files each value under the
+    previous loan's section. It is added to notes instead.
+    """
+    printed = [r.number_text(name) for r in records.of_kind(kind)]
+    printed = [p for p in printed if p is not None]
+    if not printed:
+        return None if _value_in_output(expected, index) else f"{label} not found"
+    if any(abs(float(p) - expected) <= TOLERANCE for p in printed):
+        return None
+    mismatch = f"{label} printed as {', '.join(printed)}, expected {expected:.2f}"
+    if _value_in_output(expected, index):
+        if notes is not None:
+            notes.append(f"{mismatch} (expected value found elsewhere in the output)")
+        return None
+    return mismatch
+
+
+def _payments_found(records: ParsedOutput, index: OutputIndex) -> int:
+    return sum(1 for kind, expected, label in PAYMENTS
+               if _printed_value_issue(records, index, kind, "payment", expected, label) is None)
 
 
 def check_output(items: List[RubricItem], output: str):
     """Run all output verification checks for PA2."""
-    _check_main_code(items, output)
-    _check_formatting(items, output)
-    # Positive overrides: upgrade AST FAILs if output proves methods work
-    _override_tostring_from_output(items, output)
-    _override_calculate_from_output(items, output)
-    # Negative overrides: downgrade AST PASSes if output proves methods broken
-    _negative_override_calculate_from_output(items, output)
+    hits = LITERALS.scan(output)
+    index = OutputIndex(output)
+    records = RECORDS.parse(output)
+    _check_main_code(items, records, index, hits)
+    _check_formatting(items, records, index, hits)
+    OVERRIDES.apply(items, OVERRIDES.evaluate(OutputContext(output, index, hits, records)))
 
 
-def _check_main_code(items: List[RubricItem], output: str):
+def _check_main_code(items: List[RubricItem], records: ParsedOutput, index: OutputIndex,
+                     hits: LiteralHits):
     """Check (main_code): output shows all three loan types with correct data."""
     item = get_item(items, "main_code")
     issues = []
+    misplaced: List[str] = []
+
+    # Values are looked up in their own loan's section when sections were printed
+    def check_value(kind: str, name: str, expected: float, label: str):
+        issue = _printed_value_issue(records, index, kind, name, expected, label, misplaced)
+        if issue:
+            issues.append(issue)
 
     # Check car loan data
-    if not _value_in_output(CAR_LOAN["payment"], output):
-        issues.append("car loan payment not found")
-    if CAR_LOAN["vin"] not in output:
+    check_value("car", "payment", CAR_LOAN["payment"], "car loan payment")
+    if CAR_LOAN["vin"] not in hits:
         issues.append("VIN not found")
 
     # Check mortgage data
-    if not _value_in_output(PRIMARY_MORTGAGE["payment"], output):
-        issues.append("mortgage payment not found")
-    if not _value_in_output(PRIMARY_MORTGAGE["pmi"], output):
-        issues.append("PMI amount not found")
-    if PRIMARY_MORTGAGE["street"] not in output and "321" not in output:
+    check_value("mortgage", "payment", PRIMARY_MORTGAGE["payment"], "mortgage payment")
+    check_value("mortgage", "pmi", PRIMARY_MORTGAGE["pmi"], "PMI amount")
+    if PRIMARY_MORTGAGE["street"] not in hits and "321" not in hits:
         issues.append("property address not found")
 
     # Check unsecured loan data
-    if not _value_in_output(UNSECURED_LOAN["payment"], output):
-        issues.append("unsecured loan payment not found")
+    check_value("unsecured", "payment", UNSECURED_LOAN["payment"], "unsecured loan payment")
 
     # Count how many payment values are wrong (these are the critical computed values)
     payment_issues = sum(1 for i in issues if 'payment' in i)
@@ -69,25 +122,31 @@ def _check_main_code(items: List[RubricItem], output: str):
         item.deduction = 5
         item.passed = False
         item.notes = "Main method output partially correct: " + "; ".join(issues)
+    if misplaced:
+        item.notes = "; ".join(([item.notes] if item.notes else []) + misplaced)
 
 
-def _check_formatting(items: List[RubricItem], output: str):
+def _check_formatting(items: List[RubricItem], records: ParsedOutput, index: OutputIndex,
+                      hits: LiteralHits):
     """Check (main_format): $ signs, % signs, 2 decimal places."""
     item = get_item(items, "main_format")
     issues = []
 
     # Check for $ in output
-    if '$' not in output:
+    if '$' not in hits:
         issues.append("no $ symbols found")
 
     # Check for % in output
-    if '%' not in output:
+    if '%' not in hits:
         issues.append("no % symbols found")
 
-    # Check decimal places on payment-range values
-    all_numbers = re.findall(r'\d+\.\d+', output)
-    payment_numbers = [n for n in all_numbers if 30 <= float(n) <= 300000]
-    bad_format = [n for n in payment_numbers if len(n.split('.')[1]) != 2]
+    # Check decimal places on the dollar fields of each loan; without labeled
+    # fields, on every payment-range value
+    amounts = [r.number_text(name) for r in records.records for name in MONEY_FIELDS]
+    amounts = [a for a in amounts if a is not None and '.' in a]
+    if not amounts:
+        amounts = [n.text for n in index.between(30, 300000)]
+    bad_format = [a for a in amounts if len(a.split('.')[1]) != 2]
     if bad_format:
         issues.append(f"values not 2 decimal places: {', '.join(bad_format[:3])}")
 
@@ -97,112 +156,70 @@ def _check_formatting(items: List[RubricItem], output: str):
         item.notes = "; ".join(issues)
 
 
-def _override_tostring_from_output(items: List[RubricItem], output: str):
-    """Override toString AST checks if output proves they work."""
-    output_lower = output.lower()
-
-    # LoanAccount toString - check for principal/rate/months display
-    la_item = get_item(items, "la_tostring")
-    if not la_item.passed:
-        has_principal = bool(re.search(r'principal.*\$?\d+', output, re.IGNORECASE))
-        has_rate = bool(re.search(r'(?:interest|rate).*\d+\.\d+\s*%', output, re.IGNORECASE))
-        has_months = bool(re.search(r'(?:month|term).*\d+', output, re.IGNORECASE))
-        if has_principal and has_rate and has_months:
-            la_item.deduction = 0
-            la_item.passed = True
-            la_item.notes = "toString verified via output"
-
-    # CarLoan toString - check for VIN display
-    cl_item = get_item(items, "cl_tostring")
-    if not cl_item.passed:
-        if "car loan" in output_lower and CAR_LOAN["vin"] in output:
-            cl_item.deduction = 0
-            cl_item.passed = True
-            cl_item.notes = "toString verified via output (VIN present)"
-
-    # PrimaryMortgage toString - check for PMI and address
-    pm_item = get_item(items, "pm_tostring")
-    if not pm_item.passed:
-        has_pmi = bool(re.search(r'pmi|mortgage\s+insurance', output_lower))
-        has_addr = PRIMARY_MORTGAGE["street"] in output or "321 main" in output_lower
-        if "mortgage" in output_lower:
-            if has_pmi and has_addr:
-                pm_item.deduction = 0
-                pm_item.passed = True
-                pm_item.notes = "toString verified via output"
-            elif has_pmi or has_addr:
-                pm_item.deduction = 5
-                pm_item.passed = False
-                pm_item.notes = "toString partially correct: missing " + \
-                                ("address" if not has_addr else "PMI info")
-
-    # UnsecuredLoan toString
-    ul_item = get_item(items, "ul_tostring")
-    if not ul_item.passed:
-        if "unsecured" in output_lower and _value_in_output(UNSECURED_LOAN["payment"], output):
-            ul_item.deduction = 0
-            ul_item.passed = True
-            ul_item.notes = "toString verified via output"
-
-    # Address toString
-    addr_item = get_item(items, "addr_tostring")
-    if not addr_item.passed:
-        has_street = PRIMARY_MORTGAGE["street"] in output
-        has_city = PRIMARY_MORTGAGE["city"] in output
-        has_state = PRIMARY_MORTGAGE["state"] in output
-        has_zip = PRIMARY_MORTGAGE["zipcode"] in output
-        found = sum([has_street, has_city, has_state, has_zip])
-        if found >= 3:
-            addr_item.deduction = 0
-            addr_item.passed = True
-            addr_item.notes = "toString verified via output"
-        elif found >= 1:
-            addr_item.deduction = 5
-            addr_item.passed = False
-            addr_item.notes = f"Address toString partial: {found}/4 parts found"
-
-
-def _override_calculate_from_output(items: List[RubricItem], output: str):
-    """Override calculateMonthlyPayment check if output has correct values."""
-    item = get_item(items, "la_calculate")
-
-    payments_found = 0
-    if _value_in_output(CAR_LOAN["payment"], output):
-        payments_found += 1
-    if _value_in_output(PRIMARY_MORTGAGE["payment"], output):
-        payments_found += 1
-    if _value_in_output(UNSECURED_LOAN["payment"], output):
-        payments_found += 1
-
-    if payments_found == 3:
-        item.deduction = 0
-        item.passed = True
-        item.notes = "Formula verified: all payment values correct"
-    elif payments_found >= 2 and not item.passed:
-        item.deduction = 3
-        item.passed = False
-        item.notes = f"Formula partially correct: {payments_found}/3 payments match"
+# --- Output evidence that overrides AST results ---
 
+def _la_fields_shown(ctx: OutputContext) -> bool:
+    """LoanAccount toString: principal, rate and months are displayed."""
+    has_principal = bool(re.search(r'principal.*\$?\d+', ctx.output, re.IGNORECASE))
+    has_rate = bool(re.search(r'(?:interest|rate).*\d+\.\d+\s*%', ctx.output, re.IGNORECASE))
+    has_months = bool(re.search(r'(?:month|term).*\d+', ctx.output, re.IGNORECASE))
+    return has_principal and has_rate and has_months
 
-def _negative_override_calculate_from_output(items: List[RubricItem], output: str):
-    """If AST passed la_calculate but output shows payments are wrong, fail it."""
-    item = get_item(items, "la_calculate")
-    if not item.passed:
-        return  # Already failed, nothing to override
 
-    payments_found = 0
-    if _value_in_output(CAR_LOAN["payment"], output):
-        payments_found += 1
-    if _value_in_output(PRIMARY_MORTGAGE["payment"], output):
-        payments_found += 1
-    if _value_in_output(UNSECURED_LOAN["payment"], output):
-        payments_found += 1
+def _address_parts(ctx: OutputContext) -> int:
+    return sum(PRIMARY_MORTGAGE[part] in ctx.hits for part in ("street", "city", "state", "zipcode"))
 
-    if payments_found == 0:
-        item.deduction = item.max_deduction
-        item.passed = False
-        item.notes = "Formula incorrect: no expected payment values found in output"
-    elif payments_found == 1:
-        item.deduction = 5
-        item.passed = False
-        item.notes = f"Formula may be incorrect: only {payments_found}/3 payments match"
+
+PREDICATES = PredicateSet(
+    la_fields_shown=_la_fields_shown,
+    car_loan_shown=lambda ctx: "car loan" in ctx.hits and CAR_LOAN["vin"] in ctx.hits,
+    mortgage_shown=lambda ctx: "mortgage" in ctx.hits,
+    pmi_shown=lambda ctx: "pmi" in ctx.hits or bool(re.search(r'mortgage\s+insurance', ctx.output, re.IGNORECASE)),
+    address_shown=lambda ctx: PRIMARY_MORTGAGE["street"] in ctx.hits or "321 main" in ctx.hits,
+    unsecured_shown=lambda ctx: "unsecured" in ctx.hits and _printed_value_issue(
+        ctx.records, ctx.index, "unsecured", "payment", UNSECURED_LOAN["payment"], "") is None,
+    address_parts=_address_parts,
+    payments_found=lambda ctx: _payments_found(ctx.records, ctx.index),
+)
+
+OVERRIDES = OverridePlan(PA2_RUBRIC, PREDICATES, [
+    # Positive overrides: upgrade AST FAILs if output proves methods work
+    Override("la_tostring", item="la_tostring", only_if_passed=False, cases=[
+        (lambda p: p["la_fields_shown"], Outcome(0, True, "toString verified via output")),
+    ]),
+    Override("cl_tostring", item="cl_tostring", only_if_passed=False, cases=[
+        (lambda p: p["car_loan_shown"], Outcome(0, True, "toString verified via output (VIN present)")),
+    ]),
+    Override("pm_tostring", item="pm_tostring", only_if_passed=False, cases=[
+        (lambda p: p["mortgage_shown"] and p["pmi_shown"] and p["address_shown"],
+         Outcome(0, True, "toString verified via output")),
+        (lambda p: p["mortgage_shown"] and p["pmi_shown"],
+         Outcome(5, False, "toString partially correct: missing address")),
+        (lambda p: p["mortgage_shown"] and p["address_shown"],
+         Outcome(5, False, "toString partially correct: missing PMI info")),
+    ]),
+    Override("ul_tostring", item="ul_tostring", only_if_passed=False, cases=[
+        (lambda p: p["unsecured_shown"], Outcome(0, True, "toString verified via output")),
+    ]),
+    Override("addr_tostring", item="addr_tostring", only_if_passed=False, cases=[
+        (lambda p: p["address_parts"] >= 3, Outcome(0, True, "toString verified via output")),
+        (lambda p: p["address_parts"] >= 1,
+         Outcome(5, False, "Address toString partial: {address_parts}/4 parts found")),
+    ]),
+    Override("la_calculate_verified", item="la_calculate", cases=[
+        (lambda p: p["payments_found"] == 3, Outcome(0, True, "Formula verified: all payment values correct")),
+    ]),
+    Override("la_calculate_partial", item="la_calculate", only_if_passed=False,
+             after=("la_calculate_verified",), cases=[
+        (lambda p: p["payments_found"] >= 2,
+         Outcome(3, False, "Formula partially correct: {payments_found}/3 payments match")),
+    ]),
+    # Negative overrides: downgrade AST PASSes if output proves methods broken
+    Override("la_calculate_negative", item="la_calculate", only_if_passed=True,
+             after=("la_calculate_partial",), cases=[
+        (lambda p: p["payments_found"] == 0,
+         Outcome(MAX, False, "Formula incorrect: no expected payment values found in output")),
+        (lambda p: p["payments_found"] == 1,
+         Outcome(5, False, "Formula may be incorrect: only {payments_found}/3 payments match")),
+    ]),
+])
@@ -1,59 +1,36 @@
 """PA3-specific AST/static analysis checks for the Customer Loan Accounts."""
 
 import re
-from typing import List, Dict, Optional
-from framework.rubric import RubricItem
-from framework.java_ast_analyzer import JavaASTAnalyzer
-from pathlib import Path
-
-
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
-
-
-def _build_class_map(java_files: List[Path], all_sources: dict) -> Dict[str, JavaASTAnalyzer]:
-    """Map lowercase class names to their analyzers."""
-    class_map = {}
-    for f in java_files:
-        source = all_sources.get(f, f.read_text(errors='ignore'))
-        analyzer = JavaASTAnalyzer(source)
-        for name in analyzer.get_class_names():
-            class_map[name.lower()] = analyzer
-    return class_map
-
-
-def _find_analyzer(class_map: dict, *names) -> Optional[JavaASTAnalyzer]:
-    """Find analyzer for a class by trying exact names, then substring match."""
-    # Exact match first
-    for name in names:
-        if name.lower() in class_map:
-            return class_map[name.lower()]
-    # Substring match: find any class whose name contains one of the search terms
-    for name in names:
-        key = name.lower()
-        for class_name, analyzer in class_map.items():
-            if key in class_name:
-                return analyzer
-    return None
-
-
-def _find_customer_class(class_map: dict) -> Optional[JavaASTAnalyzer]:
+from typing import List, Optional
+from framework.rubric import RubricItem, get_item
+from framework.project_model import ClassSymbol, ProjectModel
+from framework.source_bundle import SourceBundle
+from framework.source_probes import ProbeSet
+
+PROBES = ProbeSet(
+    first_name=r'(?:String|string)\s+(?:firstName|first_name|fname)',
+    last_name=r'(?:String|string)\s+(?:lastName|last_name|lname)',
+    ssn=r'(?:String|string)\s+(?:SSN|ssn|socialSecurityNumber)',
+    loan_list=r'ArrayList\s*<\s*LoanAccount\s*>',
+    add_loan=(r'void\s+add\w*(?:Loan|Account)\s*\(', re.IGNORECASE),
+    print_report=(r'void\s+print\w*(?:Monthly|Report)\s*\(', re.IGNORECASE),
+)
+
+
+def _find_customer_class(project: ProjectModel) -> Optional[ClassSymbol]:
     """Find the Customer class by name variants or characteristic properties."""
     # Try exact/substring name match
-    result = _find_analyzer(class_map, 'Customer')
-    if result:
-        return result
+    symbol = project.find('Customer')
+    if symbol:
+        return symbol
 
     # Fallback: find by characteristic properties (firstName + lastName + SSN + ArrayList)
     skip = {'address', 'carloan', 'primarymortgage', 'unsecuredloan',
             'loanaccount', 'loanaccounthierarchy', 'main', 'test'}
-    for name, analyzer in class_map.items():
-        if name in skip:
+    for symbol in project:
+        if symbol.key in skip:
             continue
-        fields = analyzer.get_fields()
+        fields = project.fields(symbol)
         field_names = {f.name.lower() for f in fields}
         field_types = {f.type_name.lower() for f in fields}
         has_first = any(n in field_names for n in ('firstname', 'first_name', 'fname', 'first'))
@@ -61,22 +38,22 @@ def _find_customer_class(class_map: dict) -> Optional[JavaASTAnalyzer]:
         has_ssn = any(n in field_names for n in ('ssn', 'socialsecuritynumber', 'social'))
         has_list = any('arraylist' in t or 'list' in t for t in field_types)
         if has_first and has_last and has_ssn and has_list:
-            return analyzer
+            return symbol
 
     return None
 
 
-def check_class_structure(java_files: List[Path], all_sources: dict, items: List[RubricItem]):
+def check_class_structure(bundle: SourceBundle, items: List[RubricItem]):
     """Run all PA3 class structure checks."""
-    class_map = _build_class_map(java_files, all_sources)
-    _check_customer(class_map, all_sources, items)
+    _check_customer(bundle, items)
 
 
 # ---- Customer Class ----
 
-def _check_customer(class_map: dict, all_sources: dict, items: List[RubricItem]):
-    analyzer = _find_customer_class(class_map)
-    if not analyzer:
+def _check_customer(bundle: SourceBundle, items: List[RubricItem]):
+    project = bundle.project
+    symbol = _find_customer_class(project)
+    if not symbol:
         for item_id in ('cust_props', 'cust_constructor', 'cust_getter_firstname',
                         'cust_getter_lastname', 'cust_getter_ssn',
                         'cust_addloan', 'cust_printreport'):
@@ -86,39 +63,39 @@ def _check_customer(class_map: dict, all_sources: dict, items: List[RubricItem])
             item.notes = "Customer class not found"
         return
 
-    _check_customer_properties(analyzer, all_sources, items)
-    _check_customer_constructor(analyzer, items)
-    _check_customer_getters(analyzer, items)
-    _check_customer_addloan(analyzer, all_sources, items)
-    _check_customer_printreport(analyzer, all_sources, items)
+    _check_customer_properties(project, symbol, bundle, items)
+    _check_customer_constructor(project, symbol, items)
+    _check_customer_getters(project, symbol, items)
+    _check_customer_addloan(project, symbol, bundle, items)
+    _check_customer_printreport(project, symbol, bundle, items)
 
 
-def _check_customer_properties(analyzer: JavaASTAnalyzer, all_sources: dict, items: List[RubricItem]):
+def _check_customer_properties(project: ProjectModel, symbol: ClassSymbol, bundle: SourceBundle, items: List[RubricItem]):
     item = get_item(items, "cust_props")
-    fields = analyzer.get_fields()
+    fields = project.fields(symbol)
     field_names = {f.name.lower() for f in fields}
     field_types = {f.type_name.lower() for f in fields}
 
     # Also search all source for the Customer class content via regex
-    combined = "\n".join(all_sources.values())
+    hits = bundle.probe(PROBES)
 
     missing = []
     if not any(n in field_names for n in ('firstname', 'first_name', 'fname', 'first')):
         # Regex fallback
-        if not re.search(r'(?:String|string)\s+(?:firstName|first_name|fname)', combined):
+        if not hits["first_name"]:
             missing.append("firstName")
     if not any(n in field_names for n in ('lastname', 'last_name', 'lname', 'last')):
-        if not re.search(r'(?:String|string)\s+(?:lastName|last_name|lname)', combined):
+        if not hits["last_name"]:
             missing.append("lastName")
     if not any(n in field_names for n in ('ssn', 'socialsecuritynumber', 'social', 'socialsecurity')):
-        if not re.search(r'(?:String|string)\s+(?:SSN|ssn|socialSecurityNumber)', combined):
+        if not hits["ssn"]:
             missing.append("SSN")
     if not any(n in field_names for n in ('loanaccounts', 'loans', 'loanlist', 'accounts',
                                            'loan_accounts', 'loanaccount')):
         # Check for ArrayList field type
         has_arraylist = any('arraylist' in t or 'list' in t for t in field_types)
         if not has_arraylist:
-            if not re.search(r'ArrayList\s*<\s*LoanAccount\s*>', combined):
+            if not hits["loan_list"]:
                 missing.append("loanAccounts (ArrayList<LoanAccount>)")
 
     if missing:
@@ -127,9 +104,9 @@ def _check_customer_properties(analyzer: JavaASTAnalyzer, all_sources: dict, ite
         item.notes = f"Missing properties: {', '.join(missing)}"
 
 
-def _check_customer_constructor(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
+def _check_customer_constructor(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
     item = get_item(items, "cust_constructor")
-    constructors = analyzer.get_constructors()
+    constructors = project.constructors(symbol)
 
     matching = [c for c in constructors if len(c.param_types) == 3]
     if not matching:
@@ -143,8 +120,8 @@ def _check_customer_constructor(analyzer: JavaASTAnalyzer, items: List[RubricIte
             item.notes = "No constructor found"
 
 
-def _check_customer_getters(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
-    methods = analyzer.get_methods()
+def _check_customer_getters(project: ProjectModel, symbol: ClassSymbol, items: List[RubricItem]):
+    methods = project.methods(symbol)
     method_names = {m.name.lower() for m in methods}
 
     # Check getter for firstName
@@ -182,9 +159,9 @@ def _check_customer_getters(analyzer: JavaASTAnalyzer, items: List[RubricItem]):
         item.notes = "getSSN() not found"
 
 
-def _check_customer_addloan(analyzer: JavaASTAnalyzer, all_sources: dict, items: List[RubricItem]):
+def _check_customer_addloan(project: ProjectModel, symbol: ClassSymbol, bundle: SourceBundle, items: List[RubricItem]):
     item = get_item(items, "cust_addloan")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
 
     # Look for addLoanAccount or similar method
     matching = [m for m in methods if m.name.lower() in ('addloanaccount', 'addloan', 'addaccount')]
@@ -195,8 +172,7 @@ def _check_customer_addloan(analyzer: JavaASTAnalyzer, all_sources: dict, items:
                     ('loan' in m.name.lower() or 'account' in m.name.lower())]
     if not matching:
         # Regex fallback in source
-        combined = "\n".join(all_sources.values())
-        if re.search(r'void\s+add\w*(?:Loan|Account)\s*\(', combined, re.IGNORECASE):
+        if bundle.probe(PROBES)["add_loan"]:
             return  # Found via regex, pass
         item.deduction = item.max_deduction
         item.passed = False
@@ -210,9 +186,9 @@ def _check_customer_addloan(analyzer: JavaASTAnalyzer, all_sources: dict, items:
         item.notes = f"addLoanAccount should take 1 parameter, found {len(method.param_types)}"
 
 
-def _check_customer_printreport(analyzer: JavaASTAnalyzer, all_sources: dict, items: List[RubricItem]):
+def _check_customer_printreport(project: ProjectModel, symbol: ClassSymbol, bundle: SourceBundle, items: List[RubricItem]):
     item = get_item(items, "cust_printreport")
-    methods = analyzer.get_methods()
+    methods = project.methods(symbol)
 
     # Look for printMonthlyReport or similar
     matching = [m for m in methods if m.name.lower() in ('printmonthlyreport', 'printreport',
@@ -225,8 +201,7 @@ def _check_customer_printreport(analyzer: JavaASTAnalyzer, all_sources: dict, it
                     if 'print' in m.name.lower() and 'monthly' in m.name.lower()]
     if not matching:
         # Regex fallback
-        combined = "\n".join(all_sources.values())
-        if re.search(r'void\s+print\w*(?:Monthly|Report)\s*\(', combined, re.IGNORECASE):
+        if bundle.probe(PROBES)["print_report"]:
             return  # Found via regex, pass
         item.deduction = item.max_deduction
         item.passed = False
@@ -84,6 +84,15 @@ ALL_PAYMENTS = [
     UNSECURED_LOAN["payment"],   # 128.62
 ]
 
+# Report labels for class-wide analytics
+LABELED_VALUES = {
+    "Car loan 1 payment": CAR_LOAN_1["payment"],
+    "Car loan 2 payment": CAR_LOAN_2["payment"],
+    "Mortgage 1 payment": PRIMARY_MORTGAGE_1["payment"],
+    "Mortgage 2 payment": PRIMARY_MORTGAGE_2["payment"],
+    "Unsecured loan payment": UNSECURED_LOAN["payment"],
+}
+
 TOLERANCE = 0.02
 
 
@@ -3,11 +3,12 @@
 from typing import List
 
 from framework.base_grader import BaseGrader
+from framework.property_checks import PaymentProperty
 from framework.rubric import RubricItem
 from assignments.pa3.rubric_items import create_pa3_rubric
 from assignments.pa3.ast_checks import check_class_structure as pa3_ast_checks
 from assignments.pa3.output_checks import check_output as pa3_output_checks
-from assignments.pa3.expected_values import get_expected_output_text
+from assignments.pa3.expected_values import LABELED_VALUES, TOLERANCE, get_expected_output_text
 
 # Fields already covered by PA3 rubric items - skip in OOP checks
 PA3_RUBRIC_FIELDS = {'firstname', 'lastname', 'ssn', 'loanaccounts', 'loans',
@@ -18,11 +19,15 @@ PA3_RUBRIC_FIELDS = {'firstname', 'lastname', 'ssn', 'loanaccounts', 'loans',
 class PA3Grader(BaseGrader):
     """Grader for Programming Assignment 3: Customer Loan Accounts."""
 
+    expected_values = LABELED_VALUES
+    value_tolerance = TOLERANCE
+    payment_property = PaymentProperty("LoanAccount", "calculateMonthlyPayment")
+
     def define_rubric(self) -> List[RubricItem]:
         return create_pa3_rubric()
 
     def check_class_structure(self, items: List[RubricItem]):
-        pa3_ast_checks(self.java_files, self.all_sources, items)
+        pa3_ast_checks(self.bundle, items)
 
     def check_output(self, items: List[RubricItem], output: str):
         pa3_output_checks(items, output)
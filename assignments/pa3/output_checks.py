@@ -1,75 +1,124 @@
 """PA3-specific output verification checks."""
 
 import re
-from typing import List
-
-from framework.rubric import RubricItem
+from typing import List, Optional
+
+from framework.literal_matcher import LiteralHits, LiteralMatcher
+from framework.output_index import OutputIndex
+from framework.output_records import ParsedOutput, RecordParser
+from framework.overrides import OutputContext, Outcome, Override, OverridePlan, PredicateSet
+from framework.rubric import RubricItem, get_item
+from assignments.pa3.rubric_items import PA3_RUBRIC
 from assignments.pa3.expected_values import (
     CAR_LOAN_1, CAR_LOAN_2, PRIMARY_MORTGAGE_1, PRIMARY_MORTGAGE_2,
     UNSECURED_LOAN, CUSTOMER_A, CUSTOMER_B, ALL_PAYMENTS, TOLERANCE
 )
 
+LITERALS = LiteralMatcher(
+    literals=['$', '%',
+              CUSTOMER_A["first"], CUSTOMER_A["last"], CUSTOMER_A["ssn"],
+              CUSTOMER_B["first"], CUSTOMER_B["last"], CUSTOMER_B["ssn"],
+              CAR_LOAN_1["vin"], CAR_LOAN_2["vin"],
+              PRIMARY_MORTGAGE_1["street"], PRIMARY_MORTGAGE_2["street"]],
+    ignore_case=["car loan", "mortgage", "unsecured"],
+)
 
-def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
-    for item in items:
-        if item.id == item_id:
-            return item
-    raise ValueError(f"Rubric item '{item_id}' not found")
+RECORDS = RecordParser(
+    sections={"customer": r'report\s+for\s+customer', "car": r'car\s+loan',
+              "mortgage": r'mortgage', "unsecured": r'unsecured'},
+    fields={
+        "principal": r'principal',
+        "rate": r'\brate\b',
+        "months": r'\bterm\b|\bmonths\b',
+        "payment": r'payment',
+        "pmi": r'\bpmi\b|mortgage\s+insurance',
+        "vin": r'\bvin\b',
+    },
+    containers=["customer"],
+)
 
 
-def _value_in_output(expected: float, output: str) -> bool:
+def _value_in_output(expected: float, index: OutputIndex) -> bool:
     """Check if a value appears in output within tolerance."""
-    for match in re.finditer(r'\d+\.\d+', output):
-        if abs(float(match.group()) - expected) <= TOLERANCE:
-            return True
-    return False
+    return index.contains(expected, TOLERANCE)
+
+
+def _printed_value_issue(records: ParsedOutput, index: OutputIndex, kind: str, name: str,
+                         expected: float, label: str, owner: Optional[str] = None,
+                         notes: Optional[List[str]] = None) -> Optional[str]:
+    """
+    None if the field printed in the kind's records (under the owner's
+    report, when it printed any) matches expected, else an issue naming
+    what was printed there. Falls back to the whole output when no record
+    of that kind printed the field. A mismatch whose expected value is
+    printed elsewhere (loan type printed after the fields, so values land
+    in the previous section) goes to notes instead of being an issue.
+    """
+    printed = []
+    for scope in (owner, None):
+        printed = [r.number_text(name) for r in records.of_kind(kind, scope)]
+        printed = [p for p in printed if p is not None]
+        if printed:
+            break
+    if not printed:
+        return None if _value_in_output(expected, index) else f"{label} not found"
+    if any(abs(float(p) - expected) <= TOLERANCE for p in printed):
+        return None
+    mismatch = f"{label} printed as {', '.join(printed)}, expected {expected:.2f}"
+    if _value_in_output(expected, index):
+        if notes is not None:
+            notes.append(f"{mismatch} (expected value found elsewhere in the output)")
+        return None
+    return mismatch
 
 
 def check_output(items: List[RubricItem], output: str):
     """Run all output verification checks for PA3."""
-    _check_main_code(items, output)
-    _check_formatting(items, output)
-    _check_decimal_places(items, output)
-    _check_numbers(items, output)
-    _override_customer_from_output(items, output)
+    hits = LITERALS.scan(output)
+    index = OutputIndex(output)
+    records = RECORDS.parse(output)
+    _check_main_code(items, hits)
+    _check_formatting(items, hits)
+    _check_decimal_places(items, index)
+    _check_numbers(items, records, index)
+    OVERRIDES.apply(items, OVERRIDES.evaluate(OutputContext(output, index, hits, records)))
 
 
-def _check_main_code(items: List[RubricItem], output: str):
+def _check_main_code(items: List[RubricItem], hits: LiteralHits):
     """Check (main_code): output shows customer reports with all loan data."""
     item = get_item(items, "main_code")
     issues = []
 
     # Check for customer headers
-    if CUSTOMER_A["first"] not in output or CUSTOMER_A["last"] not in output:
+    if CUSTOMER_A["first"] not in hits or CUSTOMER_A["last"] not in hits:
         issues.append("Customer A (Tony Stark) not found")
-    if CUSTOMER_B["first"] not in output or CUSTOMER_B["last"] not in output:
+    if CUSTOMER_B["first"] not in hits or CUSTOMER_B["last"] not in hits:
         issues.append("Customer B (Gal Gadot) not found")
 
     # Check SSNs
-    if CUSTOMER_A["ssn"] not in output:
+    if CUSTOMER_A["ssn"] not in hits:
         issues.append("SSN 111-22-3333 not found")
-    if CUSTOMER_B["ssn"] not in output:
+    if CUSTOMER_B["ssn"] not in hits:
         issues.append("SSN 444-55-6666 not found")
 
     # Check for loan type headers
-    output_lower = output.lower()
-    if "car loan" not in output_lower:
+    if "car loan" not in hits:
         issues.append("Car Loan section not found")
-    if "mortgage" not in output_lower:
+    if "mortgage" not in hits:
         issues.append("Mortgage section not found")
-    if "unsecured" not in output_lower:
+    if "unsecured" not in hits:
         issues.append("Unsecured Loan section not found")
 
     # Check VINs
-    if CAR_LOAN_1["vin"] not in output:
+    if CAR_LOAN_1["vin"] not in hits:
         issues.append(f"VIN {CAR_LOAN_1['vin']} not found")
-    if CAR_LOAN_2["vin"] not in output:
+    if CAR_LOAN_2["vin"] not in hits:
         issues.append(f"VIN {CAR_LOAN_2['vin']} not found")
 
     # Check addresses
-    if PRIMARY_MORTGAGE_1["street"] not in output:
+    if PRIMARY_MORTGAGE_1["street"] not in hits:
         issues.append("Address '321 Main Street' not found")
-    if PRIMARY_MORTGAGE_2["street"] not in output:
+    if PRIMARY_MORTGAGE_2["street"] not in hits:
         issues.append("Address '783 Maple Lane' not found")
 
     if len(issues) >= 5:
@@ -82,14 +131,14 @@ def _check_main_code(items: List[RubricItem], output: str):
         item.notes = "Main method output partially correct: " + "; ".join(issues)
 
 
-def _check_formatting(items: List[RubricItem], output: str):
+def _check_formatting(items: List[RubricItem], hits: LiteralHits):
     """Check (main_format): $ signs, % signs."""
     item = get_item(items, "main_format")
     issues = []
 
-    if '$' not in output:
+    if '$' not in hits:
         issues.append("no $ symbols found")
-    if '%' not in output:
+    if '%' not in hits:
         issues.append("no % symbols found")
 
     if issues:
@@ -98,13 +147,13 @@ def _check_formatting(items: List[RubricItem], output: str):
         item.notes = "; ".join(issues)
 
 
-def _check_decimal_places(items: List[RubricItem], output: str):
+def _check_decimal_places(items: List[RubricItem], index: OutputIndex):
     """Check (main_decimal): 2 decimal places for dollar amounts."""
     item = get_item(items, "main_decimal")
 
     # Find all dollar amounts (numbers preceded by $)
-    dollar_amounts = re.findall(r'\$(\d+\.\d+)', output)
-    bad_format = [n for n in dollar_amounts if len(n.split('.')[1]) != 2]
+    dollar_amounts = [n for n in index.tokens if index.output[n.start - 1:n.start] == '$']
+    bad_format = [n.text for n in dollar_amounts if n.decimals != 2]
 
     if bad_format:
         item.deduction = item.max_deduction
@@ -116,80 +165,78 @@ def _check_decimal_places(items: List[RubricItem], output: str):
         item.notes = "No dollar amounts found in output"
 
 
-def _check_numbers(items: List[RubricItem], output: str):
+def _check_numbers(items: List[RubricItem], records: ParsedOutput, index: OutputIndex):
     """Check (main_numbers): all payment values match expected output. -2 per wrong value."""
     item = get_item(items, "main_numbers")
     wrong = 0
 
-    # Check all 5 payment values
+    # Check all 5 payment values, each in its loan's section of its customer's report
     payment_checks = [
-        (CAR_LOAN_1["payment"], "Car Loan 1 payment"),
-        (CAR_LOAN_2["payment"], "Car Loan 2 payment"),
-        (PRIMARY_MORTGAGE_1["payment"], "Mortgage 1 payment"),
-        (PRIMARY_MORTGAGE_2["payment"], "Mortgage 2 payment"),
-        (UNSECURED_LOAN["payment"], "Unsecured Loan payment"),
+        ("car", CUSTOMER_A["last"], CAR_LOAN_1["payment"], "Car Loan 1 payment"),
+        ("car", CUSTOMER_B["last"], CAR_LOAN_2["payment"], "Car Loan 2 payment"),
+        ("mortgage", CUSTOMER_A["last"], PRIMARY_MORTGAGE_1["payment"], "Mortgage 1 payment"),
+        ("mortgage", CUSTOMER_B["last"], PRIMARY_MORTGAGE_2["payment"], "Mortgage 2 payment"),
+        ("unsecured", CUSTOMER_A["last"], UNSECURED_LOAN["payment"], "Unsecured Loan payment"),
     ]
 
     wrong_labels = []
-    for expected, label in payment_checks:
-        if not _value_in_output(expected, output):
+    misplaced: List[str] = []
+    for kind, owner, expected, label in payment_checks:
+        issue = _printed_value_issue(records, index, kind, "payment", expected, label, owner, misplaced)
+        if issue:
             wrong += 1
-            wrong_labels.append(label)
+            wrong_labels.append(issue)
 
     if wrong > 0:
         deduction = min(wrong * 2, item.max_deduction)
         item.deduction = deduction
         item.passed = False
         item.notes = f"{wrong} payment(s) incorrect: {', '.join(wrong_labels)}"
+    if misplaced:
+        item.notes = "; ".join(([item.notes] if item.notes else []) + misplaced)
+
 
+# --- Output evidence that overrides AST results ---
+
+def _report_header_shown(customer: dict):
+    """printMonthlyReport header line with the customer's name and SSN."""
+    pattern = re.compile(r'Account\s+Report\s+for\s+Customer.*{}\s+{}.*{}'.format(
+        customer["first"], customer["last"], re.escape(customer["ssn"])), re.IGNORECASE)
+    return lambda ctx: bool(pattern.search(ctx.output))
+
+
+PREDICATES = PredicateSet(
+    header_a_shown=_report_header_shown(CUSTOMER_A),
+    header_b_shown=_report_header_shown(CUSTOMER_B),
+    # Loan data appearing anywhere in the reports
+    loans_shown=lambda ctx: sum(1 for p in ALL_PAYMENTS if _value_in_output(p, ctx.index)),
+    first_names_shown=lambda ctx: all(c["first"] in ctx.hits for c in (CUSTOMER_A, CUSTOMER_B)),
+    last_names_shown=lambda ctx: all(c["last"] in ctx.hits for c in (CUSTOMER_A, CUSTOMER_B)),
+    ssns_shown=lambda ctx: all(c["ssn"] in ctx.hits for c in (CUSTOMER_A, CUSTOMER_B)),
+)
 
-def _override_customer_from_output(items: List[RubricItem], output: str):
-    """Override Customer AST checks if output proves methods work correctly."""
-    output_lower = output.lower()
-
-    # If output has "Account Report for Customer:" with correct names and SSNs,
-    # then printMonthlyReport works correctly
-    cust_item = get_item(items, "cust_printreport")
-    if not cust_item.passed:
-        has_header_a = bool(re.search(
-            r'Account\s+Report\s+for\s+Customer.*Tony\s+Stark.*111-22-3333',
-            output, re.IGNORECASE))
-        has_header_b = bool(re.search(
-            r'Account\s+Report\s+for\s+Customer.*Gal\s+Gadot.*444-55-6666',
-            output, re.IGNORECASE))
-
-        # Check that loan data appears under each customer
-        has_loans = sum(1 for p in ALL_PAYMENTS if _value_in_output(p, output))
-
-        if has_header_a and has_header_b and has_loans >= 4:
-            cust_item.deduction = 0
-            cust_item.passed = True
-            cust_item.notes = "printMonthlyReport verified via output"
-        elif (has_header_a or has_header_b) and has_loans >= 2:
-            cust_item.deduction = 7
-            cust_item.passed = False
-            cust_item.notes = "printMonthlyReport partially correct"
-
-    # If output has correct customer names, addLoanAccount likely works
-    addloan_item = get_item(items, "cust_addloan")
-    if not addloan_item.passed:
-        # If multiple loan types appear with correct payments, addLoanAccount works
-        has_loans = sum(1 for p in ALL_PAYMENTS if _value_in_output(p, output))
-        if has_loans >= 4:
-            addloan_item.deduction = 0
-            addloan_item.passed = True
-            addloan_item.notes = "addLoanAccount verified via output (loans displayed correctly)"
-
-    # Override getter checks if customer info appears in output
-    for getter_id, search_val in [
-        ("cust_getter_firstname", [CUSTOMER_A["first"], CUSTOMER_B["first"]]),
-        ("cust_getter_lastname", [CUSTOMER_A["last"], CUSTOMER_B["last"]]),
-        ("cust_getter_ssn", [CUSTOMER_A["ssn"], CUSTOMER_B["ssn"]]),
-    ]:
-        getter_item = get_item(items, getter_id)
-        if not getter_item.passed:
-            # Getters are used in printMonthlyReport header; if both values appear, getter exists
-            if all(v in output for v in search_val):
-                getter_item.deduction = 0
-                getter_item.passed = True
-                getter_item.notes = "Getter verified via output"
+# Getters are used in the printMonthlyReport header; if both customers' values appear, the getter exists
+GETTER_EVIDENCE = {
+    "cust_getter_firstname": "first_names_shown",
+    "cust_getter_lastname": "last_names_shown",
+    "cust_getter_ssn": "ssns_shown",
+}
+
+OVERRIDES = OverridePlan(PA3_RUBRIC, PREDICATES, [
+    Override("cust_printreport", item="cust_printreport", only_if_passed=False, cases=[
+        (lambda p: p["header_a_shown"] and p["header_b_shown"] and p["loans_shown"] >= 4,
+         Outcome(0, True, "printMonthlyReport verified via output")),
+        (lambda p: (p["header_a_shown"] or p["header_b_shown"]) and p["loans_shown"] >= 2,
+         Outcome(7, False, "printMonthlyReport partially correct")),
+    ]),
+    # If multiple loan types appear with correct payments, addLoanAccount works
+    Override("cust_addloan", item="cust_addloan", only_if_passed=False, cases=[
+        (lambda p: p["loans_shown"] >= 4,
+         Outcome(0, True, "addLoanAccount verified via output (loans displayed correctly)")),
+    ]),
+] + [
+    Override(item_id, item=item_id, only_if_passed=False, cases=[
+        (lambda p, evidence=evidence: p[evidence], Outcome(0, True, "Getter verified via output")),
+    ])
+    for item_id, evidence in GETTER_EVIDENCE.items()
+])
@@ -0,0 +1,94 @@
+"""
+Runtime of the declaration fallback on adversarial and malformed sources.
+
+Each case is generated at growing sizes and timed through the tokenizer and
+declaration scanner the analyzer falls back to when javalang fails. The
+per-KB cost should stay flat as the input grows. For comparison the regex
+fallbacks the analyzer used before are timed on the same inputs; those are
+skipped at larger sizes once a run exceeds the time limit.
+
+    python benchmarks/fallback_scanner.py [--sizes 4 16 64 256] [--limit 2.0]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from framework.declaration_scanner import scan_declarations  # noqa: E402
+
+# Adversarial inputs, each built from a unit repeated to fill the target size
+CASES: Dict[str, Callable[[int], str]] = {
+    "modifier_run": lambda n: "class A {\n" + "public static final " * (n // 20) + "int",
+    "unclosed_params": lambda n: "class A {\n" + "void m(int a, " * (n // 14),
+    "word_pairs": lambda n: "class A {\n" + "int x " * (n // 6),
+    "angle_flood": lambda n: "class A {\n" + "Map<List<" * (n // 9) + "String x;",
+    "deep_nesting": lambda n: "class A { void m() " + "{" * (n // 2) + "}" * (n // 2) + "}",
+    "unterminated_comment": lambda n: "class A { /* " + "public int x; " * (n // 14),
+    "unterminated_string": lambda n: "class A { String s = \"" + "\\\"x" * (n // 3) + "\n}",
+    "unterminated_text_block": lambda n: 'class A { String s = """\n' + '""\\"' * (n // 4),
+    "class_headers": lambda n: "class A extends " * (n // 16),
+    "mixed_garbage": lambda n: "class A { private int x = (((" * (n // 30) + "; }",
+}
+
+# The analyzer's former regex fallbacks, kept here as the baseline
+LEGACY_PATTERNS = [
+    re.compile(r'(?:public\s+)?class\s+(\w+)'),
+    re.compile(r'((?:private|public|protected|static|final)\s+)*(\w+)\s+(\w+)\s*[;=]'),
+    re.compile(r'((?:public|private|protected|static|final)\s+)*([\w<>\[\]]+)\s+(\w+)\s*\(([^)]*)\)'),
+    re.compile(r'class\s+\w+\s+extends\s+(\w+)'),
+    re.compile(r'(?:public|private|protected)\s+(\w+)\s*\(([^)]*)\)'),
+]
+
+
+def legacy_scan(source: str) -> int:
+    return sum(1 for pattern in LEGACY_PATTERNS for _ in pattern.finditer(source))
+
+
+def timed(func: Callable[[str], object], source: str, repeat: int = 1) -> float:
+    """Best wall time of `repeat` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(source)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 16, 64, 256],
+                        help="Source sizes in KB (default: 4 16 64 256)")
+    parser.add_argument("--limit", type=float, default=2.0,
+                        help="Stop timing the legacy regexes on a case after a run this long (seconds)")
+    args = parser.parse_args(argv)
+
+    print(f"{'case':<26}{'KB':>6}{'scanner us/KB':>16}{'legacy us/KB':>16}")
+    worst_ratio = 0.0
+    for name, build in CASES.items():
+        legacy_ok = True
+        per_kb = []
+        for kb in args.sizes:
+            source = build(kb * 1024)
+            size_kb = len(source) / 1024
+            scanner = timed(scan_declarations, source, repeat=3) / size_kb * 1e6
+            per_kb.append(scanner)
+            if legacy_ok:
+                elapsed = timed(legacy_scan, source)
+                legacy_ok = elapsed < args.limit
+                legacy = f"{elapsed / size_kb * 1e6:16.1f}"
+            else:
+                legacy = f"{'skipped':>16}"
+            print(f"{name:<26}{kb:>6}{scanner:16.1f}{legacy}")
+        worst_ratio = max(worst_ratio, max(per_kb) / min(per_kb))
+
+    print(f"\nWorst scanner per-KB growth across sizes: {worst_ratio:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,19 @@
 """Abstract base class for assignment graders."""
 
-import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Optional, Union
 
 from framework.rubric import RubricItem, GradingResult
-from framework.java_ast_analyzer import JavaASTAnalyzer
+from framework.java_ast_analyzer import DEFAULT_BACKEND, DEFAULT_PARSE_BUDGET
 from framework.java_compiler import JavaCompiler
+from framework.method_harness import CallResult, MethodBatch, run_batch
+from framework.output_diff import diff_outputs
+from framework.property_checks import PaymentProperty, PropertySuite
+from framework.reference_solution import ReferenceOutput
+from framework.source_bundle import SourceBundle
 from framework.utils import create_temp_dir, cleanup_temp_dir
+from framework.workspace import Workspace
 
 
 class BaseGrader(ABC):
@@ -17,7 +22,21 @@ class BaseGrader(ABC):
     Implements the grading pipeline: AST analysis -> compile -> run -> output check.
     """
 
-    def __init__(self, java_files: Union[Path, List[Path]], student_name: str, student_id: str):
+    # Labeled numbers the program should print, compared across the whole
+    # class after a batch (see framework/class_analytics.py)
+    expected_values: Dict[str, float] = {}
+    value_tolerance: float = 0.02
+    # Direct constructor/method calls run against the compiled classes in a
+    # single JVM; results are in self.method_results (None if not run)
+    method_batch: Optional[MethodBatch] = None
+    # The payment formula randomized checks call (see framework/property_checks.py)
+    payment_property: Optional[PaymentProperty] = None
+
+    def __init__(self, java_files: Union[Path, List[Path]], student_name: str, student_id: str,
+                 workspace: Optional[Workspace] = None, analyzer_backend: str = DEFAULT_BACKEND,
+                 parse_budget: Optional[float] = DEFAULT_PARSE_BUDGET,
+                 reference: Optional[ReferenceOutput] = None,
+                 property_suite: Optional[PropertySuite] = None):
         if isinstance(java_files, Path):
             java_files = [java_files]
         self.java_files = java_files
@@ -25,64 +44,47 @@ class BaseGrader(ABC):
         self.student_id = student_id
         self.source_code = ""
         self.analyzer = None
-        self.work_dir = create_temp_dir(f"grade_{student_name}_")
+        self.analyzer_backend = analyzer_backend
+        self.parse_budget = parse_budget
+        self.reference = reference
+        self.method_results: Optional[Dict[str, CallResult]] = None
+        self.property_suite = property_suite
+        # A caller-provided (pooled) workspace is owned and reset by the caller
+        self._owns_work_dir = workspace is None
+        self.workspace = workspace or Workspace(create_temp_dir(f"grade_{student_name}_"))
+        self.work_dir = self.workspace.root
 
     def _find_class_file(self) -> Path:
-        """
-        Find the primary class file for AST analysis (not the test/main file).
-        Heuristic: prefer files WITHOUT main(), then prefer files without 'test'/'main' in name.
-        """
-        if len(self.java_files) == 1:
-            return self.java_files[0]
-
-        # Separate files by whether they have main()
-        main_pattern = re.compile(r'public\s+static\s+void\s+main')
-        non_main = []
-        with_main = []
-        for f in self.java_files:
-            source = f.read_text(errors='ignore')
-            if main_pattern.search(source):
-                with_main.append(f)
-            else:
-                non_main.append(f)
-
-        # Prefer non-main files (the class definition)
-        if non_main:
-            # Among non-main files, avoid ones named 'test' or 'main'
-            for f in non_main:
-                if 'test' not in f.stem.lower() and 'main' not in f.stem.lower():
-                    return f
-            return non_main[0]
-
-        # All files have main - pick the one without 'test'/'main' in name
-        for f in with_main:
-            if 'test' not in f.stem.lower() and 'main' not in f.stem.lower():
-                return f
-        return with_main[0]
+        """Find the primary class file for AST analysis (not the test/main file)."""
+        return self.bundle.primary_file().path
 
     def grade(self) -> GradingResult:
         """Template method: run the full grading pipeline."""
-        # Read all source files (stored on self for subclass access)
-        self.all_sources = {}
-        for f in self.java_files:
-            self.all_sources[f] = f.read_text(errors='ignore')
-
-        combined_source = "\n".join(self.all_sources.values())
-
-        # Build display source with file headers
-        if len(self.java_files) > 1:
-            parts = []
-            for f in self.java_files:
-                parts.append(f"// === {f.name} ===\n{self.all_sources[f]}")
-            self.source_code = "\n\n".join(parts)
-        else:
-            self.source_code = self.all_sources[self.java_files[0]]
-
-        # Create AST analyzer from the class file
-        class_file = self._find_class_file()
-        self.analyzer = JavaASTAnalyzer(self.all_sources[class_file])
-        # Allow source_contains to search ALL files
-        self.analyzer.all_source = combined_source
+        try:
+            return self._run_pipeline()
+        finally:
+            if self._owns_work_dir:
+                cleanup_temp_dir(self.work_dir)
+
+    def _run_pipeline(self) -> GradingResult:
+        # Read and decode every source file once (stored on self for subclass access)
+        self.bundle = SourceBundle(self.java_files, backend=self.analyzer_backend,
+                                   parse_budget=self.parse_budget)
+        self.all_sources = self.bundle.sources
+        self.source_code = self.bundle.display_source
+
+        # With the javac backend, compile first so the analyzers are built
+        # from the declarations javac recorded while parsing
+        compiler = JavaCompiler(self.java_files, self.workspace, bundle=self.bundle,
+                                summarize=self.analyzer_backend == 'javac')
+        compile_result = None
+        if compiler.summarize:
+            compile_result = compiler.compile()
+            self.bundle.attach_summaries(compiler.summaries)
+
+        # AST analyzer for the class file, allowing source_contains to search ALL files
+        class_file = self.bundle.primary_file()
+        self.analyzer = class_file.analyzer.with_all_source(self.bundle.combined)
 
         # Define rubric items
         rubric_items = self.define_rubric()
@@ -90,15 +92,19 @@ class BaseGrader(ABC):
         # Phase 1: Static analysis
         self.check_class_structure(rubric_items)
 
-        # Phase 2: Compile (all files)
-        compiler = JavaCompiler(self.java_files, self.work_dir)
-        compile_ok, compile_errors = compiler.compile()
+        # Phase 2: Compile (all files), unless already done for the javac backend
+        compile_ok, compile_errors = compile_result or compiler.compile()
 
-        # Phase 3: Run
+        # Phase 3: Run, then call methods directly when the assignment declares calls
         run_ok = False
         output = ""
         if compile_ok:
             run_ok, output = compiler.run()
+            if self.method_batch is not None:
+                self.method_results = run_batch(compiler.build_dir, self.method_batch)
+        property_report = None
+        if compile_ok and self.property_suite is not None:
+            property_report = self.property_suite.run(compiler.build_dir)
 
         # Phase 4: Output verification
         if run_ok:
@@ -110,6 +116,9 @@ class BaseGrader(ABC):
         # Phase 5: OOP practice
         oop_notes = self.check_oop_practices()
 
+        expected_output = self.reference.output if self.reference else self.get_expected_output()
+        output_diff = diff_outputs(expected_output, output) if run_ok and expected_output else None
+
         # Build result
         result = GradingResult(
             student_name=self.student_name,
@@ -121,13 +130,13 @@ class BaseGrader(ABC):
             source_code=self.source_code,
             compiler_errors=compile_errors,
             oop_notes=oop_notes,
-            expected_output=self.get_expected_output()
+            expected_output=expected_output,
+            files_total=len(self.bundle),
+            files_parsed=self.bundle.parsed_count,
+            property_report=property_report,
+            output_diff=output_diff
         )
         result.calculate_score()
-
-        # Cleanup
-        cleanup_temp_dir(self.work_dir)
-
         return result
 
     @abstractmethod
@@ -0,0 +1,97 @@
+"""Class-wide output analytics: every student's numbers against every expected value at once."""
+
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Sequence
+
+from framework.output_index import OutputIndex
+from framework.rubric import GradingResult
+
+try:
+    import numpy as np
+except ImportError:  # Analytics are skipped without NumPy
+    np = None
+
+# Tolerances shown in the report's sensitivity table
+SENSITIVITY_TOLERANCES = (0.005, 0.01, 0.02, 0.05, 0.5, 1.0)
+# Students compared per broadcast, bounding the (students x values x tokens) temporary
+CHUNK_STUDENTS = 64
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+@dataclass
+class MatchMatrix:
+    """
+    students x expected values, over the students whose program ran and
+    printed something (see build_match_matrix). `distance` holds, for each student and
+    expected value, how far the closest number the student printed is from
+    it (inf when the student printed no numbers); a value is matched when
+    that distance is within the tolerance, exactly as the per-student
+    checks compare.
+    """
+    students: List[str]
+    labels: List[str]
+    expected: 'np.ndarray'
+    distance: 'np.ndarray'
+    tolerance: float
+
+    @property
+    def matches(self) -> 'np.ndarray':
+        return self.distance <= self.tolerance
+
+    @property
+    def hit_counts(self) -> 'np.ndarray':
+        return self.matches.sum(axis=0)
+
+    @property
+    def hit_rates(self) -> 'np.ndarray':
+        if not self.students:
+            return np.zeros(len(self.labels))
+        return self.matches.mean(axis=0)
+
+    def sensitivity(self, tolerances: Sequence[float] = SENSITIVITY_TOLERANCES) -> 'np.ndarray':
+        """tolerances x expected values: hit rate had each tolerance been used."""
+        if not self.students:
+            return np.zeros((len(tolerances), len(self.labels)))
+        tol = np.asarray(tolerances, dtype=float)
+        return (self.distance[None, :, :] <= tol[:, None, None]).mean(axis=1)
+
+
+def build_match_matrix(results: Sequence[GradingResult], expected: Mapping[str, float],
+                       tolerance: float) -> Optional[MatchMatrix]:
+    """
+    Stack every student's printed numbers (the OutputIndex tokens) into a
+    padded array and compare them with all expected values in one
+    broadcast per chunk of students. Results without run output (a
+    compile or runtime failure, whose actual_output is error text, or a
+    program that printed nothing) are left out. Returns None without NumPy
+    or when there is nothing to compare.
+    """
+    if np is None or not expected:
+        return None
+    ran = [r for r in results if r.execution_success and r.actual_output.strip()]
+    if not ran:
+        return None
+
+    rows = [[t.value for t in OutputIndex(r.actual_output).tokens] for r in ran]
+    width = max((len(row) for row in rows), default=0)
+    # Padding with inf keeps padded slots infinitely far from every expected value
+    values = np.full((len(rows), max(width, 1)), np.inf)
+    for i, row in enumerate(rows):
+        values[i, :len(row)] = row
+
+    targets = np.fromiter(expected.values(), dtype=float, count=len(expected))
+    distance = np.empty((len(rows), len(targets)))
+    for start in range(0, len(rows), CHUNK_STUDENTS):
+        chunk = values[start:start + CHUNK_STUDENTS]
+        distance[start:start + CHUNK_STUDENTS] = np.abs(chunk[:, None, :] - targets[None, :, None]).min(axis=2)
+
+    return MatchMatrix(
+        students=[r.student_name for r in ran],
+        labels=list(expected),
+        expected=targets,
+        distance=distance,
+        tolerance=tolerance,
+    )
@@ -0,0 +1,417 @@
+"""
+Declaration-only Java scanner.
+
+Recognizes type, field, method and constructor declarations from the token
+stream while tracking brace depth, skipping method bodies, initializer
+blocks and field initializers without parsing them. Produces the same
+ClassInfo/FieldInfo/MethodInfo/ConstructorInfo records as the full
+javalang parse at a fraction of the cost; type names follow javalang's
+convention (first identifier of the type, without generics or dimensions).
+
+Both the tokenizer and the scanner are single forward passes that accept
+any input, so this is also what the analyzer falls back to when javalang
+rejects or times out on a source (see benchmarks/fallback_scanner.py).
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from framework.java_declarations import ClassInfo, ConstructorInfo, FieldInfo, MethodInfo
+
+MODIFIERS = {'public', 'protected', 'private', 'static', 'abstract', 'final', 'native',
+             'synchronized', 'transient', 'volatile', 'strictfp', 'default'}
+TYPE_KEYWORDS = {'class', 'interface', 'enum'}
+# Reserved words, as javalang classifies them (contextual words like var/record are identifiers)
+KEYWORDS = MODIFIERS | TYPE_KEYWORDS | {
+    'assert', 'boolean', 'break', 'byte', 'case', 'catch', 'char', 'const', 'continue',
+    'do', 'double', 'else', 'extends', 'finally', 'float', 'for', 'goto', 'if',
+    'implements', 'import', 'instanceof', 'int', 'long', 'new', 'package', 'return',
+    'short', 'super', 'switch', 'this', 'throw', 'throws', 'try', 'void', 'while'}
+LITERAL_WORDS = {'true', 'false', 'null'}
+# Closing angle brackets may arrive merged into shift operators
+ANGLE_CLOSERS = {'>': 1, '>>': 2, '>>>': 3}
+
+# One alternative per token class. No alternative can match the same text in
+# more than one way and unterminated comments/strings simply end at EOF or
+# end of line, so tokenizing is a single left-to-right pass on any input.
+TOKEN_PATTERN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<comment>//[^\n]*|/\*(?:[^*]|\*(?!/))*(?:\*/)?)
+  | (?P<text_block>"""(?:[^"\\]|\\[\s\S]|"(?!""))*(?:"""|\Z))
+  | (?P<string>"(?:[^"\\\n]|\\.)*"?)
+  | (?P<char>'(?:[^'\\\n]|\\.)*'?)
+  | (?P<word>[^\W\d][\w$]*|\$[\w$]*)
+  | (?P<number>\.?\d(?:[\w.]|(?<=[eEpP])[+-])*)
+  | (?P<op>>>>=|>>=|<<=|<<|\.\.\.|->|::|\+\+|--|&&|\|\||[-+*/%&|^!=<>]=|\S)
+''', re.VERBOSE)
+LITERAL_GROUPS = {'text_block', 'string', 'char', 'number'}
+
+Token = Tuple[str, str]  # (kind, value)
+
+
+def tokenize(source: str) -> List[Token]:
+    """
+    Split Java source into (kind, value) pairs with kinds ident, keyword, op
+    and literal; whitespace and comments are dropped. Never fails: malformed
+    input still yields tokens, in time linear in its length.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(source):
+        group = match.lastgroup
+        if group == 'word':
+            value = match.group()
+            if value in KEYWORDS:
+                tokens.append(('keyword', value))
+            elif value in LITERAL_WORDS:
+                tokens.append(('literal', value))
+            else:
+                tokens.append(('ident', value))
+        elif group == 'op':
+            tokens.append(('op', match.group()))
+        elif group in LITERAL_GROUPS:
+            tokens.append(('literal', match.group()))
+    return tokens
+
+
+class DeclarationScanner:
+    """Single left-to-right pass over a token list, indexing declarations per type."""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.i = 0
+        self.package = ""
+        self.classes: Dict[str, ClassInfo] = {}
+
+    # --- Token helpers ---
+
+    def _val(self, offset: int = 0) -> Optional[str]:
+        j = self.i + offset
+        return self.tokens[j][1] if j < len(self.tokens) else None
+
+    def _kind(self, offset: int = 0) -> Optional[str]:
+        j = self.i + offset
+        return self.tokens[j][0] if j < len(self.tokens) else None
+
+    def _at_end(self) -> bool:
+        return self.i >= len(self.tokens)
+
+    def _skip_balanced(self, open_tok: str, close_tok: str):
+        """Skip from an opening token past its matching close."""
+        depth = 0
+        while not self._at_end():
+            v = self._val()
+            self.i += 1
+            if v == open_tok:
+                depth += 1
+            elif v == close_tok:
+                depth -= 1
+                if depth <= 0:
+                    return
+
+    def _skip_angles(self):
+        """Skip a generic argument/parameter list starting at '<'."""
+        depth = 0
+        while not self._at_end():
+            v = self._val()
+            self.i += 1
+            if v == '<':
+                depth += 1
+            elif v in ANGLE_CLOSERS:
+                depth -= ANGLE_CLOSERS[v]
+                if depth <= 0:
+                    return
+            elif v in ('{', '}', ';', '('):
+                # Not a generic list after all (e.g. a less-than); stop here
+                self.i -= 1
+                return
+
+    def _skip_past(self, tok: str):
+        while not self._at_end():
+            v = self._val()
+            self.i += 1
+            if v == tok:
+                return
+
+    def _qualified_name(self) -> str:
+        parts = []
+        while self._kind() == 'ident' or (parts and self._val() == '*'):
+            parts.append(self._val())
+            self.i += 1
+            if self._val() != '.':
+                break
+            self.i += 1
+        return '.'.join(parts)
+
+    # --- Grammar pieces ---
+
+    def _modifiers(self) -> set:
+        """Consume modifiers and annotations (but not '@interface')."""
+        modifiers = set()
+        while not self._at_end():
+            v = self._val()
+            if v in MODIFIERS and self._kind() == 'keyword':
+                modifiers.add(v)
+                self.i += 1
+            elif v == 'sealed' and (self._val(1) in MODIFIERS or self._val(1) in TYPE_KEYWORDS):
+                # Contextual keyword (Java 17); not a javalang modifier
+                self.i += 1
+            elif v == '@' and self._val(1) != 'interface':
+                self.i += 1
+                self._qualified_name()
+                if self._val() == '(':
+                    self._skip_balanced('(', ')')
+            else:
+                break
+        return modifiers
+
+    def _type(self) -> Optional[str]:
+        """Consume a type (qualified, generic, array); return its first identifier."""
+        if self._kind() not in ('ident', 'keyword') or self._val() in TYPE_KEYWORDS:
+            return None
+        name = self._val()
+        self.i += 1
+        while True:
+            if self._val() == '<':
+                self._skip_angles()
+            if self._val() == '.' and self._kind(1) == 'ident':
+                self.i += 2
+                continue
+            break
+        self._skip_dims()
+        return name
+
+    def _skip_dims(self):
+        while self._val() == '[' and self._val(1) == ']':
+            self.i += 2
+
+    def _param_types(self) -> List[str]:
+        """Consume '(' params ')' and return the parameter type names."""
+        return [type_name for type_name, _ in self._params()]
+
+    def _params(self) -> List[Tuple[str, str]]:
+        """Consume '(' params ')' and return (type name, parameter name) pairs."""
+        groups: List[List[Token]] = [[]]
+        depth = 0
+        self.i += 1  # '('
+        while not self._at_end():
+            v = self._val()
+            if v in ('(', '[', '<'):
+                depth += 1
+            elif v in (')', ']') or v in ANGLE_CLOSERS:
+                if v == ')' and depth == 0:
+                    self.i += 1
+                    break
+                depth -= ANGLE_CLOSERS.get(v, 1)
+            elif v == ',' and depth == 0:
+                groups.append([])
+                self.i += 1
+                continue
+            groups[-1].append(self.tokens[self.i])
+            self.i += 1
+
+        params = []
+        for group in groups:
+            j = 0
+            # Skip annotations and 'final'
+            while j < len(group):
+                if group[j][1] == '@':
+                    j += 2
+                    while j + 1 < len(group) and group[j][1] == '.':
+                        j += 2
+                    if j < len(group) and group[j][1] == '(':
+                        level = 0
+                        while j < len(group):
+                            level += {'(': 1, ')': -1}.get(group[j][1], 0)
+                            j += 1
+                            if level == 0:
+                                break
+                elif group[j][1] == 'final':
+                    j += 1
+                else:
+                    break
+            if j < len(group):
+                names = [tok[1] for tok in group[j + 1:] if tok[0] == 'ident']
+                params.append((group[j][1], names[-1] if names else ""))
+        return params
+
+    def _skip_method_tail(self):
+        """Skip dims, throws clause and the body (or ';' / annotation default)."""
+        self._skip_dims()
+        while not self._at_end() and self._val() not in ('{', ';'):
+            self.i += 1
+        if self._val() == '{':
+            self._skip_balanced('{', '}')
+        elif self._val() == ';':
+            self.i += 1
+
+    def _skip_initializer(self):
+        """Skip a field initializer up to the ',' starting the next declarator or the ';'."""
+        depth = 0
+        while not self._at_end():
+            v = self._val()
+            if v in ('(', '{', '['):
+                depth += 1
+            elif v in (')', '}', ']'):
+                if depth == 0:
+                    return
+                depth -= 1
+            elif depth == 0:
+                if v == ';':
+                    return
+                # A comma inside generics (new HashMap<K, V>()) is not a declarator break
+                if v == ',' and self._kind(1) == 'ident' and self._val(2) in ('=', ',', ';', '['):
+                    return
+            self.i += 1
+
+    def _field_declarators(self, info: ClassInfo, type_name: str, modifiers: set):
+        while self._kind() == 'ident':
+            info.fields.append(FieldInfo(name=self._val(), type_name=type_name, modifiers=modifiers))
+            self.i += 1
+            self._skip_dims()
+            if self._val() == '=':
+                self.i += 1
+                self._skip_initializer()
+            if self._val() == ',':
+                self.i += 1
+                continue
+            break
+        if self._val() == ';':
+            self.i += 1
+
+    def _type_declaration(self, kind: str, owner: Optional[ClassInfo] = None):
+        """Parse a class/interface/enum/record header and body, starting at its keyword."""
+        self.i += 1
+        if self._kind() != 'ident':
+            return
+        info = ClassInfo(name=self._val(), kind=kind, outer=owner.qualified_name if owner else None)
+        self.classes.setdefault(info.qualified_name, info)
+        self.i += 1
+        if self._val() == '<':
+            self._skip_angles()
+        if kind == 'record' and self._val() == '(':
+            # Record components are implicitly private final fields
+            for type_name, name in self._params():
+                info.fields.append(FieldInfo(name=name, type_name=type_name, modifiers={'private', 'final'}))
+
+        while not self._at_end() and self._val() != '{':
+            v = self._val()
+            if v in ('extends', 'implements', 'permits'):
+                self.i += 1
+                supertypes = []
+                while True:
+                    name = self._type()
+                    if name is None:
+                        break
+                    supertypes.append(name)
+                    if self._val() != ',':
+                        break
+                    self.i += 1
+                if v == 'extends' and kind == 'class':
+                    info.extends = supertypes[0] if supertypes else None
+                elif v != 'permits':
+                    info.implements.extend(supertypes)
+            else:
+                self.i += 1
+        if self._at_end():
+            return
+        self.i += 1  # '{'
+
+        if kind == 'enum':
+            self._skip_enum_constants()
+        while not self._at_end() and self._val() != '}':
+            self._member(info)
+        self.i += 1  # '}'
+
+    def _skip_enum_constants(self):
+        while not self._at_end():
+            v = self._val()
+            if v == '(':
+                self._skip_balanced('(', ')')
+            elif v == '{':
+                self._skip_balanced('{', '}')
+            elif v == ';':
+                self.i += 1
+                return
+            elif v == '}':
+                return
+            else:
+                self.i += 1
+
+    def _nested_type_keyword(self) -> Optional[str]:
+        v = self._val()
+        if v in TYPE_KEYWORDS:
+            return v
+        # 'record' is a contextual keyword: record Name(... or record Name<...
+        if v == 'record' and self._kind(1) == 'ident' and self._val(2) in ('(', '<'):
+            return 'record'
+        return None
+
+    def _member(self, owner: Optional[ClassInfo]):
+        """Parse one top-level or class-body declaration; always advances."""
+        start = self.i
+        modifiers = self._modifiers()
+        kind = self._nested_type_keyword()
+        if kind:
+            self._type_declaration(kind, owner)
+        elif self._val() == '@' and self._val(1) == 'interface':
+            # Annotation type declaration: not indexed
+            self._skip_past('{')
+            self.i -= 1
+            self._skip_balanced('{', '}')
+        elif owner is None:
+            self.i += 1
+        elif self._val() == '{':
+            self._skip_balanced('{', '}')  # (static) initializer block
+        elif self._val() == ';':
+            self.i += 1
+        else:
+            if self._val() == '<':
+                self._skip_angles()
+            if self._kind() == 'ident' and self._val(1) == '(':
+                self.i += 1
+                owner.constructors.append(ConstructorInfo(param_types=self._param_types(), modifiers=modifiers))
+                self._skip_method_tail()
+            else:
+                type_name = self._type()
+                if type_name is not None and self._kind() == 'ident':
+                    if self._val(1) == '(':
+                        name = self._val()
+                        self.i += 1
+                        param_types = self._param_types()
+                        owner.methods.append(MethodInfo(
+                            name=name,
+                            return_type=type_name,
+                            param_types=param_types,
+                            modifiers=modifiers
+                        ))
+                        self._skip_method_tail()
+                    else:
+                        self._field_declarators(owner, type_name, modifiers)
+        if self.i == start:
+            self.i += 1
+
+    def scan(self):
+        while not self._at_end():
+            v = self._val()
+            if v == 'package' and self._kind() == 'keyword':
+                self.i += 1
+                self.package = self._qualified_name()
+            elif v == 'import' and self._kind() == 'keyword':
+                self._skip_past(';')
+            else:
+                self._member(None)
+        return self
+
+
+def scan_declarations(source: str) -> Tuple[str, Dict[str, ClassInfo]]:
+    """
+    Return (package, {qualified type name: ClassInfo}) for a Java source string.
+    Types nested deeper than the interpreter's recursion limit are dropped;
+    everything declared before them is kept.
+    """
+    scanner = DeclarationScanner(tokenize(source))
+    try:
+        scanner.scan()
+    except RecursionError:
+        pass
+    return scanner.package, scanner.classes
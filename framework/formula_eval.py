@@ -0,0 +1,483 @@
+"""Java arithmetic methods translated from the javalang tree into vectorized NumPy functions, no JVM needed."""
+
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+try:
+    import javalang
+except ImportError:
+    javalang = None
+
+try:
+    import numpy as np
+except ImportError:  # Symbolic evaluation is skipped without NumPy
+    np = None
+
+INT_TYPES = {'int', 'long', 'short', 'byte', 'Integer', 'Long', 'Short', 'Byte'}
+REAL_TYPES = {'double', 'float', 'Double', 'Float'}
+BOOL_TYPES = {'boolean', 'Boolean'}
+
+# Math methods with a direct NumPy counterpart: name -> (function, arity)
+MATH_FUNCTIONS = {
+    'pow': (lambda a, b: np.power(a, b), 2),
+    'sqrt': (lambda a: np.sqrt(a), 1),
+    'cbrt': (lambda a: np.cbrt(a), 1),
+    'exp': (lambda a: np.exp(a), 1),
+    'log': (lambda a: np.log(a), 1),
+    'log10': (lambda a: np.log10(a), 1),
+    'abs': (lambda a: np.abs(a), 1),
+    'floor': (lambda a: np.floor(a), 1),
+    'ceil': (lambda a: np.ceil(a), 1),
+    'max': (lambda a, b: np.maximum(a, b), 2),
+    'min': (lambda a, b: np.minimum(a, b), 2),
+}
+MAX_CALL_DEPTH = 8
+
+Kind = str  # 'int', 'double' or 'bool'
+Vars = Dict[str, 'np.ndarray']
+Expr = Callable[[Vars], 'np.ndarray']
+
+
+class UnsupportedFormula(Exception):
+    """The method uses Java the evaluator does not model (loops, objects, strings...)."""
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _kind_of(type_node) -> Kind:
+    name = getattr(type_node, 'name', None)
+    if getattr(type_node, 'dimensions', None):
+        raise UnsupportedFormula(f"array type {name}[]")
+    if name in INT_TYPES:
+        return 'int'
+    if name in REAL_TYPES:
+        return 'double'
+    if name in BOOL_TYPES:
+        return 'bool'
+    raise UnsupportedFormula(f"type {name}")
+
+
+def _cast(value: 'np.ndarray', kind: Kind) -> 'np.ndarray':
+    if kind == 'int':
+        # Java truncates toward zero; NaN and infinities have no int value here
+        with np.errstate(invalid='ignore'):
+            return np.trunc(value)
+    return value.astype(float) if kind == 'double' else value
+
+
+def _literal(text: str) -> Tuple['np.ndarray', Kind]:
+    if text.startswith(('"', "'")):
+        raise UnsupportedFormula(f"string or char literal {text}")
+    text = text.replace('_', '')
+    if text in ('true', 'false'):
+        return np.array(text == 'true'), 'bool'
+    lowered = text.lower()
+    if lowered.startswith('0x'):
+        return np.array(float(int(lowered.rstrip('l'), 16))), 'int'
+    if lowered.endswith('l'):
+        return np.array(float(int(text[:-1]))), 'int'
+    if lowered.endswith(('f', 'd')):
+        return np.array(float(text[:-1])), 'double'
+    if '.' in text or 'e' in lowered:
+        return np.array(float(text)), 'double'
+    try:
+        return np.array(float(int(text))), 'int'
+    except ValueError:
+        raise UnsupportedFormula(f"literal {text}")
+
+
+def _arithmetic(op: str, left: 'np.ndarray', right: 'np.ndarray', integral: bool) -> 'np.ndarray':
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if op == '+':
+            return left + right
+        if op == '-':
+            return left - right
+        if op == '*':
+            return left * right
+        if op == '/':
+            if integral:
+                # int division truncates; dividing by zero throws, which we show as NaN
+                return np.where(right == 0, np.nan, np.trunc(left / np.where(right == 0, 1, right)))
+            return left / right
+        if op == '%':
+            if integral:
+                return np.where(right == 0, np.nan, np.fmod(left, np.where(right == 0, 1, right)))
+            return np.fmod(left, right)
+    raise UnsupportedFormula(f"operator {op}")
+
+
+COMPARISONS = {
+    '==': lambda a, b: a == b, '!=': lambda a, b: a != b,
+    '<': lambda a, b: a < b, '<=': lambda a, b: a <= b,
+    '>': lambda a, b: a > b, '>=': lambda a, b: a >= b,
+}
+
+
+class _Frame:
+    """One evaluation over all grid points: variable values, which lanes still run, what they returned."""
+
+    def __init__(self, variables: Vars, size: int):
+        self.vars = variables
+        self.active = np.ones(size, dtype=bool)
+        self.result = np.full(size, np.nan)
+
+
+class MethodTranslator:
+    """
+    Translates the methods of one javalang ClassDeclaration, e.g.
+
+        translator = MethodTranslator(class_node)
+        payment = translator.compile("calculateMonthlyPayment")
+        payment({"principal": p, "annualInterestRate": r, "months": m})  # arrays in, array out
+
+    Supported: arithmetic with Java's int/double semantics (int division
+    truncates), Math functions, casts, comparisons, ?:, local variables,
+    assignments, if/else and early returns (evaluated per lane with masks),
+    static final constants and calls to other methods of the class.
+    Anything else (loops, strings, objects, exceptions) raises
+    UnsupportedFormula when the method is compiled; running it raises
+    UnsupportedFormula only if it reads a field no value was given for.
+    """
+
+    def __init__(self, class_node):
+        self.class_node = class_node
+        self.fields: Dict[str, Kind] = {}
+        self.constants: Dict[str, Tuple['np.ndarray', Kind]] = {}
+        self._compiled: Dict[Tuple[str, int], Tuple[Callable, Kind]] = {}
+        for field in class_node.fields:
+            try:
+                kind = _kind_of(field.type)
+            except UnsupportedFormula:
+                continue  # Non-numeric fields (VIN, address...) are only a problem if read
+            for declarator in field.declarators:
+                self.fields[declarator.name] = kind
+                if 'final' in field.modifiers and declarator.initializer is not None:
+                    try:
+                        expr, _ = self._expr(declarator.initializer, {}, 0)
+                        self.constants[declarator.name] = (_cast(expr({}), kind), kind)
+                    except (UnsupportedFormula, KeyError):
+                        pass
+
+    def _method(self, name: str, arity: int):
+        for method in self.class_node.methods:
+            if method.name == name and len(method.parameters) == arity:
+                return method
+        raise UnsupportedFormula(f"call to {name}() with {arity} argument(s)")
+
+    def compile(self, name: str) -> Callable[[Mapping[str, 'np.ndarray']], 'np.ndarray']:
+        """A vectorized version of the no-argument method `name`, given field value arrays."""
+        run, kind = self._function(name, 0, 0)
+        if kind == 'bool':
+            raise UnsupportedFormula(f"{name}() returns boolean")
+
+        def evaluate(fields: Mapping[str, 'np.ndarray']) -> 'np.ndarray':
+            arrays = {k: np.asarray(v, dtype=float) for k, v in fields.items()}
+            size = max((a.size for a in arrays.values()), default=1)
+            try:
+                return run({k: np.broadcast_to(a, (size,)) for k, a in arrays.items()}, [], size)
+            except KeyError as e:
+                raise UnsupportedFormula(f"{name}() reads field {e.args[0]}, which was not given")
+        return evaluate
+
+    def _function(self, name: str, arity: int, depth: int) -> Tuple[Callable, Kind]:
+        """(run(field_vars, args, size) -> array, return kind) for a method of this class."""
+        key = (name, arity)
+        if key in self._compiled:
+            return self._compiled[key]
+        if depth > MAX_CALL_DEPTH:
+            raise UnsupportedFormula(f"{name}() calls nest too deeply (recursion?)")
+        method = self._method(name, arity)
+        if method.return_type is None:
+            raise UnsupportedFormula(f"{name}() returns void")
+        kind = _kind_of(method.return_type)
+        scope: Dict[str, Kind] = dict(self.fields)
+        params = []
+        for param in method.parameters:
+            scope[param.name] = _kind_of(param.type)
+            params.append((param.name, scope[param.name]))
+        body = self._block(method.body or [], scope, depth)
+
+        def run(field_vars: Vars, args: List['np.ndarray'], size: int) -> 'np.ndarray':
+            variables = dict(field_vars)
+            for (param, param_kind), value in zip(params, args):
+                variables[param] = _cast(np.broadcast_to(value, (size,)), param_kind)
+            frame = _Frame(variables, size)
+            body(frame)
+            if frame.active.any():
+                raise UnsupportedFormula(f"{name}() can end without returning")
+            return _cast(frame.result, kind)
+
+        self._compiled[key] = (run, kind)
+        return run, kind
+
+    # --- Statements: each becomes fn(frame) ---
+
+    def _block(self, statements, scope: Dict[str, Kind], depth: int) -> Callable[[_Frame], None]:
+        steps = [self._statement(s, scope, depth) for s in statements]
+
+        def run(frame: _Frame):
+            for step in steps:
+                if not frame.active.any():
+                    return
+                step(frame)
+        return run
+
+    def _statement(self, node, scope: Dict[str, Kind], depth: int) -> Callable[[_Frame], None]:
+        tree = javalang.tree
+        if isinstance(node, tree.LocalVariableDeclaration):
+            kind = _kind_of(node.type)
+            assigns = []
+            for declarator in node.declarators:
+                scope[declarator.name] = kind
+                if declarator.initializer is not None:
+                    assigns.append(self._assign(declarator.name, kind, declarator.initializer, scope, depth))
+            return self._sequence(assigns)
+        if isinstance(node, tree.StatementExpression):
+            expression = node.expression
+            if isinstance(expression, tree.Assignment):
+                target = self._target_name(expression.expressionl)
+                if target not in scope:
+                    raise UnsupportedFormula(f"assignment to {target}")
+                value = expression.value
+                if expression.type != '=':
+                    value = tree.BinaryOperation(operator=expression.type[:-1],
+                                                 operandl=expression.expressionl, operandr=value)
+                return self._assign(target, scope[target], value, scope, depth)
+            postfix = getattr(expression, 'postfix_operators', None) or []
+            prefix = getattr(expression, 'prefix_operators', None) or []
+            steps = [op for op in postfix + prefix if op in ('++', '--')]
+            if isinstance(expression, tree.MemberReference) and len(steps) == 1:
+                target = self._target_name(expression)
+                if target not in scope:
+                    raise UnsupportedFormula(f"{steps[0]} on {target}")
+                one = tree.Literal(value='1', prefix_operators=[], postfix_operators=[], selectors=[])
+                bare = tree.MemberReference(member=expression.member, qualifier=expression.qualifier,
+                                            prefix_operators=[], postfix_operators=[], selectors=[])
+                value = tree.BinaryOperation(operator=steps[0][0], operandl=bare, operandr=one)
+                return self._assign(target, scope[target], value, scope, depth)
+            raise UnsupportedFormula(f"statement {type(expression).__name__}")
+        if isinstance(node, tree.ReturnStatement):
+            if node.expression is None:
+                raise UnsupportedFormula("return without a value")
+            value, _ = self._expr(node.expression, scope, depth)
+
+            def ret(frame: _Frame):
+                frame.result = np.where(frame.active, value(frame.vars), frame.result)
+                frame.active = np.zeros_like(frame.active)
+            return ret
+        if isinstance(node, tree.BlockStatement):
+            return self._block(node.statements or [], dict(scope), depth)
+        if isinstance(node, tree.IfStatement):
+            condition, kind = self._expr(node.condition, scope, depth)
+            if kind != 'bool':
+                raise UnsupportedFormula("non-boolean if condition")
+            then = self._statement(node.then_statement, dict(scope), depth)
+            otherwise = (self._statement(node.else_statement, dict(scope), depth)
+                         if node.else_statement is not None else None)
+
+            def branch(frame: _Frame):
+                taken = np.broadcast_to(condition(frame.vars), frame.active.shape)
+                entering = frame.active
+                frame.active = entering & taken
+                then(frame)
+                still_running = frame.active
+                frame.active = entering & ~taken
+                if otherwise is not None:
+                    otherwise(frame)
+                frame.active = still_running | frame.active
+            return branch
+        raise UnsupportedFormula(f"statement {type(node).__name__}")
+
+    @staticmethod
+    def _sequence(steps):
+        def run(frame: _Frame):
+            for step in steps:
+                step(frame)
+        return run
+
+    def _target_name(self, node) -> str:
+        tree = javalang.tree
+        if isinstance(node, tree.MemberReference) and node.qualifier in ('', None, 'this') and not node.selectors:
+            return node.member
+        if isinstance(node, tree.This) and len(node.selectors or []) == 1 \
+                and isinstance(node.selectors[0], tree.MemberReference):
+            return node.selectors[0].member
+        raise UnsupportedFormula("assignment to something other than a variable")
+
+    def _assign(self, name: str, kind: Kind, value_node, scope, depth) -> Callable[[_Frame], None]:
+        value, _ = self._expr(value_node, scope, depth)
+
+        def assign(frame: _Frame):
+            new = _cast(np.broadcast_to(value(frame.vars), frame.active.shape), kind)
+            old = frame.vars.get(name)
+            frame.vars[name] = new if old is None else np.where(frame.active, new, old)
+        return assign
+
+    # --- Expressions: each becomes (fn(vars) -> array, kind) ---
+
+    def _expr(self, node, scope: Dict[str, Kind], depth: int) -> Tuple[Expr, Kind]:
+        expr, kind = self._primary(node, scope, depth)
+        for op in reversed(getattr(node, 'prefix_operators', None) or []):
+            expr, kind = self._prefix(op, expr, kind)
+        if getattr(node, 'postfix_operators', None):
+            raise UnsupportedFormula("++/-- inside an expression")
+        return expr, kind
+
+    @staticmethod
+    def _prefix(op: str, expr: Expr, kind: Kind) -> Tuple[Expr, Kind]:
+        if op == '-' and kind != 'bool':
+            return (lambda v: -expr(v)), kind
+        if op == '+' and kind != 'bool':
+            return expr, kind
+        if op == '!' and kind == 'bool':
+            return (lambda v: ~expr(v)), kind
+        raise UnsupportedFormula(f"prefix {op}")
+
+    def _primary(self, node, scope: Dict[str, Kind], depth: int) -> Tuple[Expr, Kind]:
+        tree = javalang.tree
+        if isinstance(node, tree.Literal):
+            if node.selectors:
+                raise UnsupportedFormula(f"{node.value} with selectors")
+            value, kind = _literal(node.value)
+            return (lambda v: value), kind
+        if isinstance(node, tree.MemberReference):
+            if node.selectors:
+                raise UnsupportedFormula(f"{node.member} with selectors")
+            if node.qualifier not in ('', None, 'this'):
+                return self._qualified_constant(node.qualifier, node.member)
+            return self._variable(node.member, scope)
+        if isinstance(node, tree.This):
+            selectors = node.selectors or []
+            if len(selectors) != 1:
+                raise UnsupportedFormula("this used as a value")
+            selector = selectors[0]
+            if isinstance(selector, tree.MemberReference):
+                return self._variable(selector.member, self.fields)
+            if isinstance(selector, tree.MethodInvocation):
+                return self._call(selector, scope, depth)
+            raise UnsupportedFormula(f"this.{type(selector).__name__}")
+        if isinstance(node, tree.BinaryOperation):
+            return self._binary(node, scope, depth)
+        if isinstance(node, tree.Cast):
+            kind = _kind_of(node.type)
+            inner, inner_kind = self._expr(node.expression, scope, depth)
+            if (kind == 'bool') != (inner_kind == 'bool'):
+                raise UnsupportedFormula("cast between boolean and number")
+            return (lambda v: _cast(np.asarray(inner(v), dtype=float), kind)), kind
+        if isinstance(node, tree.TernaryExpression):
+            condition, condition_kind = self._expr(node.condition, scope, depth)
+            if_true, true_kind = self._expr(node.if_true, scope, depth)
+            if_false, false_kind = self._expr(node.if_false, scope, depth)
+            if condition_kind != 'bool' or (true_kind == 'bool') != (false_kind == 'bool'):
+                raise UnsupportedFormula("ternary types")
+            kind = 'int' if true_kind == false_kind == 'int' else true_kind if true_kind == 'bool' else 'double'
+            return (lambda v: np.where(condition(v), if_true(v), if_false(v))), kind
+        if isinstance(node, tree.MethodInvocation):
+            if node.selectors:
+                raise UnsupportedFormula(f"{node.member}() with selectors")
+            if node.qualifier == 'Math':
+                return self._math(node, scope, depth)
+            if node.qualifier in ('', None, 'this'):
+                return self._call(node, scope, depth)
+            raise UnsupportedFormula(f"call to {node.qualifier}.{node.member}()")
+        raise UnsupportedFormula(f"expression {type(node).__name__}")
+
+    def _variable(self, name: str, scope: Mapping[str, Kind]) -> Tuple[Expr, Kind]:
+        if name in self.constants:
+            value, kind = self.constants[name]
+            return (lambda v: value), kind
+        if name in scope:
+            return (lambda v: v[name]), scope[name]
+        raise UnsupportedFormula(f"unknown variable {name}")
+
+    def _qualified_constant(self, qualifier: str, member: str) -> Tuple[Expr, Kind]:
+        if qualifier == 'Math' and member in ('PI', 'E'):
+            value = np.array(np.pi if member == 'PI' else np.e)
+            return (lambda v: value), 'double'
+        if qualifier == self.class_node.name and member in self.constants:
+            value, kind = self.constants[member]
+            return (lambda v: value), kind
+        raise UnsupportedFormula(f"{qualifier}.{member}")
+
+    def _binary(self, node, scope, depth) -> Tuple[Expr, Kind]:
+        op = node.operator
+        left, left_kind = self._expr(node.operandl, scope, depth)
+        right, right_kind = self._expr(node.operandr, scope, depth)
+        if op in ('&&', '||'):
+            if left_kind != 'bool' or right_kind != 'bool':
+                raise UnsupportedFormula(f"{op} on numbers")
+            if op == '&&':
+                return (lambda v: left(v) & right(v)), 'bool'
+            return (lambda v: left(v) | right(v)), 'bool'
+        if op in COMPARISONS:
+            if (left_kind == 'bool') != (right_kind == 'bool'):
+                raise UnsupportedFormula(f"{op} between boolean and number")
+            compare = COMPARISONS[op]
+            return (lambda v: compare(left(v), right(v))), 'bool'
+        if 'bool' in (left_kind, right_kind):
+            raise UnsupportedFormula(f"{op} on booleans")
+        integral = left_kind == right_kind == 'int'
+        return (lambda v: _arithmetic(op, left(v), right(v), integral)), 'int' if integral else 'double'
+
+    def _math(self, node, scope, depth) -> Tuple[Expr, Kind]:
+        if node.member == 'round':
+            if len(node.arguments) != 1:
+                raise UnsupportedFormula("Math.round arity")
+            arg, _ = self._expr(node.arguments[0], scope, depth)
+            return (lambda v: np.floor(np.asarray(arg(v), dtype=float) + 0.5)), 'int'
+        if node.member not in MATH_FUNCTIONS:
+            raise UnsupportedFormula(f"Math.{node.member}")
+        function, arity = MATH_FUNCTIONS[node.member]
+        if len(node.arguments) != arity:
+            raise UnsupportedFormula(f"Math.{node.member} arity")
+        args = [self._expr(a, scope, depth) for a in node.arguments]
+        kinds = {k for _, k in args}
+        if 'bool' in kinds:
+            raise UnsupportedFormula(f"Math.{node.member} on booleans")
+        # abs, max and min keep int; the rest return double
+        kind = 'int' if node.member in ('abs', 'max', 'min') and kinds == {'int'} else 'double'
+        fns = [fn for fn, _ in args]
+
+        def call(v):
+            with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+                return function(*(np.asarray(fn(v), dtype=float) for fn in fns))
+        return call, kind
+
+    def _call(self, node, scope, depth) -> Tuple[Expr, Kind]:
+        run, kind = self._function(node.member, len(node.arguments), depth + 1)
+        args = [self._expr(a, scope, depth)[0] for a in node.arguments]
+        fields = list(self.fields)
+
+        def call(v):
+            size = next((a.size for a in v.values() if np.ndim(a)), 1)
+            field_vars = {name: v[name] for name in fields if name in v}
+            return run(field_vars, [a(v) for a in args], size)
+        return call, kind
+
+
+def find_class(tree, name: str):
+    """The ClassDeclaration named `name` in a javalang compilation unit (nested classes included)."""
+    if tree is None:
+        return None
+    for _, node in tree.filter(javalang.tree.ClassDeclaration):
+        if node.name == name:
+            return node
+    return None
+
+
+def translate(tree, class_name: str, method_name: str) -> Optional[Callable]:
+    """
+    The method as a vectorized function, or None when it cannot be
+    translated. Source that does not compile can trip the translator in
+    ways it does not anticipate; those count as untranslatable too.
+    """
+    if np is None or javalang is None:
+        return None
+    class_node = find_class(tree, class_name)
+    if class_node is None:
+        return None
+    try:
+        return MethodTranslator(class_node).compile(method_name)
+    except Exception:
+        return None
@@ -0,0 +1,259 @@
+import com.sun.source.tree.AnnotatedTypeTree;
+import com.sun.source.tree.ArrayTypeTree;
+import com.sun.source.tree.ClassTree;
+import com.sun.source.tree.CompilationUnitTree;
+import com.sun.source.tree.IdentifierTree;
+import com.sun.source.tree.MemberSelectTree;
+import com.sun.source.tree.MethodTree;
+import com.sun.source.tree.ModifiersTree;
+import com.sun.source.tree.ParameterizedTypeTree;
+import com.sun.source.tree.PrimitiveTypeTree;
+import com.sun.source.tree.Tree;
+import com.sun.source.tree.VariableTree;
+import com.sun.source.util.JavacTask;
+import com.sun.source.util.TaskEvent;
+import com.sun.source.util.TaskListener;
+
+import javax.lang.model.element.Modifier;
+import javax.tools.JavaCompiler;
+import javax.tools.JavaFileObject;
+import javax.tools.StandardJavaFileManager;
+import javax.tools.ToolProvider;
+import java.io.IOException;
+import java.io.PrintWriter;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.List;
+
+/**
+ * Runs javac in-process and, as each compilation unit is parsed, records its
+ * type, field, method and constructor declarations. Usage:
+ *
+ *   java DeclarationSummary summary.json [javac options] File.java ...
+ *
+ * Diagnostics go to stderr exactly as javac prints them and the exit status
+ * is javac's. summary.json is written even when compilation fails, since the
+ * parse of every file completes before attribution errors are reported.
+ *
+ * Type names follow the grader's convention: the first identifier of the
+ * type, without qualifiers, generic arguments or array dimensions.
+ */
+public final class DeclarationSummary {
+
+    private DeclarationSummary() {
+    }
+
+    public static void main(String[] args) throws IOException {
+        if (args.length < 2) {
+            System.err.println("usage: DeclarationSummary summary.json [javac options] files...");
+            System.exit(2);
+        }
+        List<String> options = new ArrayList<>();
+        List<String> files = new ArrayList<>();
+        for (String arg : Arrays.asList(args).subList(1, args.length)) {
+            (arg.endsWith(".java") ? files : options).add(arg);
+        }
+
+        JavaCompiler compiler = ToolProvider.getSystemJavaCompiler();
+        StringBuilder json = new StringBuilder("[");
+        boolean ok;
+        try (StandardJavaFileManager fileManager = compiler.getStandardFileManager(null, null, StandardCharsets.UTF_8)) {
+            Iterable<? extends JavaFileObject> units = fileManager.getJavaFileObjectsFromStrings(files);
+            PrintWriter err = new PrintWriter(System.err, true);
+            JavacTask task = (JavacTask) compiler.getTask(err, fileManager, null, options, null, units);
+            task.addTaskListener(new TaskListener() {
+                @Override
+                public void started(TaskEvent e) {
+                }
+
+                @Override
+                public void finished(TaskEvent e) {
+                    if (e.getKind() == TaskEvent.Kind.PARSE) {
+                        if (json.length() > 1) {
+                            json.append(',');
+                        }
+                        unit(json, e.getCompilationUnit());
+                    }
+                }
+            });
+            ok = task.call();
+        }
+        json.append(']');
+        try (Writer out = Files.newBufferedWriter(Paths.get(args[0]), StandardCharsets.UTF_8)) {
+            out.write(json.toString());
+        }
+        System.exit(ok ? 0 : 1);
+    }
+
+    // --- Summary ---
+
+    private static void unit(StringBuilder json, CompilationUnitTree unit) {
+        json.append("{\"path\":");
+        Json.string(json, unit.getSourceFile().toUri().getPath());
+        json.append(",\"package\":");
+        Json.string(json, unit.getPackageName() == null ? "" : unit.getPackageName().toString());
+        json.append(",\"types\":[");
+        boolean first = true;
+        for (Tree decl : unit.getTypeDecls()) {
+            if (decl instanceof ClassTree) {
+                first = type(json, (ClassTree) decl, first, null);
+            }
+        }
+        json.append("]}");
+    }
+
+    /**
+     * Appends this type and then its member types; returns false once anything was written.
+     * outer is the enclosing type's qualified name (Outer.Inner), or null for a top-level type.
+     */
+    private static boolean type(StringBuilder json, ClassTree cls, boolean first, String outer) {
+        String kind = kind(cls);
+        if (kind == null) {
+            return first;
+        }
+        if (!first) {
+            json.append(',');
+        }
+        String name = cls.getSimpleName().toString();
+        json.append("{\"name\":");
+        Json.string(json, name);
+        json.append(",\"outer\":");
+        Json.string(json, outer);
+        json.append(",\"kind\":");
+        Json.string(json, kind);
+
+        // javac keeps an interface's extends list in the implements clause
+        String extendsName = null;
+        if (kind.equals("class") && cls.getExtendsClause() != null) {
+            extendsName = typeName(cls.getExtendsClause());
+        }
+        List<String> supertypes = new ArrayList<>();
+        for (Tree t : cls.getImplementsClause()) {
+            supertypes.add(typeName(t));
+        }
+        json.append(",\"extends\":");
+        Json.string(json, extendsName);
+        json.append(",\"implements\":");
+        Json.strings(json, supertypes);
+
+        List<ClassTree> nested = new ArrayList<>();
+        StringBuilder fields = new StringBuilder();
+        StringBuilder methods = new StringBuilder();
+        StringBuilder constructors = new StringBuilder();
+        for (Tree member : cls.getMembers()) {
+            if (member instanceof VariableTree) {
+                VariableTree var = (VariableTree) member;
+                if (kind.equals("enum") && isEnumConstant(cls, var)) {
+                    continue;
+                }
+                separate(fields);
+                fields.append("{\"name\":");
+                Json.string(fields, var.getName().toString());
+                fields.append(",\"type\":");
+                Json.string(fields, typeName(var.getType()));
+                fields.append(",\"modifiers\":");
+                modifiers(fields, var.getModifiers());
+                fields.append('}');
+            } else if (member instanceof MethodTree) {
+                MethodTree method = (MethodTree) member;
+                boolean constructor = method.getName().contentEquals("<init>");
+                StringBuilder target = constructor ? constructors : methods;
+                separate(target);
+                target.append('{');
+                if (!constructor) {
+                    target.append("\"name\":");
+                    Json.string(target, method.getName().toString());
+                    target.append(",\"return_type\":");
+                    Json.string(target, method.getReturnType() == null ? "void" : typeName(method.getReturnType()));
+                    target.append(',');
+                }
+                target.append("\"params\":");
+                List<String> params = new ArrayList<>();
+                for (VariableTree p : method.getParameters()) {
+                    params.add(typeName(p.getType()));
+                }
+                Json.strings(target, params);
+                target.append(",\"modifiers\":");
+                modifiers(target, method.getModifiers());
+                target.append('}');
+            } else if (member instanceof ClassTree) {
+                nested.add((ClassTree) member);
+            }
+        }
+        json.append(",\"fields\":[").append(fields).append(']');
+        json.append(",\"methods\":[").append(methods).append(']');
+        json.append(",\"constructors\":[").append(constructors).append("]}");
+
+        for (ClassTree inner : nested) {
+            type(json, inner, false, outer == null ? name : outer + "." + name);
+        }
+        return false;
+    }
+
+    /** Kind name, or null for annotation types (not indexed). Compares by name to build on JDK 11. */
+    private static String kind(ClassTree cls) {
+        switch (cls.getKind().name()) {
+            case "CLASS":
+                return "class";
+            case "INTERFACE":
+                return "interface";
+            case "ENUM":
+                return "enum";
+            case "RECORD":
+                return "record";
+            default:
+                return null;
+        }
+    }
+
+    /** javac models enum constants as implicitly public static final fields of the enum's own type. */
+    private static boolean isEnumConstant(ClassTree cls, VariableTree var) {
+        return var.getType() != null
+                && typeName(var.getType()).equals(cls.getSimpleName().toString())
+                && var.getModifiers().getFlags().containsAll(
+                        Arrays.asList(Modifier.PUBLIC, Modifier.STATIC, Modifier.FINAL))
+                && var.getModifiers().getAnnotations().isEmpty();
+    }
+
+    private static String typeName(Tree type) {
+        while (true) {
+            if (type == null) {
+                return "";
+            } else if (type instanceof PrimitiveTypeTree) {
+                return type.toString();
+            } else if (type instanceof IdentifierTree) {
+                return ((IdentifierTree) type).getName().toString();
+            } else if (type instanceof ParameterizedTypeTree) {
+                type = ((ParameterizedTypeTree) type).getType();
+            } else if (type instanceof ArrayTypeTree) {
+                type = ((ArrayTypeTree) type).getType();
+            } else if (type instanceof AnnotatedTypeTree) {
+                type = ((AnnotatedTypeTree) type).getUnderlyingType();
+            } else if (type instanceof MemberSelectTree) {
+                type = ((MemberSelectTree) type).getExpression();
+            } else {
+                return type.toString();
+            }
+        }
+    }
+
+    // --- JSON ---
+
+    private static void modifiers(StringBuilder json, ModifiersTree modifiers) {
+        List<String> names = new ArrayList<>();
+        for (Modifier m : modifiers.getFlags()) {
+            names.add(m.toString());
+        }
+        Json.strings(json, names);
+    }
+
+    private static void separate(StringBuilder json) {
+        if (json.length() > 0) {
+            json.append(',');
+        }
+    }
+}
@@ -0,0 +1,359 @@
+import java.io.BufferedWriter;
+import java.io.ByteArrayInputStream;
+import java.io.File;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.lang.reflect.Constructor;
+import java.lang.reflect.Executable;
+import java.lang.reflect.InvocationTargetException;
+import java.lang.reflect.Method;
+import java.lang.reflect.Modifier;
+import java.net.URL;
+import java.net.URLClassLoader;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.stream.Stream;
+
+/**
+ * Loads a student's compiled classes and runs a batch of constructor and
+ * method calls against them in this one JVM. Usage:
+ *
+ *   java MethodHarness build-dir calls.txt results.jsonl timeout-ms
+ *
+ * Each line of calls.txt is tab-separated:
+ *
+ *   new   id  ClassName   arg...     construct an object, remembered as id
+ *   call  id  target-id   method  arg...
+ *
+ * Arguments are typed: d:1.5, i:72, b:true, s:text (with \t, \n and \\
+ * escaped), ref:id (an object constructed earlier) and null. Classes are
+ * found by simple name, ignoring case and package, and methods by name
+ * and argument count, converting numbers between int and double as Java
+ * would at a call site.
+ *
+ * One JSON object is written per line and flushed as soon as the call
+ * finishes, so results up to a call that exits the JVM are kept:
+ *
+ *   {"id":"c1","ok":true,"text":"393.98...","number":393.98}
+ *   {"id":"c2","ok":false,"error":"ArithmeticException: / by zero"}
+ *   {"id":"c3","ok":false,"unresolved":true,"error":"unknown class Loan"}
+ *
+ * "unresolved" marks calls that never reached student code: the class,
+ * constructor, method or target object could not be found.
+ *
+ * Student code runs with System.out discarded and an empty System.in. A
+ * call that exceeds the timeout is reported and ends the batch, since its
+ * thread cannot be stopped safely.
+ */
+public final class MethodHarness {
+
+    private final Map<String, Class<?>> classes = new HashMap<>();
+    private final Map<String, Object> objects = new HashMap<>();
+    private final ExecutorService executor = Executors.newSingleThreadExecutor(r -> {
+        Thread t = new Thread(r, "student-call");
+        t.setDaemon(true);
+        return t;
+    });
+    private final long timeoutMillis;
+
+    private MethodHarness(Path buildDir, long timeoutMillis) throws IOException {
+        this.timeoutMillis = timeoutMillis;
+        ClassLoader loader = new URLClassLoader(new URL[] {buildDir.toUri().toURL()},
+                                                MethodHarness.class.getClassLoader());
+        try (Stream<Path> files = Files.walk(buildDir)) {
+            files.filter(p -> p.toString().endsWith(".class") && !p.getFileName().toString().contains("$"))
+                 .forEach(p -> {
+                     String name = buildDir.relativize(p).toString();
+                     name = name.substring(0, name.length() - ".class".length()).replace(File.separatorChar, '.');
+                     try {
+                         Class<?> cls = Class.forName(name, false, loader);
+                         classes.putIfAbsent(cls.getSimpleName().toLowerCase(Locale.ROOT), cls);
+                     } catch (ClassNotFoundException | LinkageError e) {
+                         // Not loadable on its own; calls naming it report "unknown class"
+                     }
+                 });
+        }
+    }
+
+    public static void main(String[] args) throws IOException {
+        if (args.length != 4) {
+            System.err.println("usage: MethodHarness build-dir calls.txt results.jsonl timeout-ms");
+            System.exit(2);
+        }
+        MethodHarness harness = new MethodHarness(Paths.get(args[0]), Long.parseLong(args[3]));
+        List<String> lines = Files.readAllLines(Paths.get(args[1]), StandardCharsets.UTF_8);
+
+        PrintStream stdout = System.out;
+        System.setOut(new PrintStream(OutputStream.nullOutputStream()));
+        System.setIn(new ByteArrayInputStream(new byte[0]));
+        try (BufferedWriter out = Files.newBufferedWriter(Paths.get(args[2]), StandardCharsets.UTF_8)) {
+            for (String line : lines) {
+                if (line.isEmpty()) {
+                    continue;
+                }
+                String[] parts = line.split("\t", -1);
+                if (parts.length < 2) {
+                    continue;
+                }
+                StringBuilder json = new StringBuilder("{\"id\":");
+                Json.string(json, parts[1]);
+                boolean finished = harness.run(parts, json);
+                out.write(json.append('}').toString());
+                out.newLine();
+                out.flush();
+                if (!finished) {
+                    break;
+                }
+            }
+        } finally {
+            System.setOut(stdout);
+        }
+        // The student thread may still be running after a timeout
+        System.exit(0);
+    }
+
+    /** Appends the outcome of one line to json; false if the batch must stop. */
+    private boolean run(String[] parts, StringBuilder json) {
+        Callable<Object> task;
+        try {
+            task = prepare(parts);
+        } catch (IllegalArgumentException e) {
+            json.append(",\"ok\":false,\"unresolved\":true,\"error\":");
+            Json.string(json, e.getMessage());
+            return true;
+        }
+        Future<Object> future = executor.submit(task);
+        try {
+            Object value = future.get(timeoutMillis, TimeUnit.MILLISECONDS);
+            if (parts[0].equals("new")) {
+                objects.put(parts[1], value);
+                value = value.getClass().getSimpleName();
+            }
+            json.append(",\"ok\":true,\"text\":");
+            Json.string(json, String.valueOf(value));
+            if (value instanceof Number) {
+                double number = ((Number) value).doubleValue();
+                if (!Double.isNaN(number) && !Double.isInfinite(number)) {
+                    json.append(",\"number\":").append(number);
+                }
+            } else if (value instanceof Character) {
+                json.append(",\"number\":").append((int) (Character) value);
+            }
+            return true;
+        } catch (TimeoutException e) {
+            future.cancel(true);
+            json.append(",\"ok\":false,\"error\":");
+            Json.string(json, "timed out after " + timeoutMillis + " ms");
+            return false;
+        } catch (ExecutionException e) {
+            Throwable cause = e.getCause();
+            if (cause instanceof InvocationTargetException && cause.getCause() != null) {
+                cause = cause.getCause();
+            }
+            json.append(",\"ok\":false,\"error\":");
+            Json.string(json, describe(cause));
+            return true;
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return false;
+        }
+    }
+
+    private static String describe(Throwable t) {
+        String message = t.getMessage();
+        return t.getClass().getSimpleName() + (message == null ? "" : ": " + message);
+    }
+
+    /** Resolves the class or method and arguments of one line, without running student code. */
+    private Callable<Object> prepare(String[] parts) {
+        if (parts[0].equals("new") && parts.length >= 3) {
+            Class<?> cls = classes.get(parts[2].toLowerCase(Locale.ROOT));
+            if (cls == null) {
+                throw new IllegalArgumentException("unknown class " + parts[2]);
+            }
+            Object[] args = arguments(parts, 3);
+            Constructor<?> constructor = (Constructor<?>) select(constructors(cls), args, "constructor " + parts[2]);
+            Object[] converted = convert(constructor, args);
+            return () -> constructor.newInstance(converted);
+        }
+        if (parts[0].equals("call") && parts.length >= 4) {
+            if (!objects.containsKey(parts[2])) {
+                throw new IllegalArgumentException("no object " + parts[2]);
+            }
+            Object target = objects.get(parts[2]);
+            Object[] args = arguments(parts, 4);
+            Method method = (Method) select(methods(target.getClass(), parts[3]), args, "method " + parts[3]);
+            Object[] converted = convert(method, args);
+            return () -> method.invoke(Modifier.isStatic(method.getModifiers()) ? null : target, converted);
+        }
+        throw new IllegalArgumentException("malformed line");
+    }
+
+    private Object[] arguments(String[] parts, int from) {
+        Object[] args = new Object[parts.length - from];
+        for (int i = from; i < parts.length; i++) {
+            String arg = parts[i];
+            if (arg.equals("null")) {
+                args[i - from] = null;
+            } else if (arg.startsWith("d:")) {
+                args[i - from] = Double.parseDouble(arg.substring(2));
+            } else if (arg.startsWith("i:")) {
+                args[i - from] = Long.parseLong(arg.substring(2));
+            } else if (arg.startsWith("b:")) {
+                args[i - from] = Boolean.parseBoolean(arg.substring(2));
+            } else if (arg.startsWith("s:")) {
+                args[i - from] = unescape(arg.substring(2));
+            } else if (arg.startsWith("ref:")) {
+                String id = arg.substring(4);
+                if (!objects.containsKey(id)) {
+                    throw new IllegalArgumentException("no object " + id);
+                }
+                args[i - from] = objects.get(id);
+            } else {
+                throw new IllegalArgumentException("bad argument " + arg);
+            }
+        }
+        return args;
+    }
+
+    private static String unescape(String s) {
+        StringBuilder out = new StringBuilder(s.length());
+        for (int i = 0; i < s.length(); i++) {
+            char c = s.charAt(i);
+            if (c == '\\' && i + 1 < s.length()) {
+                char next = s.charAt(++i);
+                out.append(next == 't' ? '\t' : next == 'n' ? '\n' : next);
+            } else {
+                out.append(c);
+            }
+        }
+        return out.toString();
+    }
+
+    private static List<Executable> constructors(Class<?> cls) {
+        List<Executable> found = new ArrayList<>();
+        for (Constructor<?> c : cls.getDeclaredConstructors()) {
+            found.add(c);
+        }
+        return found;
+    }
+
+    /** Methods named name on cls and its superclasses; an exact-case match hides the others. */
+    private static List<Executable> methods(Class<?> cls, String name) {
+        List<Executable> exact = new ArrayList<>();
+        List<Executable> anyCase = new ArrayList<>();
+        for (Class<?> c = cls; c != null && c != Object.class; c = c.getSuperclass()) {
+            for (Method m : c.getDeclaredMethods()) {
+                if (m.isBridge() || m.isSynthetic()) {
+                    continue;
+                }
+                if (m.getName().equals(name)) {
+                    exact.add(m);
+                } else if (m.getName().equalsIgnoreCase(name)) {
+                    anyCase.add(m);
+                }
+            }
+        }
+        if (exact.isEmpty() && anyCase.isEmpty() && name.equals("toString")) {
+            try {
+                exact.add(Object.class.getMethod("toString"));
+            } catch (NoSuchMethodException e) {
+                throw new IllegalStateException(e);
+            }
+        }
+        return exact.isEmpty() ? anyCase : exact;
+    }
+
+    /** The first (most derived) candidate whose parameters accept args. */
+    private static Executable select(List<Executable> candidates, Object[] args, String what) {
+        for (Executable e : candidates) {
+            if (accepts(e.getParameterTypes(), args)) {
+                try {
+                    e.setAccessible(true);
+                } catch (RuntimeException inaccessible) {
+                    continue;
+                }
+                return e;
+            }
+        }
+        throw new IllegalArgumentException("no " + what + " taking " + args.length + " matching argument(s)");
+    }
+
+    private static boolean accepts(Class<?>[] types, Object[] args) {
+        if (types.length != args.length) {
+            return false;
+        }
+        for (int i = 0; i < types.length; i++) {
+            if (!accepts(types[i], args[i])) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    private static boolean accepts(Class<?> type, Object arg) {
+        if (arg == null) {
+            return !type.isPrimitive();
+        }
+        if (arg instanceof Long) {
+            return type == int.class || type == long.class || type == double.class || type == float.class
+                || type == short.class || type == Integer.class || type == Long.class
+                || type == Double.class || type == Float.class || type == Object.class;
+        }
+        if (arg instanceof Double) {
+            return type == double.class || type == float.class || type == Double.class
+                || type == Float.class || type == Object.class;
+        }
+        if (arg instanceof Boolean) {
+            return type == boolean.class || type.isInstance(arg);
+        }
+        return type.isInstance(arg);
+    }
+
+    private static Object[] convert(Executable e, Object[] args) {
+        Class<?>[] types = e.getParameterTypes();
+        Object[] converted = new Object[args.length];
+        for (int i = 0; i < args.length; i++) {
+            converted[i] = convert(types[i], args[i]);
+        }
+        return converted;
+    }
+
+    private static Object convert(Class<?> type, Object arg) {
+        if (!(arg instanceof Number)) {
+            return arg;
+        }
+        Number n = (Number) arg;
+        if (type == int.class || type == Integer.class) {
+            return n.intValue();
+        }
+        if (type == long.class || type == Long.class) {
+            return n.longValue();
+        }
+        if (type == short.class) {
+            return n.shortValue();
+        }
+        if (type == float.class || type == Float.class) {
+            return n.floatValue();
+        }
+        if (type == double.class || type == Double.class) {
+            return n.doubleValue();
+        }
+        return arg;
+    }
+}
@@ -1,120 +1,260 @@
 """Java AST analysis utilities using javalang."""
 
+import copy
+import functools
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional, Set
+import time
+from typing import Dict, List, Optional
+
+from framework.declaration_scanner import scan_declarations
+from framework.java_declarations import ClassInfo, ConstructorInfo, FieldInfo, MethodInfo
+from framework.javac_summary import summary_declarations
+from framework.source_probes import ProbeHits, ProbeSet
 
 try:
     import javalang
 except ImportError:
     javalang = None
 
+# Where declarations come from:
+#   javalang - full expression-level parse, then index the tree
+#   scanner  - token-level declaration scan; the full tree is parsed only on demand
+#   javac    - declarations recorded by javac during compilation (see javac_summary);
+#              files javac did not summarize are parsed with javalang
+BACKENDS = ('javalang', 'scanner', 'javac')
+DEFAULT_BACKEND = 'javalang'
+
+# Wall-clock seconds a single javalang parse may take before it is abandoned
+DEFAULT_PARSE_BUDGET = 10.0
+TIMED_OUT = "timed out"
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled(pattern: str, flags: int):
+    return re.compile(pattern, flags)
+
+
+class ParseTimeout(Exception):
+    """Raised from inside the javalang parser when its budget runs out."""
+
+
+if javalang is not None:
+    class _BudgetedTokens(javalang.util.LookAheadListIterator):
+        """
+        The parser's token stream with a cooperative deadline. javalang
+        consumes every token through next(), including the tokens it re-reads
+        after backtracking, so checking the clock every few thousand reads
+        bounds the parse without a worker thread or process.
+        """
+
+        CHECK_EVERY = 2048
+
+        def __init__(self, tokens, seconds: float):
+            self._expires = time.monotonic() + seconds
+            super().__init__(self._timed(tokens))
+            self.set_default(javalang.parser.EndOfInput(None))
+            self._countdown = self.CHECK_EVERY
+
+        def _timed(self, tokens):
+            """Apply the same deadline while the lexer produces the token list."""
+            for n, token in enumerate(tokens, 1):
+                if not n % self.CHECK_EVERY and time.monotonic() > self._expires:
+                    raise ParseTimeout(TIMED_OUT)
+                yield token
 
-@dataclass
-class FieldInfo:
-    name: str
-    type_name: str
-    modifiers: Set[str] = field(default_factory=set)
+        def __next__(self):
+            self._countdown -= 1
+            if not self._countdown:
+                if time.monotonic() > self._expires:
+                    raise ParseTimeout(TIMED_OUT)
+                self._countdown = self.CHECK_EVERY
+            return super().__next__()
 
 
-@dataclass
-class MethodInfo:
-    name: str
-    return_type: str
-    param_types: List[str] = field(default_factory=list)
-    modifiers: Set[str] = field(default_factory=set)
+def _type_name(type_node) -> str:
+    return type_node.name if type_node else ""
 
 
-@dataclass
-class ConstructorInfo:
-    param_types: List[str] = field(default_factory=list)
-    modifiers: Set[str] = field(default_factory=set)
+def _param_types(node) -> List[str]:
+    return [_type_name(p.type) for p in (node.parameters or [])]
 
 
 class JavaASTAnalyzer:
-    """Wraps javalang for convenient Java source analysis."""
+    """
+    Wraps javalang for convenient Java source analysis.
+    Declarations are collected once into a per-class index and every query
+    is answered from it. With the default 'javalang' backend the index comes
+    from a full parse; the 'scanner' backend reads declarations straight from
+    the token stream and skips method bodies. Either way the javalang tree is
+    available on demand through .tree for body-level checks. Pass
+    keep_tree=False to release the tree after indexing.
 
-    def __init__(self, source_code: str):
+    When javalang cannot parse the file (unsupported syntax, malformed
+    code) the index comes from the scanner instead, which accepts any input
+    in linear time; parse_error keeps javalang's message. A parse that runs
+    longer than parse_budget seconds (or recurses too deeply) is abandoned
+    the same way with parse_error "timed out". parse_budget=None disables
+    the limit.
+
+    With the 'javac' backend, summary is the compilation unit summary javac
+    wrote for this file; it replaces the Python parse entirely.
+    """
+
+    def __init__(self, source_code: str, keep_tree: bool = True, backend: str = DEFAULT_BACKEND,
+                 parse_budget: Optional[float] = DEFAULT_PARSE_BUDGET, summary: Optional[dict] = None):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown analyzer backend '{backend}'")
         self.source = source_code
         self.all_source = source_code  # Can be set to combined source of all files
-        self.tree = None
+        self.backend = backend
+        self.parse_budget = parse_budget
         self.parse_error = None
-        self._try_parse()
+        self.tree_error = None
+        self._tree = None
+        self._tree_attempted = False
+        self._package = ""
+        self._classes: Dict[str, ClassInfo] = {}
+        self._probe_hits: Dict[int, ProbeHits] = {}
+
+        if backend == 'javac' and summary is not None:
+            self._package, self._classes = summary_declarations(summary)
+        elif backend == 'scanner':
+            self._scan()
+        else:
+            self.parse_error = self._try_parse()
+            if self._tree is not None:
+                self._build_index()
+                if not keep_tree:
+                    self._tree = None
+                    self._tree_attempted = False
+            else:
+                self._scan()
 
-    def _try_parse(self):
+    def _try_parse(self) -> Optional[str]:
+        """Full javalang parse into self._tree; returns the error message on failure."""
+        self._tree_attempted = True
         if javalang is None:
-            self.parse_error = "javalang not installed"
-            return
-        try:
-            self.tree = javalang.parse.parse(self.source)
-        except Exception as e:
-            self.parse_error = str(e)
+            self.tree_error = "javalang not installed"
+        else:
+            try:
+                self._tree = self._parse()
+            except (ParseTimeout, RecursionError):
+                self.tree_error = TIMED_OUT
+            except Exception as e:
+                self.tree_error = str(e)
+        return self.tree_error
+
+    def _parse(self):
+        if not self.parse_budget:
+            return javalang.parse.parse(self.source)
+        parser = javalang.parser.Parser([])
+        parser.tokens = _BudgetedTokens(javalang.tokenizer.tokenize(self.source), self.parse_budget)
+        return parser.parse()
+
+    def _scan(self):
+        self._package, self._classes = scan_declarations(self.source)
 
     @property
-    def parsed(self) -> bool:
-        return self.tree is not None
+    def tree(self):
+        """The full javalang tree, parsed on first access if the backend did not need it."""
+        if self._tree is None and not self._tree_attempted:
+            self._try_parse()
+        return self._tree
 
-    def get_class_names(self) -> List[str]:
-        if not self.parsed:
-            return self._regex_class_names()
-        names = []
-        for _, node in self.tree:
-            if isinstance(node, javalang.tree.ClassDeclaration):
-                names.append(node.name)
-        return names
+    # --- Index ---
 
-    def get_fields(self, class_name: str = None) -> List[FieldInfo]:
-        if not self.parsed:
-            return self._regex_fields()
-        fields = []
-        for _, node in self.tree:
-            if isinstance(node, javalang.tree.FieldDeclaration):
-                modifiers = set(node.modifiers) if node.modifiers else set()
-                type_name = node.type.name if node.type else ""
-                for decl in node.declarators:
-                    fields.append(FieldInfo(
+    def _build_index(self):
+        """Walk the declaration tree once, recording members per type in source order."""
+        self._classes = {}
+        self._package = self._tree.package.name if self._tree.package else ""
+        for type_decl in self._tree.types:
+            self._index_type(type_decl)
+
+    def _index_type(self, node, outer: Optional[str] = None):
+        tree = javalang.tree
+        if isinstance(node, tree.ClassDeclaration):
+            info = ClassInfo(
+                name=node.name, kind="class",
+                extends=_type_name(node.extends) or None,
+                implements=[_type_name(t) for t in (node.implements or [])]
+            )
+            body = node.body or []
+        elif isinstance(node, tree.InterfaceDeclaration):
+            info = ClassInfo(name=node.name, kind="interface",
+                             implements=[_type_name(t) for t in (node.extends or [])])
+            body = node.body or []
+        elif isinstance(node, tree.EnumDeclaration):
+            info = ClassInfo(name=node.name, kind="enum",
+                             implements=[_type_name(t) for t in (node.implements or [])])
+            body = (node.body.declarations or []) if node.body else []
+        else:
+            return
+        # Register before members so nested types follow their outer type
+        info.outer = outer
+        self._classes.setdefault(info.qualified_name, info)
+
+        for member in body:
+            modifiers = set(member.modifiers) if getattr(member, 'modifiers', None) else set()
+            if isinstance(member, tree.FieldDeclaration):
+                for decl in member.declarators:
+                    info.fields.append(FieldInfo(
                         name=decl.name,
-                        type_name=type_name,
+                        type_name=_type_name(member.type),
                         modifiers=modifiers
                     ))
-        return fields
-
-    def get_methods(self, class_name: str = None) -> List[MethodInfo]:
-        if not self.parsed:
-            return self._regex_methods()
-        methods = []
-        for _, node in self.tree:
-            if isinstance(node, javalang.tree.MethodDeclaration):
-                modifiers = set(node.modifiers) if node.modifiers else set()
-                ret_type = node.return_type.name if node.return_type else "void"
-                param_types = []
-                if node.parameters:
-                    for p in node.parameters:
-                        param_types.append(p.type.name if p.type else "")
-                methods.append(MethodInfo(
-                    name=node.name,
-                    return_type=ret_type,
-                    param_types=param_types,
+            elif isinstance(member, tree.MethodDeclaration):
+                info.methods.append(MethodInfo(
+                    name=member.name,
+                    return_type=member.return_type.name if member.return_type else "void",
+                    param_types=_param_types(member),
                     modifiers=modifiers
                 ))
-        return methods
-
-    def get_constructors(self, class_name: str = None) -> List[ConstructorInfo]:
-        if not self.parsed:
-            return self._regex_constructors()
-        constructors = []
-        for _, node in self.tree:
-            if isinstance(node, javalang.tree.ConstructorDeclaration):
-                modifiers = set(node.modifiers) if node.modifiers else set()
-                param_types = []
-                if node.parameters:
-                    for p in node.parameters:
-                        param_types.append(p.type.name if p.type else "")
-                constructors.append(ConstructorInfo(
-                    param_types=param_types,
+            elif isinstance(member, tree.ConstructorDeclaration):
+                info.constructors.append(ConstructorInfo(
+                    param_types=_param_types(member),
                     modifiers=modifiers
                 ))
-        return constructors
+            else:
+                self._index_type(member, info.qualified_name)
+
+    def _class_infos(self, class_name: Optional[str]) -> List[ClassInfo]:
+        """
+        All indexed types, or the named one: by qualified name (Outer.Inner)
+        or top-level name, else every type with that simple name, else a
+        case-insensitive match.
+        """
+        if class_name is None:
+            return list(self._classes.values())
+        info = self._classes.get(class_name)
+        if info is not None:
+            return [info]
+        infos = [c for c in self._classes.values() if c.name == class_name]
+        if not infos:
+            lowered = class_name.lower()
+            info = next((c for c in self._classes.values() if c.name.lower() == lowered), None)
+            infos = [info] if info else []
+        return infos
+
+    def get_class_names(self) -> List[str]:
+        names = [c.name for c in self._classes.values() if c.kind in ("class", "record")]
+        return list(dict.fromkeys(names))
+
+    def get_class_info(self, class_name: str) -> Optional[ClassInfo]:
+        """Indexed declarations for one type, or None if not declared in this file."""
+        infos = self._class_infos(class_name)
+        return infos[0] if infos else None
+
+    def get_fields(self, class_name: str = None) -> List[FieldInfo]:
+        """Fields of the named class, or of every type in the file when class_name is None."""
+        return [f for c in self._class_infos(class_name) for f in c.fields]
+
+    def get_methods(self, class_name: str = None) -> List[MethodInfo]:
+        """Methods of the named class, or of every type in the file when class_name is None."""
+        return [m for c in self._class_infos(class_name) for m in c.methods]
+
+    def get_constructors(self, class_name: str = None) -> List[ConstructorInfo]:
+        """Constructors of the named class, or of every type in the file when class_name is None."""
+        return [k for c in self._class_infos(class_name) for k in c.constructors]
 
     def has_main_method(self) -> bool:
         for m in self.get_methods():
@@ -122,84 +262,37 @@ class JavaASTAnalyzer:
                 return True
         return bool(re.search(r'public\s+static\s+void\s+main\s*\(', self.source))
 
+    def with_all_source(self, all_source: str) -> 'JavaASTAnalyzer':
+        """A view sharing this analyzer's parse and index, with source_contains widened to all_source."""
+        view = copy.copy(self)
+        view.all_source = all_source
+        view._probe_hits = {}
+        return view
+
     def source_contains(self, pattern: str, flags=0) -> bool:
         """Search all source files (if set) for the given pattern."""
-        return bool(re.search(pattern, self.all_source, flags))
-
-    def get_parent_class(self) -> Optional[str]:
-        """Return the name of the parent class (extends clause), or None."""
-        if not self.parsed:
-            return self._regex_parent_class()
-        for _, node in self.tree:
-            if isinstance(node, javalang.tree.ClassDeclaration):
-                if node.extends:
-                    return node.extends.name
+        return _compiled(pattern, flags).search(self.all_source) is not None
+
+    def probe(self, probes: ProbeSet) -> ProbeHits:
+        """Hit map of an assignment's declared probes over all_source, shared across calls."""
+        hits = self._probe_hits.get(id(probes))
+        if hits is None:
+            hits = self._probe_hits[id(probes)] = probes.scan(self.all_source)
+        return hits
+
+    def get_parent_class(self, class_name: str = None) -> Optional[str]:
+        """
+        Return the name of the parent class (extends clause), or None.
+        Without class_name, returns the first extends clause in the file.
+        """
+        for info in self._class_infos(class_name):
+            if info.kind == "class" and info.extends:
+                return info.extends
         return None
 
+    def get_interfaces(self, class_name: str = None) -> List[str]:
+        """Interfaces implemented by the named class (or by any type in the file)."""
+        return [i for c in self._class_infos(class_name) for i in c.implements]
+
     def get_package(self) -> str:
-        if self.parsed and self.tree.package:
-            return self.tree.package.name
-        match = re.search(r'package\s+([\w.]+)\s*;', self.source)
-        return match.group(1) if match else ""
-
-    # --- Regex fallbacks ---
-
-    def _regex_class_names(self) -> List[str]:
-        return re.findall(r'(?:public\s+)?class\s+(\w+)', self.source)
-
-    def _regex_fields(self) -> List[FieldInfo]:
-        fields = []
-        pattern = r'((?:private|public|protected|static|final)\s+)*(\w+)\s+(\w+)\s*[;=]'
-        for match in re.finditer(pattern, self.source):
-            modifiers_str = match.group(1) or ""
-            modifiers = set(modifiers_str.split())
-            fields.append(FieldInfo(
-                name=match.group(3),
-                type_name=match.group(2),
-                modifiers=modifiers
-            ))
-        return fields
-
-    def _regex_methods(self) -> List[MethodInfo]:
-        methods = []
-        pattern = r'((?:public|private|protected|static|final)\s+)*([\w<>\[\]]+)\s+(\w+)\s*\(([^)]*)\)'
-        for match in re.finditer(pattern, self.source):
-            modifiers_str = match.group(1) or ""
-            modifiers = set(modifiers_str.split())
-            ret_type = match.group(2)
-            name = match.group(3)
-            params_str = match.group(4).strip()
-            param_types = []
-            if params_str:
-                for param in params_str.split(','):
-                    parts = param.strip().split()
-                    if len(parts) >= 2:
-                        param_types.append(parts[-2])
-            if name not in ('if', 'while', 'for', 'switch', 'catch'):
-                methods.append(MethodInfo(
-                    name=name,
-                    return_type=ret_type,
-                    param_types=param_types,
-                    modifiers=modifiers
-                ))
-        return methods
-
-    def _regex_parent_class(self) -> Optional[str]:
-        match = re.search(r'class\s+\w+\s+extends\s+(\w+)', self.source)
-        return match.group(1) if match else None
-
-    def _regex_constructors(self) -> List[ConstructorInfo]:
-        constructors = []
-        class_names = self._regex_class_names()
-        for cn in class_names:
-            pattern = rf'(?:public|private|protected)\s+{cn}\s*\(([^)]*)\)'
-            for match in re.finditer(pattern, self.source):
-                params_str = match.group(1).strip()
-                param_types = []
-                if params_str:
-                    for param in params_str.split(','):
-                        parts = param.strip().split()
-                        if len(parts) >= 2:
-                            param_types.append(parts[-2])
-                constructors.append(ConstructorInfo(param_types=param_types))
-        return constructors
+        return self._package
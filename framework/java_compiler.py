@@ -1,47 +1,56 @@
 """Java compilation and execution utilities."""
 
 import os
-import re
 import subprocess
 import shutil
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Optional, Union
+
+from framework.javac_summary import SUMMARY_FILE, load_summaries, summary_command
+from framework.source_bundle import SourceBundle
+from framework.workspace import Workspace
+
+# How sources are laid out for javac -sourcepath:
+#   auto - compile in place when files already sit in package-shaped dirs, else link
+#   link - hardlink (or symlink) each file into the workspace src/ tree
+#   copy - copy each file into the workspace src/ tree
+STAGING_MODES = ('auto', 'link', 'copy')
 
 
 class JavaCompiler:
-    """Compiles and runs Java source files, capturing output."""
+    """
+    Compiles and runs Java source files, capturing output.
+    With summarize=True, javac runs through the DeclarationSummary helper and
+    .summaries maps each original source path (resolved) to the declarations
+    javac parsed from it; it stays empty when the helper is unavailable.
+    """
 
-    def __init__(self, java_files: Union[Path, List[Path]], work_dir: Path):
+    def __init__(self, java_files: Union[Path, List[Path]], work_dir: Union[Path, Workspace],
+                 bundle: Optional[SourceBundle] = None, staging: str = 'auto',
+                 summarize: bool = False):
         if isinstance(java_files, Path):
             java_files = [java_files]
+        if staging not in STAGING_MODES:
+            raise ValueError(f"Unknown staging mode '{staging}'")
         self.java_files = java_files
-        self.work_dir = work_dir
-        self.build_dir = work_dir / "build"
-        self.build_dir.mkdir(parents=True, exist_ok=True)
+        self.workspace = work_dir if isinstance(work_dir, Workspace) else Workspace(work_dir)
+        self.work_dir = self.workspace.root
+        self.build_dir = self.workspace.build_dir
+        self.staging = staging
+        self.summarize = summarize
+        self.summaries: Dict[Path, dict] = {}
         self._file_info = []
-        self._analyze_files()
+        self._analyze_files(bundle or SourceBundle(java_files))
 
-    def _analyze_files(self):
+    def _analyze_files(self, bundle: SourceBundle):
+        """Record package/class/main facts; a shared bundle means no file is re-read."""
         for f in self.java_files:
-            source = f.read_text(errors='ignore')
-            pkg = self._detect_package(source)
-            cls = self._detect_class_name(source, f)
-            has_main = bool(re.search(r'public\s+static\s+void\s+main', source))
+            sf = bundle.get(f) or SourceBundle(f).files[0]
             self._file_info.append({
-                'file': f, 'package': pkg, 'class_name': cls,
-                'has_main': has_main
+                'file': f, 'package': sf.package, 'class_name': sf.class_name,
+                'has_main': sf.has_main
             })
 
-    @staticmethod
-    def _detect_package(source: str) -> str:
-        match = re.search(r'package\s+([\w.]+)\s*;', source)
-        return match.group(1) if match else ""
-
-    @staticmethod
-    def _detect_class_name(source: str, java_file: Path) -> str:
-        match = re.search(r'public\s+class\s+(\w+)', source)
-        return match.group(1) if match else java_file.stem
-
     @property
     def main_class_fqn(self) -> str:
         """Fully qualified name of the class with main()."""
@@ -56,32 +65,83 @@ class JavaCompiler:
             return f"{info['package']}.{info['class_name']}"
         return info['class_name']
 
-    def compile(self, timeout: int = 30) -> tuple:
+    def _in_place_source_root(self) -> Optional[Path]:
         """
-        Compile all Java files. Sets up package directory structure if needed.
-        Returns (success: bool, error_output: str).
+        The common source root if every file already sits in a directory
+        matching its package (the usual NetBeans src/ layout), else None.
         """
-        src_root = self.work_dir / "src"
-        src_root.mkdir(parents=True, exist_ok=True)
+        roots = set()
+        for info in self._file_info:
+            parent = info['file'].parent
+            pkg_parts = tuple(info['package'].split('.')) if info['package'] else ()
+            if pkg_parts:
+                if parent.parts[-len(pkg_parts):] != pkg_parts:
+                    return None
+                parent = parent.parents[len(pkg_parts) - 1]
+            roots.add(parent)
+        return roots.pop() if len(roots) == 1 else None
+
+    @staticmethod
+    def _link_or_copy(source: Path, target: Path, copy: bool = False):
+        """Stage a file by hardlink, falling back to symlink, then copy."""
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        if not copy:
+            try:
+                os.link(source, target)
+                return
+            except OSError:
+                pass
+            try:
+                os.symlink(source.resolve(), target)
+                return
+            except OSError:
+                pass
+        shutil.copy2(source, target)
 
+    def stage_sources(self) -> tuple:
+        """
+        Lay out sources so javac -sourcepath resolves packages.
+        Returns (source_root, files_to_compile). No bytes are copied unless
+        staging is 'copy' or the filesystem supports neither kind of link.
+        """
+        if self.staging == 'auto':
+            in_place_root = self._in_place_source_root()
+            if in_place_root is not None:
+                return in_place_root, [info['file'] for info in self._file_info]
+
+        src_root = self.workspace.src_dir
         target_files = []
         for info in self._file_info:
             if info['package']:
-                pkg_dir = src_root / info['package'].replace('.', os.sep)
-                pkg_dir.mkdir(parents=True, exist_ok=True)
+                pkg_dir = self.workspace.ensure_dir(src_root / info['package'].replace('.', os.sep))
                 target = pkg_dir / info['file'].name
             else:
                 target = src_root / info['file'].name
-            shutil.copy2(info['file'], target)
+            self._link_or_copy(info['file'], target, copy=self.staging == 'copy')
             target_files.append(target)
+        return src_root, target_files
 
-        cmd = ["javac", "-d", str(self.build_dir), "-sourcepath", str(src_root)]
-        cmd.extend(str(t) for t in target_files)
+    def compile(self, timeout: int = 30) -> tuple:
+        """
+        Compile all Java files. Sets up package directory structure if needed.
+        Returns (success: bool, error_output: str).
+        """
+        src_root, target_files = self.stage_sources()
+
+        javac_args = ["-d", str(self.build_dir), "-sourcepath", str(src_root)]
+        javac_args.extend(str(t) for t in target_files)
+        summary_path = self.build_dir / SUMMARY_FILE
+        cmd = summary_command(summary_path, javac_args) if self.summarize else None
+        if cmd is None:
+            cmd = ["javac"] + javac_args
 
         try:
             result = subprocess.run(
                 cmd, capture_output=True, text=True, timeout=timeout
             )
+            if cmd[0] != "javac":
+                self._collect_summaries(summary_path, target_files)
             return (result.returncode == 0, result.stderr)
         except subprocess.TimeoutExpired:
             return (False, "Compilation timed out")
@@ -90,9 +150,19 @@ class JavaCompiler:
         except Exception as e:
             return (False, str(e))
 
+    def _collect_summaries(self, summary_path: Path, target_files: List[Path]):
+        """Re-key the helper's summaries from staged paths to the original files."""
+        by_staged = load_summaries(summary_path)
+        for info, target in zip(self._file_info, target_files):
+            unit = by_staged.get(target.resolve())
+            if unit is not None:
+                self.summaries[info['file'].resolve()] = unit
+
     def run(self, timeout: int = 10) -> tuple:
         """
-        Run the compiled main class and capture stdout.
+        Run the compiled main class and capture stdout. The program's stdin
+        is empty, so a read sees end of input at once instead of waiting on
+        the grader's terminal.
         Returns (success: bool, stdout_output: str).
         """
         cmd = [
@@ -103,7 +173,7 @@ class JavaCompiler:
 
         try:
             result = subprocess.run(
-                cmd, capture_output=True, text=True, timeout=timeout
+                cmd, capture_output=True, text=True, timeout=timeout, stdin=subprocess.DEVNULL
             )
             if result.returncode == 0:
                 return (True, result.stdout)
@@ -0,0 +1,42 @@
+"""Declaration records shared by every Java analyzer backend."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+
+@dataclass
+class FieldInfo:
+    name: str
+    type_name: str
+    modifiers: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class MethodInfo:
+    name: str
+    return_type: str
+    param_types: List[str] = field(default_factory=list)
+    modifiers: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ConstructorInfo:
+    param_types: List[str] = field(default_factory=list)
+    modifiers: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ClassInfo:
+    name: str
+    kind: str = "class"  # class, interface, enum or record
+    extends: Optional[str] = None
+    implements: List[str] = field(default_factory=list)
+    fields: List[FieldInfo] = field(default_factory=list)
+    methods: List[MethodInfo] = field(default_factory=list)
+    constructors: List[ConstructorInfo] = field(default_factory=list)
+    outer: Optional[str] = None  # Qualified name of the enclosing type, for member types
+
+    @property
+    def qualified_name(self) -> str:
+        """Name within its file: Outer.Inner for member types, so two nested Nodes stay apart."""
+        return f"{self.outer}.{self.name}" if self.outer else self.name
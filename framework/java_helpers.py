@@ -0,0 +1,72 @@
+"""Java helper programs shipped in framework/java/, compiled once and cached by source hash."""
+
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+from framework.utils import cache_dir
+
+HELPER_DIR = Path(__file__).parent / "java"
+# Compiled into every helper's classpath alongside the helper itself
+SHARED_SOURCES = ("Json.java",)
+
+_classpaths: Dict[str, Optional[Path]] = {}
+_errors: Dict[str, str] = {}
+
+
+def helper_classpath(class_name: str, timeout: int = 60) -> Optional[Path]:
+    """
+    Directory holding the compiled helper, or None if it cannot be built.
+    Each helper is compiled once into a directory of the private cache
+    (see framework.utils.cache_dir) named after a hash of its source, so
+    later runs (and later students) reuse it. The SHARED_SOURCES are
+    compiled (and hashed) with it.
+    """
+    if class_name in _classpaths:
+        return _classpaths[class_name]
+
+    sources = [HELPER_DIR / f"{class_name}.java"] + [HELPER_DIR / name for name in SHARED_SOURCES]
+    hasher = hashlib.sha256()
+    for source in sources:
+        hasher.update(source.read_bytes())
+    digest = hasher.hexdigest()[:16]
+    cache_root = cache_dir()
+    classpath = cache_root / f"{class_name}_{digest}"
+    class_file = classpath / f"{class_name}.class"
+    if not class_file.exists():
+        # Built next to the cache so the finished build can be renamed into place
+        build_dir = Path(tempfile.mkdtemp(prefix=f"{class_name}_", dir=cache_root))
+        try:
+            result = subprocess.run(
+                ["javac", "-d", str(build_dir)] + [str(source) for source in sources],
+                capture_output=True, text=True, timeout=timeout
+            )
+            if result.returncode != 0:
+                _errors[class_name] = result.stderr or "javac failed"
+                _classpaths[class_name] = None
+                return None
+            try:
+                os.replace(build_dir, classpath)
+            except OSError:
+                # Another grader process cached it first, or something else is in the way
+                pass
+            if not class_file.exists():
+                classpath = build_dir  # Use this run's build rather than an unusable cache entry
+        except (OSError, subprocess.TimeoutExpired) as e:
+            _errors[class_name] = str(e)
+            _classpaths[class_name] = None
+            return None
+        finally:
+            if classpath != build_dir:
+                shutil.rmtree(build_dir, ignore_errors=True)
+    _classpaths[class_name] = classpath
+    return classpath
+
+
+def helper_error(class_name: str) -> Optional[str]:
+    """Why the helper could not be built, if it could not."""
+    return _errors.get(class_name)
@@ -0,0 +1,48 @@
+"""Declaration summaries emitted by javac itself through the DeclarationSummary helper."""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from framework.java_declarations import ClassInfo, ConstructorInfo, FieldInfo, MethodInfo
+from framework.java_helpers import helper_classpath
+
+HELPER_CLASS = "DeclarationSummary"
+SUMMARY_FILE = "declarations.json"
+
+
+def load_summaries(summary_path: Path) -> Dict[Path, dict]:
+    """Resolved source path -> compilation unit summary; empty if javac wrote none."""
+    try:
+        units = json.loads(summary_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return {Path(unit["path"]).resolve(): unit for unit in units}
+
+
+def summary_declarations(unit: dict) -> Tuple[str, Dict[str, ClassInfo]]:
+    """(package, {qualified type name: ClassInfo}) from one compilation unit summary."""
+    classes: Dict[str, ClassInfo] = {}
+    for t in unit.get("types", []):
+        info = ClassInfo(
+            name=t["name"], kind=t["kind"], outer=t.get("outer"),
+            extends=t.get("extends"),
+            implements=list(t.get("implements", [])),
+            fields=[FieldInfo(name=f["name"], type_name=f["type"], modifiers=set(f["modifiers"]))
+                    for f in t.get("fields", [])],
+            methods=[MethodInfo(name=m["name"], return_type=m["return_type"],
+                                param_types=list(m["params"]), modifiers=set(m["modifiers"]))
+                     for m in t.get("methods", [])],
+            constructors=[ConstructorInfo(param_types=list(c["params"]), modifiers=set(c["modifiers"]))
+                          for c in t.get("constructors", [])]
+        )
+        classes.setdefault(info.qualified_name, info)
+    return unit.get("package", ""), classes
+
+
+def summary_command(summary_path: Path, javac_args: List[str]) -> Optional[List[str]]:
+    """Command running javac through the helper, or None if the helper is unavailable."""
+    classpath = helper_classpath(HELPER_CLASS)
+    if classpath is None:
+        return None
+    return ["java", "-cp", str(classpath), HELPER_CLASS, str(summary_path)] + javac_args
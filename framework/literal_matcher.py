@@ -0,0 +1,63 @@
+"""Fixed-literal search over program output, declared once per assignment."""
+
+from typing import Dict, Iterable, List
+
+
+class LiteralMatcher:
+    """
+    The expected literals an assignment looks for in student output, e.g.
+
+        LITERALS = LiteralMatcher(literals=[VIN, STREET],
+                                  ignore_case=["car loan", "mortgage"])
+
+    scan() lowercases the output once and returns every occurrence of every
+    literal, overlapping ones included. Each literal is located with
+    str.find, which runs in C; a pure-Python Aho-Corasick automaton visits
+    every character in the interpreter and is about ten times slower on
+    outputs of the size students produce.
+    """
+
+    def __init__(self, literals: Iterable[str] = (), ignore_case: Iterable[str] = ()):
+        self.literals: List[str] = list(dict.fromkeys(literals))
+        self.ignore_case: List[str] = list(dict.fromkeys(lit.lower() for lit in ignore_case))
+        overlap = set(self.literals) & set(self.ignore_case)
+        if overlap:
+            raise ValueError(f"Literals declared both case-sensitive and -insensitive: {sorted(overlap)}")
+        if not all(self.literals) or not all(self.ignore_case):
+            raise ValueError("Empty literal")
+
+    def scan(self, text: str) -> 'LiteralHits':
+        positions: Dict[str, List[int]] = {}
+        for haystack, literals in ((text, self.literals), (text.lower(), self.ignore_case)):
+            for literal in literals:
+                found = []
+                i = haystack.find(literal)
+                while i >= 0:
+                    found.append(i)
+                    i = haystack.find(literal, i + 1)
+                positions[literal] = found
+        return LiteralHits(positions)
+
+
+class LiteralHits:
+    """Start offsets of every declared literal in one text."""
+
+    def __init__(self, positions: Dict[str, List[int]]):
+        self._positions = positions
+
+    def _key(self, literal: str) -> str:
+        if literal in self._positions:
+            return literal
+        if literal.lower() in self._positions:
+            return literal.lower()
+        raise KeyError(f"Literal '{literal}' was not declared to the matcher")
+
+    def positions(self, literal: str) -> List[int]:
+        return self._positions[self._key(literal)]
+
+    def __contains__(self, literal: str) -> bool:
+        """Whether the literal occurs at least once (case-insensitive ones match any case)."""
+        return bool(self._positions[self._key(literal)])
+
+    def count(self, literal: str) -> int:
+        return len(self.positions(literal))
@@ -0,0 +1,121 @@
+"""Direct calls into a student's compiled classes, batched into one JVM launch by the MethodHarness helper."""
+
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from framework.java_helpers import helper_classpath
+
+HELPER_CLASS = "MethodHarness"
+CALLS_FILE = "method_calls.txt"
+RESULTS_FILE = "method_results.jsonl"
+
+
+@dataclass(frozen=True)
+class ObjectRef:
+    """An object constructed earlier in the same batch."""
+    id: str
+
+
+@dataclass
+class CallResult:
+    """What one constructor or method call returned, or why it failed."""
+    ok: bool
+    text: Optional[str] = None  # String.valueOf of the returned value
+    number: Optional[float] = None  # Set for finite numeric returns
+    error: Optional[str] = None
+    unresolved: bool = False  # Never reached student code (no such class, method or object)
+
+
+Argument = Union[None, bool, int, float, str, ObjectRef]
+
+
+def _encode(arg: Argument) -> str:
+    if arg is None:
+        return "null"
+    if isinstance(arg, ObjectRef):
+        return f"ref:{arg.id}"
+    if isinstance(arg, bool):
+        return f"b:{'true' if arg else 'false'}"
+    if isinstance(arg, int):
+        return f"i:{arg}"
+    if isinstance(arg, float):
+        return f"d:{arg!r}"
+    if isinstance(arg, str):
+        escaped = arg.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+        return f"s:{escaped}"
+    raise TypeError(f"Unsupported harness argument {arg!r}")
+
+
+class MethodBatch:
+    """
+    Calls to run against one student's classes, e.g.
+
+        batch = MethodBatch()
+        loan = batch.new("CarLoan", 25000.0, 4.25, 72, "IRQ3458977")
+        payment = batch.call(loan, "calculateMonthlyPayment")
+        results = run_batch(compiler.build_dir, batch)
+        results[payment].number  # 393.98...
+
+    Calls run in the order they were added. A call on an object whose
+    construction failed fails too, so the whole batch can be declared up front.
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.lines)
+
+    def _add(self, kind: str, fields: List[str]) -> str:
+        call_id = f"c{len(self.lines)}"
+        self.lines.append("\t".join([kind, call_id] + fields))
+        return call_id
+
+    def new(self, class_name: str, *args: Argument) -> ObjectRef:
+        return ObjectRef(self._add("new", [class_name] + [_encode(a) for a in args]))
+
+    def call(self, target: ObjectRef, method: str, *args: Argument) -> str:
+        return self._add("call", [target.id, method] + [_encode(a) for a in args])
+
+
+def run_batch(build_dir: Path, batch: MethodBatch, timeout: int = 20,
+              call_timeout_ms: int = 2000) -> Optional[Dict[str, CallResult]]:
+    """
+    Run every call of the batch in a single JVM against the classes in
+    build_dir. Returns call id -> result; ids missing from it were never
+    reached (the JVM exited or a call timed out first). None when the
+    helper cannot be built or java cannot be run.
+    """
+    classpath = helper_classpath(HELPER_CLASS)
+    if classpath is None or not batch.lines:
+        return None
+    calls_path = Path(build_dir) / CALLS_FILE
+    results_path = Path(build_dir) / RESULTS_FILE
+    calls_path.write_text("\n".join(batch.lines) + "\n", encoding="utf-8")
+    results_path.unlink(missing_ok=True)
+    cmd = ["java", "-cp", str(classpath), HELPER_CLASS,
+           str(build_dir), str(calls_path), str(results_path), str(call_timeout_ms)]
+    try:
+        subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        pass  # Keep whatever was written before the JVM was killed
+    except OSError:
+        return None
+
+    results: Dict[str, CallResult] = {}
+    try:
+        lines = results_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        return results
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            break  # Cut off mid-write
+        results[entry["id"]] = CallResult(ok=entry["ok"], text=entry.get("text"),
+                                          number=entry.get("number"), error=entry.get("error"),
+                                          unresolved=entry.get("unresolved", False))
+    return results
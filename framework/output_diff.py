@@ -0,0 +1,161 @@
+"""Line diff of expected vs actual program output, bounded in cost for the report."""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+
+# Lines compared per side; the rest of a longer output is left out of the diff
+MAX_LINES = 5000
+# Edit distance (lines inserted + deleted) searched for before giving up
+# on an exact diff of the differing middle
+MAX_EDITS = 400
+
+# (tag, i1, i2, j1, j2) with difflib's tags and meaning: expected lines
+# i1:i2 become actual lines j1:j2
+Opcode = Tuple[str, int, int, int, int]
+
+
+def normalize_line(line: str) -> str:
+    """Whitespace runs collapse to one space; leading and trailing whitespace is ignored."""
+    return " ".join(line.split())
+
+
+def diff_lines(text: str) -> List[str]:
+    """The lines a diff compares (and opcode indices refer to), without trailing blank lines."""
+    lines = text.splitlines()
+    while lines and not lines[-1].strip():
+        lines.pop()
+    return lines
+
+
+@dataclass
+class OutputDiff:
+    """
+    Opcodes covering every compared line of both outputs. `approximate`
+    means the outputs needed more than MAX_EDITS line edits, so everything
+    between their common prefix and suffix is one replace block;
+    `truncated` means an output had more than MAX_LINES lines and only the
+    first MAX_LINES were compared.
+    """
+    opcodes: List[Opcode] = field(default_factory=list)
+    approximate: bool = False
+    truncated: bool = False
+
+    @property
+    def identical(self) -> bool:
+        return all(tag == 'equal' for tag, *_ in self.opcodes)
+
+    @property
+    def changed_lines(self) -> Tuple[int, int]:
+        """(expected lines missing, actual lines unexpected)."""
+        removed = sum(i2 - i1 for tag, i1, i2, _, _ in self.opcodes if tag != 'equal')
+        added = sum(j2 - j1 for tag, _, _, j1, j2 in self.opcodes if tag != 'equal')
+        return removed, added
+
+
+def _matches(a: Sequence[int], b: Sequence[int], max_edits: int):
+    """
+    Matched (i, j) index pairs of a shortest edit script (Myers' O((N+M)D)
+    algorithm), or None when more than max_edits edits are needed.
+    """
+    n, m = len(a), len(b)
+    offset = n + m + 1
+    v = [0] * (2 * offset + 1)
+    trace = []
+    for d in range(min(n + m, max_edits) + 1):
+        trace.append(v[offset - d:offset + d + 1])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m, d)
+    return None
+
+
+def _backtrack(trace, x: int, y: int, edits: int) -> List[Tuple[int, int]]:
+    pairs = []
+    for d in range(edits, 0, -1):
+        # trace[d] holds the furthest x per diagonal after d - 1 edits, starting at k = -d
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1 + d] < v[k + 1 + d]):
+            prev_k = k + 1
+            prev_x = v[prev_k + d]
+            snake_start = prev_x  # Inserted b[prev_y], then matched
+        else:
+            prev_k = k - 1
+            prev_x = v[prev_k + d]
+            snake_start = prev_x + 1  # Deleted a[prev_x], then matched
+        prev_y = prev_x - prev_k
+        while x > snake_start:
+            x -= 1
+            y -= 1
+            pairs.append((x, y))
+        x, y = prev_x, prev_y
+    while x > 0 and y > 0:
+        x -= 1
+        y -= 1
+        pairs.append((x, y))
+    pairs.reverse()
+    return pairs
+
+
+def _opcodes(pairs: List[Tuple[int, int]], n: int, m: int, base: int) -> List[Opcode]:
+    """Opcodes from matched pairs, shifted by `base` lines of common prefix."""
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for x, y in pairs + [(n, m)]:
+        if x > i and y > j:
+            opcodes.append(('replace', i, x, j, y))
+        elif x > i:
+            opcodes.append(('delete', i, x, j, j))
+        elif y > j:
+            opcodes.append(('insert', i, i, j, y))
+        if (x, y) != (n, m):
+            if opcodes and opcodes[-1][0] == 'equal':
+                tag, i1, _, j1, _ = opcodes.pop()
+                opcodes.append((tag, i1, x + 1, j1, y + 1))
+            else:
+                opcodes.append(('equal', x, x + 1, y, y + 1))
+        i, j = x + 1, y + 1
+    return [(tag, i1 + base, i2 + base, j1 + base, j2 + base) for tag, i1, i2, j1, j2 in opcodes]
+
+
+def diff_outputs(expected: str, actual: str,
+                 max_lines: int = MAX_LINES, max_edits: int = MAX_EDITS) -> OutputDiff:
+    """
+    Whitespace-normalized line diff. Lines are interned to integers so the
+    comparison loop never compares strings; the common prefix and suffix
+    are matched in one linear pass, and only the middle is searched.
+    """
+    expected_lines, actual_lines = diff_lines(expected), diff_lines(actual)
+    truncated = len(expected_lines) > max_lines or len(actual_lines) > max_lines
+    ids: Dict[str, int] = {}
+    a = [ids.setdefault(normalize_line(line), len(ids)) for line in expected_lines[:max_lines]]
+    b = [ids.setdefault(normalize_line(line), len(ids)) for line in actual_lines[:max_lines]]
+
+    prefix = 0
+    while prefix < min(len(a), len(b)) and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < min(len(a), len(b)) - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+    middle_a, middle_b = a[prefix:len(a) - suffix], b[prefix:len(b) - suffix]
+
+    opcodes: List[Opcode] = []
+    if prefix:
+        opcodes.append(('equal', 0, prefix, 0, prefix))
+    pairs = _matches(middle_a, middle_b, max_edits)
+    approximate = pairs is None
+    if approximate:
+        pairs = []
+    opcodes += _opcodes(pairs, len(middle_a), len(middle_b), prefix)
+    if suffix:
+        opcodes.append(('equal', len(a) - suffix, len(a), len(b) - suffix, len(b)))
+    return OutputDiff(opcodes=opcodes, approximate=approximate, truncated=truncated)
@@ -0,0 +1,75 @@
+"""Numeric tokens of one program output, parsed once and indexed by value."""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Hashable, List, Mapping, Set, TypeVar
+
+NUMBER_PATTERN = re.compile(r'\d+\.\d+')
+
+K = TypeVar('K', bound=Hashable)
+
+
+@dataclass(frozen=True)
+class NumericToken:
+    """One decimal number as printed in the output."""
+    value: float
+    text: str
+    start: int
+
+    @property
+    def decimals(self) -> int:
+        return len(self.text) - self.text.index('.') - 1
+
+
+class OutputIndex:
+    """
+    Every decimal number in an output (the same tokens the checks used to
+    find with re.finditer(r'\\d+\\.\\d+')), parsed once and sorted by value,
+    so tolerance and range lookups are binary searches instead of a pass
+    over the output per expected value.
+
+    Tolerance comparisons are exactly abs(value - expected) <= tolerance;
+    the binary search only narrows the candidates.
+    """
+
+    def __init__(self, output: str):
+        self.output = output
+        # In output order
+        self.tokens: List[NumericToken] = [
+            NumericToken(value=float(m.group()), text=m.group(), start=m.start())
+            for m in NUMBER_PATTERN.finditer(output)
+        ]
+        self._by_value = sorted(self.tokens, key=lambda t: t.value)
+        self._values = [t.value for t in self._by_value]
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    def _window(self, value: float, tolerance: float) -> List[NumericToken]:
+        # Widen the search slightly so float rounding in value +- tolerance
+        # never drops a token the exact comparison accepts
+        slack = tolerance * 1e-9 + 1e-9
+        lo = bisect_left(self._values, value - tolerance - slack)
+        hi = bisect_right(self._values, value + tolerance + slack)
+        return self._by_value[lo:hi]
+
+    def near(self, value: float, tolerance: float) -> List[NumericToken]:
+        """Tokens within tolerance of value, in output order."""
+        found = [t for t in self._window(value, tolerance) if abs(t.value - value) <= tolerance]
+        return sorted(found, key=lambda t: t.start)
+
+    def contains(self, value: float, tolerance: float) -> bool:
+        """Whether some number in the output is within tolerance of value."""
+        return any(abs(t.value - value) <= tolerance for t in self._window(value, tolerance))
+
+    def between(self, low: float, high: float) -> List[NumericToken]:
+        """Tokens with low <= value <= high, in output order."""
+        lo = bisect_left(self._values, low)
+        hi = bisect_right(self._values, high)
+        return sorted(self._by_value[lo:hi], key=lambda t: t.start)
+
+    def matched(self, expected: Mapping[K, float], tolerance: float) -> Set[K]:
+        """Keys of the expected values found in the output."""
+        return {key for key, value in expected.items() if self.contains(value, tolerance)}
+
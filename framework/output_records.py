@@ -0,0 +1,119 @@
+"""Line-based segmentation of program output into typed records, declared once per assignment."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern
+
+# Thousands separators are accepted ("1,067.54") and dropped by number_text
+NUMBER_PATTERN = re.compile(r'\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?')
+
+
+@dataclass
+class OutputRecord:
+    """One section of output (e.g. a loan's toString) and the labeled values printed in it."""
+    kind: str
+    header: str
+    line: int  # 0-based line number of the header
+    fields: Dict[str, str] = field(default_factory=dict)
+    lines: List[str] = field(default_factory=list)
+    owner: Optional['OutputRecord'] = None  # Enclosing container record, if any
+
+    def text(self, name: str) -> Optional[str]:
+        """What was printed after the field's label, or None if the label never appeared."""
+        return self.fields.get(name)
+
+    def number_text(self, name: str) -> Optional[str]:
+        """First number printed after the field's label, as printed but without thousands separators."""
+        value = self.fields.get(name)
+        match = NUMBER_PATTERN.search(value) if value is not None else None
+        return match.group().replace(',', '') if match else None
+
+    def number(self, name: str) -> Optional[float]:
+        text = self.number_text(name)
+        return float(text) if text is not None else None
+
+
+class RecordParser:
+    """
+    Output layout of one assignment, e.g.
+
+        RECORDS = RecordParser(
+            sections={"car": r'car\\s+loan', "mortgage": r'mortgage'},
+            fields={"payment": r'monthly\\s+payment', "vin": r'\\bvin\\b'},
+        )
+
+    A line matching a section pattern starts a record of that kind (the
+    first matching section wins); field labels found on the header or the
+    following lines are recorded into it until the next header. Sections
+    named in `containers` (e.g. a customer's report) do not end at the next
+    header; records started inside one point to it as their owner.
+    Patterns are case-insensitive and compiled when the parser is created.
+    """
+
+    def __init__(self, sections: Mapping[str, str], fields: Mapping[str, str],
+                 containers: Iterable[str] = ()):
+        self.sections: Dict[str, Pattern] = {k: re.compile(p, re.IGNORECASE) for k, p in sections.items()}
+        self.fields: Dict[str, Pattern] = {k: re.compile(p, re.IGNORECASE) for k, p in fields.items()}
+        self.containers = set(containers)
+        unknown = self.containers - set(self.sections)
+        if unknown:
+            raise ValueError(f"Containers are not declared sections: {sorted(unknown)}")
+
+    def _section_of(self, line: str) -> Optional[str]:
+        for kind, pattern in self.sections.items():
+            if pattern.search(line):
+                return kind
+        return None
+
+    def parse(self, output: str) -> 'ParsedOutput':
+        return self.parse_lines(output.splitlines())
+
+    def parse_lines(self, lines: Iterable[str]) -> 'ParsedOutput':
+        """Records in the order they were printed; lines before the first header are ignored."""
+        records: List[OutputRecord] = []
+        current: Optional[OutputRecord] = None
+        container: Optional[OutputRecord] = None
+        for number, line in enumerate(lines):
+            kind = self._section_of(line)
+            if kind is not None:
+                current = OutputRecord(kind=kind, header=line.strip(), line=number,
+                                       owner=None if kind in self.containers else container)
+                if kind in self.containers:
+                    container = current
+                records.append(current)
+            if current is None:
+                continue
+            current.lines.append(line)
+            for name, pattern in self.fields.items():
+                if name in current.fields:
+                    continue
+                match = pattern.search(line)
+                if match:
+                    current.fields[name] = line[match.end():].lstrip(" \t:=-")
+        return ParsedOutput(records)
+
+
+class ParsedOutput:
+    """Records of one output, looked up by kind (and optionally by owner)."""
+
+    def __init__(self, records: List[OutputRecord]):
+        self.records = records
+        self._by_kind: Dict[str, List[OutputRecord]] = {}
+        for record in records:
+            self._by_kind.setdefault(record.kind, []).append(record)
+
+    def __bool__(self) -> bool:
+        return bool(self.records)
+
+    def of_kind(self, kind: str, owner: Optional[str] = None) -> List[OutputRecord]:
+        """Records of a kind; with `owner`, only those whose owner's header contains it (any case)."""
+        records = self._by_kind.get(kind, [])
+        if owner is not None:
+            owner = owner.lower()
+            records = [r for r in records if r.owner and owner in r.owner.header.lower()]
+        return records
+
+    def numbers(self, kind: str, name: str, owner: Optional[str] = None) -> List[float]:
+        """The field's value in every record of the kind that printed it."""
+        values = (r.number(name) for r in self.of_kind(kind, owner))
+        return [v for v in values if v is not None]
@@ -0,0 +1,168 @@
+"""Output-based rubric overrides declared as data and compiled once per assignment."""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from framework.literal_matcher import LiteralHits
+from framework.method_harness import CallResult
+from framework.output_index import OutputIndex
+from framework.output_records import ParsedOutput
+from framework.rubric import Rubric, RubricSpec, get_item
+
+MAX = "max"  # Outcome deduction meaning the item's max_deduction
+
+
+@dataclass
+class OutputContext:
+    """What predicates read: the program output and the indexes built over it once."""
+    output: str
+    index: OutputIndex
+    hits: Optional[LiteralHits] = None
+    records: Optional[ParsedOutput] = None
+    methods: Optional[Dict[str, CallResult]] = None  # Direct call results (framework/method_harness.py)
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """What an override does to its item. notes is formatted with the predicate values."""
+    deduction: Union[int, str]
+    passed: bool
+    notes: str
+
+
+Condition = Callable[[Mapping[str, Any]], bool]
+
+
+@dataclass(frozen=True)
+class Override:
+    """
+    A rule that may rewrite one rubric item from output evidence, e.g.
+
+        Override("la_calculate_negative", item="la_calculate", only_if_passed=True,
+                 after=("la_calculate_partial",),
+                 cases=[(lambda p: p["payments_found"] == 0,
+                         Outcome(MAX, False, "Formula incorrect: ..."))])
+
+    The rule only runs when the item's current passed state equals
+    only_if_passed (None: always). Its cases are tried in order and the
+    first whose condition holds is applied. after names rules that must
+    run first.
+    """
+    name: str
+    item: str
+    cases: Sequence[Tuple[Condition, Outcome]]
+    only_if_passed: Optional[bool] = None
+    after: Tuple[str, ...] = ()
+
+
+class PredicateSet:
+    """
+    Named predicates over an OutputContext, e.g.
+
+        PREDICATES = PredicateSet(payments_found=_payments_found,
+                                  has_vin=lambda c: CAR_LOAN["vin"] in c.hits)
+
+    evaluate() returns the values for one student's output; each predicate
+    runs at most once, when first read, however many rules and checks use it.
+    """
+
+    def __init__(self, **predicates: Callable[[OutputContext], Any]):
+        self.predicates: Dict[str, Callable[[OutputContext], Any]] = dict(predicates)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.predicates
+
+    def evaluate(self, context: OutputContext) -> 'PredicateValues':
+        return PredicateValues(self, context)
+
+
+class PredicateValues(Mapping):
+    """Predicate name -> value for one output, evaluated lazily and memoized."""
+
+    def __init__(self, predicates: PredicateSet, context: OutputContext):
+        self._predicates = predicates
+        self.context = context
+        self._values: Dict[str, Any] = {}
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in self._values:
+            self._values[name] = self._predicates.predicates[name](self.context)
+        return self._values[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._predicates.predicates)
+
+    def __len__(self) -> int:
+        return len(self._predicates.predicates)
+
+
+class OverridePlan:
+    """
+    An assignment's override rules, validated against its rubric and put in
+    dependency order once, at import. Rules without dependencies between
+    them keep their declared order.
+    """
+
+    def __init__(self, rubric: RubricSpec, predicates: PredicateSet, rules: Iterable[Override]):
+        self.predicates = predicates
+        rules = list(rules)
+        by_name: Dict[str, Override] = {}
+        for rule in rules:
+            if rule.name in by_name:
+                raise ValueError(f"Duplicate override rule '{rule.name}'")
+            if rule.item not in rubric:
+                raise ValueError(f"Override '{rule.name}' targets unknown rubric item '{rule.item}'")
+            by_name[rule.name] = rule
+        for rule in rules:
+            unknown = [d for d in rule.after if d not in by_name]
+            if unknown:
+                raise ValueError(f"Override '{rule.name}' depends on unknown rules {unknown}")
+        self.order: List[Override] = self._ordered(rules, by_name)
+
+    @staticmethod
+    def _ordered(rules: List[Override], by_name: Dict[str, Override]) -> List[Override]:
+        order: List[Override] = []
+        state: Dict[str, str] = {}  # name -> "visiting" | "done"
+
+        def visit(rule: Override):
+            if state.get(rule.name) == "done":
+                return
+            if state.get(rule.name) == "visiting":
+                raise ValueError(f"Override rules form a cycle through '{rule.name}'")
+            state[rule.name] = "visiting"
+            for dependency in rule.after:
+                visit(by_name[dependency])
+            state[rule.name] = "done"
+            order.append(rule)
+
+        for rule in rules:
+            visit(rule)
+        return order
+
+    def evaluate(self, context: OutputContext) -> PredicateValues:
+        return self.predicates.evaluate(context)
+
+    def apply(self, items: Rubric, values: PredicateValues):
+        """Run every rule, in order, against one student's rubric."""
+        for rule in self.order:
+            item = get_item(items, rule.item)
+            if rule.only_if_passed is not None and item.passed != rule.only_if_passed:
+                continue
+            for condition, outcome in rule.cases:
+                if condition(values):
+                    item.deduction = item.max_deduction if outcome.deduction == MAX else outcome.deduction
+                    item.passed = outcome.passed
+                    item.notes = outcome.notes.format_map(values)
+                    break
+
+    def annotate(self, items: Rubric, values: PredicateValues, label: str):
+        """Like apply, but each matching outcome is only appended to its item's notes, prefixed by label."""
+        for rule in self.order:
+            item = get_item(items, rule.item)
+            if rule.only_if_passed is not None and item.passed != rule.only_if_passed:
+                continue
+            for condition, outcome in rule.cases:
+                if condition(values):
+                    note = f"{label}: {outcome.notes.format_map(values)}"
+                    item.notes = f"{item.notes}; {note}" if item.notes else note
+                    break
@@ -0,0 +1,167 @@
+"""Submission-wide symbol table and inheritance graph built from per-file analyzers."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from framework.java_ast_analyzer import JavaASTAnalyzer
+from framework.java_declarations import ClassInfo, ConstructorInfo, FieldInfo, MethodInfo
+
+
+def normalize_name(name: str) -> str:
+    """Lookup key for a class name; student spellings differ mostly in case."""
+    return name.lower()
+
+
+@dataclass
+class ClassSymbol:
+    """Where a class is declared and what it declares."""
+    name: str
+    path: Path
+    analyzer: JavaASTAnalyzer
+    info: ClassInfo
+
+    @property
+    def key(self) -> str:
+        return normalize_name(self.name)
+
+
+class ProjectModel:
+    """
+    One symbol table over every class of a submission plus its inheritance
+    graph. Classes are looked up by normalized name in constant time and
+    member queries are scoped to the class (optionally with what it
+    inherits from other project classes).
+
+    Construction only reads each file's header scan (SourceFile.type_names).
+    A file is parsed the first time a lookup needs a class it may declare,
+    so backups, test harnesses and unrelated classes are never parsed
+    unless a check asks for them.
+    """
+
+    def __init__(self, files: Iterable):
+        # Normalized name -> files whose header scan mentions it, in file order
+        self._candidates: Dict[str, List] = {}
+        for source_file in files:
+            for name in source_file.type_names:
+                candidates = self._candidates.setdefault(normalize_name(name), [])
+                if source_file not in candidates:
+                    candidates.append(source_file)
+        self._declared: Dict[Path, Dict[str, ClassSymbol]] = {}
+        self._resolved: Dict[str, Optional[ClassSymbol]] = {}
+        self._children: Optional[Dict[str, List[str]]] = None
+
+    def _symbols_in(self, source_file) -> Dict[str, ClassSymbol]:
+        """Classes a file actually declares, parsing it on first use."""
+        symbols = self._declared.get(source_file.path)
+        if symbols is None:
+            analyzer = source_file.analyzer
+            symbols = {}
+            for name in analyzer.get_class_names():
+                symbol = ClassSymbol(name=name, path=source_file.path, analyzer=analyzer,
+                                     info=analyzer.get_class_info(name))
+                symbols[symbol.key] = symbol
+            self._declared[source_file.path] = symbols
+        return symbols
+
+    @property
+    def symbols(self) -> Dict[str, ClassSymbol]:
+        """Normalized name -> symbol for every class (parses every candidate file)."""
+        return {symbol.key: symbol for symbol in self}
+
+    def __iter__(self) -> Iterator[ClassSymbol]:
+        for key in list(self._candidates):
+            symbol = self.get(key)
+            if symbol is not None:
+                yield symbol
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def get(self, name: str) -> Optional[ClassSymbol]:
+        """The class with this name; when several files declare it, the last one wins."""
+        key = normalize_name(name)
+        if key not in self._resolved:
+            symbol = None
+            for source_file in reversed(self._candidates.get(key, [])):
+                symbol = self._symbols_in(source_file).get(key)
+                if symbol is not None:
+                    break
+            self._resolved[key] = symbol
+        return self._resolved[key]
+
+    def find(self, *names: str) -> Optional[ClassSymbol]:
+        """First class matching one of the names exactly, else one whose name contains it."""
+        for name in names:
+            symbol = self.get(name)
+            if symbol:
+                return symbol
+        for name in names:
+            key = normalize_name(name)
+            for class_key in list(self._candidates):
+                if key in class_key:
+                    symbol = self.get(class_key)
+                    if symbol:
+                        return symbol
+        return None
+
+    # --- Inheritance graph ---
+
+    def parent_name(self, symbol: ClassSymbol) -> Optional[str]:
+        """The extends clause as written, whether or not that class is in the project."""
+        return symbol.info.extends
+
+    def parent(self, symbol: ClassSymbol) -> Optional[ClassSymbol]:
+        name = self.parent_name(symbol)
+        return self.get(name) if name else None
+
+    def ancestors(self, symbol: ClassSymbol) -> List[ClassSymbol]:
+        """Project superclasses, nearest first (stops at cycles and external classes)."""
+        chain, seen = [], {symbol.key}
+        current = self.parent(symbol)
+        while current and current.key not in seen:
+            chain.append(current)
+            seen.add(current.key)
+            current = self.parent(current)
+        return chain
+
+    def _child_map(self) -> Dict[str, List[str]]:
+        if self._children is None:
+            self._children = {}
+            for symbol in self:
+                parent = self.parent_name(symbol)
+                if parent:
+                    self._children.setdefault(normalize_name(parent), []).append(symbol.key)
+        return self._children
+
+    def descendants(self, symbol: ClassSymbol) -> List[ClassSymbol]:
+        """Every project class that extends this one, directly or indirectly."""
+        children = self._child_map()
+        found, seen = [], {symbol.key}
+        stack = list(children.get(symbol.key, []))
+        while stack:
+            key = stack.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+            found.append(self.get(key))
+            stack.extend(children.get(key, []))
+        return found
+
+    def is_subclass(self, symbol: ClassSymbol, base: str) -> bool:
+        key = normalize_name(base)
+        return any(a.key == key for a in self.ancestors(symbol))
+
+    # --- Members ---
+
+    def _scope(self, symbol: ClassSymbol, inherited: bool) -> List[ClassSymbol]:
+        return [symbol] + self.ancestors(symbol) if inherited else [symbol]
+
+    def fields(self, symbol: ClassSymbol, inherited: bool = False) -> List[FieldInfo]:
+        return [f for s in self._scope(symbol, inherited) for f in s.info.fields]
+
+    def methods(self, symbol: ClassSymbol, inherited: bool = False) -> List[MethodInfo]:
+        return [m for s in self._scope(symbol, inherited) for m in s.info.methods]
+
+    def constructors(self, symbol: ClassSymbol) -> List[ConstructorInfo]:
+        return list(symbol.info.constructors)
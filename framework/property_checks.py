@@ -0,0 +1,194 @@
+"""Randomized formula checks: thousands of loans through the student's method in one JVM, compared with NumPy."""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from framework.method_harness import CallResult, MethodBatch, ObjectRef, run_batch
+
+try:
+    import numpy as np
+except ImportError:  # Property checks are skipped without NumPy
+    np = None
+
+DEFAULT_SEED = 2024
+# Share of the cases forced into each edge region, so every region is sampled
+EDGE_SHARE = 0.05
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+@dataclass
+class LoanCases:
+    """Parallel arrays of loan parameters; rate is an annual percentage."""
+    principal: 'np.ndarray'
+    rate: 'np.ndarray'
+    months: 'np.ndarray'
+
+    def __len__(self) -> int:
+        return len(self.principal)
+
+    def describe(self, i: int) -> str:
+        return f"({self.principal[i]:.2f}, {self.rate[i]:.2f}%, {int(self.months[i])})"
+
+
+def generate_loan_cases(count: int, seed: int = DEFAULT_SEED) -> LoanCases:
+    """
+    count loans with log-uniform principals ($100 to $1M), rates of 0-30%
+    and terms of 1-480 months. A share of the cases is pinned to the edges
+    the assignment's main never reaches (rate 0, a single month, rates
+    under 1%, terms of 30+ years). The same seed gives every student the
+    same cases.
+    """
+    rng = np.random.default_rng(seed)
+    principal = np.round(10 ** rng.uniform(2, 6, count), 2)
+    rate = np.round(rng.uniform(0, 30, count), 2)
+    months = rng.integers(1, 481, count)
+
+    edge = max(1, int(count * EDGE_SHARE))
+    slices = [slice(k * edge, (k + 1) * edge) for k in range(4)]
+    rate[slices[0]] = 0.0
+    months[slices[1]] = 1
+    rate[slices[2]] = np.round(rng.uniform(0.01, 0.99, len(rate[slices[2]])), 2)
+    months[slices[3]] = rng.integers(360, 481, len(months[slices[3]]))
+    return LoanCases(principal=principal, rate=rate, months=months)
+
+
+def amortized_payments(principal: 'np.ndarray', rate: 'np.ndarray', months: 'np.ndarray') -> 'np.ndarray':
+    """
+    The expected_values compute_monthly_payment formula over whole arrays.
+    At a 0% rate the formula is 0/0; the payment is then principal / months,
+    the formula's limit, which is what a correct implementation must return.
+    """
+    monthly_rate = rate / 100.0 / 12.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amortized = principal * (monthly_rate / (1 - np.power(1 + monthly_rate, -months.astype(float))))
+    return np.where(monthly_rate == 0, principal / months, amortized)
+
+
+# Named subsets of the cases a failure summary is broken down by; a case may be in several
+REGIONS: List[Tuple[str, Callable[[LoanCases], 'np.ndarray']]] = [
+    ("rate = 0", lambda c: c.rate == 0),
+    ("months = 1", lambda c: c.months == 1),
+    ("rate < 1%", lambda c: (c.rate > 0) & (c.rate < 1)),
+    ("months >= 360", lambda c: c.months >= 360),
+    ("principal >= $500k", lambda c: c.principal >= 500000),
+    ("typical", lambda c: (c.rate >= 1) & (c.months > 1) & (c.months < 360) & (c.principal < 500000)),
+]
+
+
+@dataclass
+class RegionSummary:
+    name: str
+    cases: int
+    failures: int
+    max_error: Optional[float]  # Over finite results; None when there were none
+
+
+@dataclass
+class PropertyReport:
+    """How one student's implementation did on the randomized cases."""
+    cases: int
+    answered: int  # Cases whose call returned or threw before the batch ended
+    failures: int  # Off by more than the tolerance, non-finite, or threw
+    max_error: float
+    mean_error: float
+    exceptions: int = 0
+    non_finite: int = 0
+    regions: List[RegionSummary] = field(default_factory=list)
+    worst: str = ""  # The worst case, e.g. "(1000.00, 0.00%, 12) returned NaN, expected 83.33"
+
+    @property
+    def failing_regions(self) -> List[str]:
+        """Regions where most cases fail; regions overlap, so a few failures elsewhere are usually spillover."""
+        return [r.name for r in self.regions if r.failures * 2 >= r.cases]
+
+
+def summarize(cases: LoanCases, expected: 'np.ndarray', results: List[Optional[CallResult]],
+              tolerance: float) -> PropertyReport:
+    """Compare the student's results (None: not reached) with the reference, overall and per region."""
+    answered = np.array([r is not None for r in results], dtype=bool)
+    threw = np.array([r is not None and not r.ok for r in results], dtype=bool)
+    actual = np.array([r.number if r is not None and r.ok and r.number is not None else np.nan
+                       for r in results], dtype=float)
+    # ok results with no number are NaN or Infinity
+    non_finite = answered & ~threw & ~np.isfinite(actual)
+    error = np.abs(actual - expected)
+    finite = answered & np.isfinite(error)
+    failed = (finite & (error > tolerance)) | non_finite | threw
+
+    regions = []
+    for name, region in REGIONS:
+        mask = region(cases) & answered
+        if not mask.any():
+            continue
+        region_errors = error[mask & finite]
+        regions.append(RegionSummary(name=name, cases=int(mask.sum()), failures=int(failed[mask].sum()),
+                                     max_error=float(region_errors.max()) if region_errors.size else None))
+
+    worst = ""
+    if failed.any():
+        # Non-finite and thrown results are worse than any numeric error
+        badness = np.where(finite, error, np.inf)
+        i = int(np.argmax(np.where(failed, badness, -1.0)))
+        returned = results[i].error if threw[i] else (results[i].text if non_finite[i] else f"{actual[i]:.2f}")
+        worst = f"{cases.describe(i)} returned {returned}, expected {expected[i]:.2f}"
+
+    errors = error[finite]
+    return PropertyReport(
+        cases=len(cases),
+        answered=int(answered.sum()),
+        failures=int(failed.sum()),
+        max_error=float(errors.max()) if errors.size else 0.0,
+        mean_error=float(errors.mean()) if errors.size else 0.0,
+        exceptions=int(threw.sum()),
+        non_finite=int(non_finite.sum()),
+        regions=regions,
+        worst=worst,
+    )
+
+
+@dataclass(frozen=True)
+class PaymentProperty:
+    """
+    Where an assignment's payment formula lives, e.g.
+
+        PaymentProperty("LoanAccount", "calculateMonthlyPayment")
+
+    constructs LoanAccount(principal, rate, months) for every case and
+    calls calculateMonthlyPayment() on it.
+    """
+    class_name: str
+    method: str
+
+
+class PropertySuite:
+    """
+    One run's randomized cases, their batch and their expected payments,
+    all built once and shared by every student.
+    """
+
+    def __init__(self, spec: PaymentProperty, cases: LoanCases, tolerance: float):
+        self.spec = spec
+        self.cases = cases
+        self.tolerance = tolerance
+        self.expected = amortized_payments(cases.principal, cases.rate, cases.months)
+        self.batch = MethodBatch()
+        self.call_ids: List[str] = []
+        for i in range(len(cases)):
+            loan: ObjectRef = self.batch.new(spec.class_name, float(cases.principal[i]),
+                                             float(cases.rate[i]), int(cases.months[i]))
+            self.call_ids.append(self.batch.call(loan, spec.method))
+
+    def run(self, build_dir: Path) -> Optional[PropertyReport]:
+        """All cases in one JVM launch; None when the harness is unavailable."""
+        results = run_batch(build_dir, self.batch, timeout=20 + len(self.cases) // 100)
+        if not results:
+            return None
+        reached = [results.get(c) for c in self.call_ids]
+        reached = [r if r is not None and not r.unresolved else None for r in reached]
+        if not any(reached):
+            return None  # e.g. no class of that name; nothing was learned
+        return summarize(self.cases, self.expected, reached, self.tolerance)
@@ -0,0 +1,133 @@
+"""Expected output taken from the instructor's reference solution, run once per version."""
+
+import hashlib
+import json
+import os
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from framework.java_compiler import JavaCompiler
+from framework.output_index import NumericToken, OutputIndex
+from framework.utils import cache_dir as default_cache_dir, cleanup_temp_dir, create_temp_dir
+from framework.workspace import Workspace
+
+CACHE_PREFIX = "autograder_reference_"
+
+
+class ReferenceSolutionError(Exception):
+    """The reference solution could not be found, compiled or run."""
+
+
+@dataclass
+class ReferenceOutput:
+    """The reference program's stdout and the numbers in it."""
+    digest: str  # Hash of the reference sources the output came from
+    output: str
+    tokens: List[NumericToken] = field(default_factory=list)
+    cached: bool = False
+
+    def labeled_values(self) -> Dict[str, float]:
+        """Each printed number, labeled with the output line it appears on."""
+        values: Dict[str, float] = {}
+        tokens = iter(self.tokens)  # In output order
+        token = next(tokens, None)
+        offset = 0
+        for number, line in enumerate(self.output.split('\n'), 1):
+            end = offset + len(line)
+            on_line = []
+            while token is not None and token.start < end:
+                on_line.append(token)
+                token = next(tokens, None)
+            for k, t in enumerate(on_line, 1):
+                suffix = f" (#{k})" if len(on_line) > 1 else ""
+                values[f"Line {number}: {line.strip()}{suffix}"] = t.value
+            offset = end + 1
+        return values
+
+    def missing(self, expected: Dict[str, float], tolerance: float) -> List[str]:
+        """Labels of expected values the reference never prints (the hand-kept values drifted)."""
+        index = OutputIndex(self.output)
+        return [label for label, value in expected.items() if not index.contains(value, tolerance)]
+
+
+def reference_java_files(path: Path, work_dir: Path) -> List[Path]:
+    """
+    Sources of a reference project: a .java file, a project directory or a
+    zipped project (extracted into work_dir). When a src/ tree exists only
+    its files are used, as for student submissions.
+    """
+    path = Path(path)
+    if path.suffix == '.java':
+        return [path]
+    if path.suffix == '.zip':
+        try:
+            with zipfile.ZipFile(path) as zf:
+                zf.extractall(work_dir)
+        except zipfile.BadZipFile as e:
+            raise ReferenceSolutionError(f"Invalid reference zip {path}: {e}")
+        path = work_dir
+    java_files = sorted(f for f in path.rglob("*.java")
+                        if '__MACOSX' not in f.parts and not f.name.startswith('._'))
+    src_files = [f for f in java_files if 'src' in f.parts]
+    return src_files or java_files
+
+
+def source_digest(java_files: List[Path]) -> str:
+    """Content hash of the sources, independent of where they were unpacked."""
+    h = hashlib.sha256()
+    for text in sorted(f.read_bytes() for f in java_files):
+        h.update(hashlib.sha256(text).digest())
+    return h.hexdigest()
+
+
+def load_reference(path: Path, cache_dir: Optional[Path] = None,
+                   compile_timeout: int = 60, run_timeout: int = 30) -> ReferenceOutput:
+    """
+    The reference solution's output. The sources are hashed and the program
+    is compiled and run only when no cached output exists for that hash, so
+    an unchanged reference is executed once, not once per batch or student.
+    The cache defaults to the private per-user cache directory; an entry is
+    used only if it records the full digest of the sources and its tokens
+    are the numbers of its output.
+    """
+    work_dir = create_temp_dir("reference_")
+    try:
+        java_files = reference_java_files(path, work_dir / "extract")
+        if not java_files:
+            raise ReferenceSolutionError(f"No .java files found in reference {path}")
+        digest = source_digest(java_files)
+        cache_file = Path(cache_dir or default_cache_dir()) / f"{CACHE_PREFIX}{digest[:16]}.json"
+
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            output = cached["output"]
+            tokens = OutputIndex(output).tokens
+            if (cached.get("digest") == digest and isinstance(output, str)
+                    and [[t.text, t.start] for t in tokens] == cached["tokens"]):
+                return ReferenceOutput(digest=digest, output=output, cached=True, tokens=tokens)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        compiler = JavaCompiler(java_files, Workspace(work_dir / "build"))
+        compile_ok, errors = compiler.compile(timeout=compile_timeout)
+        if not compile_ok:
+            raise ReferenceSolutionError(f"Reference solution does not compile:\n{errors}")
+        run_ok, output = compiler.run(timeout=run_timeout)
+        if not run_ok:
+            raise ReferenceSolutionError(f"Reference solution failed to run:\n{output}")
+
+        reference = ReferenceOutput(digest=digest, output=output, tokens=OutputIndex(output).tokens)
+        payload = {"digest": digest, "output": output,
+                   "tokens": [[t.text, t.start] for t in reference.tokens]}
+        try:
+            partial = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            partial.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(partial, cache_file)
+        except OSError:
+            # Caching is an optimization; the output is still usable
+            pass
+        return reference
+    finally:
+        cleanup_temp_dir(work_dir)
@@ -3,17 +3,24 @@
 import html
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from framework.class_analytics import SENSITIVITY_TOLERANCES, MatchMatrix
+from framework.output_diff import MAX_LINES, diff_lines
 from framework.rubric import GradingResult
 
+# Unchanged lines shown around each difference in the output diff
+DIFF_CONTEXT = 3
+
 
 class HTMLReportGenerator:
     """Generates a single self-contained HTML report for a batch of graded submissions."""
 
-    def __init__(self, assignment_name: str, results: List[GradingResult]):
+    def __init__(self, assignment_name: str, results: List[GradingResult],
+                 analytics: Optional[MatchMatrix] = None):
         self.assignment_name = assignment_name
         self.results = sorted(results, key=lambda r: r.student_name.lower())
+        self.analytics = analytics
 
     def generate(self, output_path: Path) -> Path:
         """Generate the HTML report file."""
@@ -47,6 +54,7 @@ class HTMLReportGenerator:
 
     <h2>Summary</h2>
     {self._summary_table()}
+    {self._analytics_section()}
 
     <h2>Detailed Results</h2>
     {self._detail_sections()}
@@ -96,12 +104,18 @@ summary:hover { background: #f8f9fa; }
 .no-deduction { color: #27ae60; }
 .category-header { background: #f8f9fa; font-weight: bold; }
 
+/* Class Analytics */
+.rate-low { color: #e74c3c; font-weight: bold; }
+
 /* Code/Output */
 pre { background: #2d2d2d; color: #f8f8f2; padding: 12px; border-radius: 6px; overflow-x: auto; font-size: 0.85em; line-height: 1.4; margin: 8px 0; max-height: 400px; overflow-y: auto; }
 .section-label { font-weight: 600; margin: 12px 0 4px; color: #2c3e50; font-size: 0.95em; }
 .compiler-error { background: #1e1e1e; color: #f44747; }
 .output-box { background: #1e3a1e; color: #98fb98; }
 .expected-box { background: #1e1e3a; color: #87ceeb; }
+.diff-del { color: #ff8c8c; }
+.diff-add { color: #98fb98; }
+.diff-skip { color: #7f8c8d; }
 
 /* Buttons */
 .btn { padding: 6px 14px; border: none; border-radius: 4px; cursor: pointer; font-size: 0.85em; margin: 4px; }
@@ -155,12 +169,108 @@ function collapseAll() {
     <button class="btn btn-expand" onclick="collapseAll()">Collapse All</button>
 </div>"""
 
+    def _analytics_section(self) -> str:
+        m = self.analytics
+        if m is None:
+            return ""
+        counts, rates = m.hit_counts, m.hit_rates
+        curves = m.sensitivity(SENSITIVITY_TOLERANCES)
+        rows = []
+        for j, label in enumerate(m.labels):
+            rate_class = ' class="rate-low"' if rates[j] < 0.5 else ""
+            curve = ''.join(f'<td>{curves[t, j]:.0%}</td>' for t in range(len(SENSITIVITY_TOLERANCES)))
+            rows.append(f"""<tr>
+    <td>{html.escape(label)}</td>
+    <td>{m.expected[j]:.2f}</td>
+    <td>{counts[j]}/{len(m.students)}</td>
+    <td{rate_class}>{rates[j]:.0%}</td>
+    {curve}
+</tr>""")
+        tolerance_headers = ''.join(f'<th>&plusmn;{t:g}</th>' for t in SENSITIVITY_TOLERANCES)
+        return f"""<h2>Expected Values Across the Class</h2>
+<div class="meta">Of the {len(m.students)} students whose program ran and printed output, the share whose output contains each value within &plusmn;{m.tolerance:g}, and what it would be at other tolerances.</div>
+<table class="summary-table">
+<tr>
+    <th>Value</th>
+    <th>Expected</th>
+    <th>Students</th>
+    <th>Hit Rate</th>
+    {tolerance_headers}
+</tr>
+{''.join(rows)}
+</table>"""
+
     def _detail_sections(self) -> str:
         sections = []
         for r in self.results:
             sections.append(self._student_detail(r))
         return '\n'.join(sections)
 
+    @staticmethod
+    def _property_section(r: GradingResult) -> str:
+        p = r.property_report
+        if p is None:
+            return ""
+        rows = []
+        for region in p.regions:
+            failing = ' class="rate-low"' if region.name in p.failing_regions else ""
+            rows.append(f"""<tr>
+    <td>{html.escape(region.name)}</td>
+    <td>{region.cases}</td>
+    <td{failing}>{region.failures}</td>
+    <td>{'-' if region.max_error is None else f'{region.max_error:.4g}'}</td>
+</tr>""")
+        problems = []
+        if p.exceptions:
+            problems.append(f"{p.exceptions} threw")
+        if p.non_finite:
+            problems.append(f"{p.non_finite} returned NaN/Infinity")
+        worst = f"<br>Worst: {html.escape(p.worst)}" if p.worst else ""
+        return f"""<div class="section-label">Randomized Formula Check (informational)</div>
+<div class="meta">{p.failures} of {p.answered} random loans wrong{' (' + ', '.join(problems) + ')' if problems else ''};
+max error {p.max_error:.4g}, mean error {p.mean_error:.4g}{worst}</div>
+<table class="summary-table">
+<tr><th>Region</th><th>Cases</th><th>Failing</th><th>Max Error</th></tr>
+{''.join(rows)}
+</table>"""
+
+
+    @staticmethod
+    def _diff_section(r: GradingResult) -> str:
+        d = r.output_diff
+        if d is None:
+            return ""
+        caveats = []
+        if d.approximate:
+            caveats.append("too different for a line-by-line match")
+        if d.truncated:
+            caveats.append(f"only the first {MAX_LINES} lines compared")
+        caveat = f" ({'; '.join(caveats)})" if caveats else ""
+        if d.identical:
+            return f"""<div class="section-label">Output Diff</div>
+<div class="meta">Output matches the expected output, ignoring whitespace{caveat}</div>"""
+
+        expected, actual = diff_lines(r.expected_output), diff_lines(r.actual_output)
+        lines = []
+        for n, (tag, i1, i2, j1, j2) in enumerate(d.opcodes):
+            if tag == 'equal':
+                # Show DIFF_CONTEXT lines next to each change, skip the rest
+                head = i1 + (DIFF_CONTEXT if n > 0 else 0)
+                tail = i2 - (DIFF_CONTEXT if n < len(d.opcodes) - 1 else 0)
+                if tail - head > 0:
+                    lines += [f"  {html.escape(line)}" for line in expected[i1:min(head, i2)]]
+                    lines.append(f'<span class="diff-skip">  ... {tail - head} matching lines ...</span>')
+                    lines += [f"  {html.escape(line)}" for line in expected[max(tail, i1):i2]]
+                else:
+                    lines += [f"  {html.escape(line)}" for line in expected[i1:i2]]
+                continue
+            lines += [f'<span class="diff-del">- {html.escape(line)}</span>' for line in expected[i1:i2]]
+            lines += [f'<span class="diff-add">+ {html.escape(line)}</span>' for line in actual[j1:j2]]
+        removed, added = d.changed_lines
+        return f"""<div class="section-label">Output Diff (- expected, + actual)</div>
+<div class="meta">{removed} expected lines missing or different, {added} unexpected lines{caveat}</div>
+<pre>{chr(10).join(lines)}</pre>"""
+
     def _student_detail(self, r: GradingResult) -> str:
         # Score indicator
         indicator = "&#9989;" if r.total_score >= 90 else ("&#9888;&#65039;" if r.total_score >= 70 else "&#10060;")
@@ -191,12 +301,16 @@ function collapseAll() {
             oop_html = f"""<div class="section-label">OOP Practice Issues (deduction: -{oop_deduction}, capped at -15)</div>
 <ul>{oop_items}</ul>"""
 
+        property_html = self._property_section(r)
+
         # Compiler output
         compiler_html = ""
         if r.compiler_errors:
             compiler_html = f"""<div class="section-label">Compiler Output</div>
 <pre class="compiler-error">{html.escape(r.compiler_errors)}</pre>"""
 
+        diff_html = self._diff_section(r)
+
         # Expected output
         expected_html = ""
         if r.expected_output:
@@ -220,7 +334,9 @@ function collapseAll() {
     {''.join(rubric_rows)}
     </table>
     {oop_html}
+    {property_html}
     {compiler_html}
+    {diff_html}
     {expected_html}
     {output_html}
     <div class="section-label">Source Code</div>
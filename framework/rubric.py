@@ -1,7 +1,10 @@
 """Data classes for rubric items and grading results."""
 
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass, field, replace
+from typing import Dict, Iterable, List, Optional
+
+from framework.output_diff import OutputDiff
+from framework.property_checks import PropertyReport
 
 
 @dataclass
@@ -19,6 +22,51 @@ class RubricItem:
         return self.deduction == 0
 
 
+class Rubric(list):
+    """One student's rubric items, in rubric order and indexed by id."""
+
+    def __init__(self, items: Iterable[RubricItem] = ()):
+        super().__init__(items)
+        self._by_id: Dict[str, RubricItem] = {item.id: item for item in self}
+
+    def get(self, item_id: str) -> RubricItem:
+        item = self._by_id.get(item_id)
+        if item is None:
+            raise ValueError(f"Rubric item '{item_id}' not found")
+        return item
+
+
+class RubricSpec:
+    """
+    An assignment's rubric, declared once at import. instantiate() hands
+    each student fresh copies of the items, indexed by id.
+    """
+
+    def __init__(self, items: Iterable[RubricItem]):
+        self.items: List[RubricItem] = list(items)
+        ids = [item.id for item in self.items]
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rubric item ids: {duplicates}")
+        self.ids = set(ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self.ids
+
+    def instantiate(self) -> Rubric:
+        return Rubric(replace(item) for item in self.items)
+
+
+def get_item(items: List[RubricItem], item_id: str) -> RubricItem:
+    """The item with this id; a constant-time lookup when items is a Rubric."""
+    if isinstance(items, Rubric):
+        return items.get(item_id)
+    for item in items:
+        if item.id == item_id:
+            return item
+    raise ValueError(f"Rubric item '{item_id}' not found")
+
+
 @dataclass
 class GradingResult:
     student_name: str
@@ -34,6 +82,10 @@ class GradingResult:
     oop_notes: List[str] = field(default_factory=list)
     expected_output: str = ""
     error_message: str = ""
+    files_total: int = 0
+    files_parsed: int = 0  # Files that needed a full analysis; the rest were header-scanned only
+    property_report: Optional[PropertyReport] = None  # Randomized formula check, when run (informational)
+    output_diff: Optional[OutputDiff] = None  # Expected vs actual output lines, when the program ran
 
     def calculate_score(self):
         total_deductions = sum(item.deduction for item in self.rubric_items)
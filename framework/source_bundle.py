@@ -0,0 +1,154 @@
+"""One-read-per-file source container shared by the grading pipeline."""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from framework.java_ast_analyzer import DEFAULT_BACKEND, DEFAULT_PARSE_BUDGET, JavaASTAnalyzer
+from framework.project_model import ProjectModel
+from framework.source_probes import ProbeHits, ProbeSet
+
+MAIN_PATTERN = re.compile(r'public\s+static\s+void\s+main')
+PACKAGE_PATTERN = re.compile(r'package\s+([\w.]+)\s*;')
+PUBLIC_CLASS_PATTERN = re.compile(r'public\s+class\s+(\w+)')
+# Header scan for declared class/record names. Deliberately loose (comments
+# and strings included) so it never misses a name any analyzer backend reports.
+TYPE_NAME_PATTERN = re.compile(r'class\s+(\w+)|record\s+(\w+)\s*[(<]')
+
+
+class SourceFile:
+    """
+    A single decoded .java file with cheap header facts and a lazily parsed
+    analyzer. type_names is a superset of the class names the analyzer will
+    report, used to decide which files a lookup needs to parse.
+    """
+
+    def __init__(self, path: Path, text: str, backend: str = DEFAULT_BACKEND,
+                 parse_budget: Optional[float] = DEFAULT_PARSE_BUDGET):
+        self.path = path
+        self.text = text
+        self.backend = backend
+        self.parse_budget = parse_budget
+        self.summary: Optional[dict] = None  # javac declaration summary, when compiled first
+        match = PACKAGE_PATTERN.search(text)
+        self.package = match.group(1) if match else ""
+        match = PUBLIC_CLASS_PATTERN.search(text)
+        self.class_name = match.group(1) if match else path.stem
+        self.has_main = bool(MAIN_PATTERN.search(text))
+        self.type_names = [a or b for a, b in TYPE_NAME_PATTERN.findall(text)]
+        self._analyzer: Optional[JavaASTAnalyzer] = None
+
+    @property
+    def analyzer(self) -> JavaASTAnalyzer:
+        """Analyzer for this file, parsed on first use and then shared."""
+        if self._analyzer is None:
+            self._analyzer = JavaASTAnalyzer(self.text, backend=self.backend,
+                                             parse_budget=self.parse_budget, summary=self.summary)
+        return self._analyzer
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the analyzer (and so a parse) was ever needed."""
+        return self._analyzer is not None
+
+    @property
+    def fqn(self) -> str:
+        return f"{self.package}.{self.class_name}" if self.package else self.class_name
+
+
+class SourceBundle:
+    """
+    Every source file of one submission, read and decoded exactly once.
+    Created per submission and passed to BaseGrader, JavaCompiler and the
+    assignment checks so none of them touch the files again.
+    """
+
+    def __init__(self, java_files: Union[Path, List[Path]], backend: str = DEFAULT_BACKEND,
+                 parse_budget: Optional[float] = DEFAULT_PARSE_BUDGET):
+        if isinstance(java_files, Path):
+            java_files = [java_files]
+        self.files: List[SourceFile] = [
+            SourceFile(f, f.read_text(errors='ignore'), backend, parse_budget) for f in java_files
+        ]
+        self._by_path: Dict[Path, SourceFile] = {sf.path: sf for sf in self.files}
+        self._combined: Optional[str] = None
+        self._project: Optional[ProjectModel] = None
+        self._probe_hits: Dict[int, ProbeHits] = {}
+
+    def __iter__(self):
+        return iter(self.files)
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    @property
+    def paths(self) -> List[Path]:
+        return [sf.path for sf in self.files]
+
+    @property
+    def sources(self) -> Dict[Path, str]:
+        """Path -> decoded text, in file order."""
+        return {sf.path: sf.text for sf in self.files}
+
+    @property
+    def combined(self) -> str:
+        """All sources joined, for whole-submission searches."""
+        if self._combined is None:
+            self._combined = "\n".join(sf.text for sf in self.files)
+        return self._combined
+
+    @property
+    def display_source(self) -> str:
+        """Source for the report, with per-file headers when there are several files."""
+        if len(self.files) == 1:
+            return self.files[0].text
+        return "\n\n".join(f"// === {sf.path.name} ===\n{sf.text}" for sf in self.files)
+
+    def attach_summaries(self, summaries: Dict[Path, dict]):
+        """Hand javac's per-file declaration summaries to analyzers not yet created."""
+        for sf in self.files:
+            sf.summary = summaries.get(sf.path.resolve())
+
+    @property
+    def project(self) -> ProjectModel:
+        """Symbol table and inheritance graph over every file, built on first use."""
+        if self._project is None:
+            self._project = ProjectModel(self.files)
+        return self._project
+
+    def probe(self, probes: ProbeSet) -> ProbeHits:
+        """Hit map of an assignment's declared probes over the combined source."""
+        hits = self._probe_hits.get(id(probes))
+        if hits is None:
+            hits = self._probe_hits[id(probes)] = probes.scan(self.combined)
+        return hits
+
+    def get(self, path: Path) -> Optional[SourceFile]:
+        return self._by_path.get(path)
+
+    @property
+    def parsed_count(self) -> int:
+        """Files analyzed so far; the rest were only header-scanned."""
+        return sum(1 for sf in self.files if sf.parsed)
+
+    def primary_file(self) -> SourceFile:
+        """
+        Find the primary class file for AST analysis (not the test/main file).
+        Heuristic: prefer files WITHOUT main(), then prefer files without 'test'/'main' in name.
+        """
+        if len(self.files) == 1:
+            return self.files[0]
+
+        non_main = [sf for sf in self.files if not sf.has_main]
+        with_main = [sf for sf in self.files if sf.has_main]
+
+        # Prefer non-main files (the class definition); among those, and
+        # failing that among main files, avoid ones named 'test' or 'main'
+        for candidates in (non_main, with_main):
+            for sf in candidates:
+                stem = sf.path.stem.lower()
+                if 'test' not in stem and 'main' not in stem:
+                    return sf
+            if candidates:
+                return candidates[0]
+        return self.files[0]
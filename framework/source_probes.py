@@ -0,0 +1,90 @@
+"""Named source probes declared up front by an assignment and compiled once per process."""
+
+import re
+from typing import Dict, Iterator, Mapping, Pattern, Tuple, Union
+
+ProbeSpec = Union[str, Tuple[str, int]]
+
+# Flags a probe may carry; each becomes an inline flag scoped to its own
+# alternative of the combined search pattern
+_INLINE_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's', re.VERBOSE: 'x'}
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    letters = ""
+    for flag, letter in _INLINE_FLAGS.items():
+        if flags & flag:
+            letters += letter
+            flags &= ~flag
+    if flags:
+        raise ValueError(f"unsupported probe flags: {flags!r}")
+    return f"(?{letters}:{pattern})" if letters else f"(?:{pattern})"
+
+
+class ProbeSet:
+    """
+    A registry of named regex probes, e.g.
+
+        PROBES = ProbeSet(math_pow=(r'Math\\.pow', re.IGNORECASE),
+                          tostring=r'toString\\s*\\(')
+
+    Patterns are compiled when the set is created (module import), and
+    scan() answers all of them in a single forward pass over a source: a
+    combined lookahead of the probes still missing finds the next position
+    where any of them matches, every missing probe is tried there (so
+    probes matching at the same position or overlapping are all reported),
+    and the search resumes after it with the probes that hit dropped. The
+    combined pattern for each set of missing probes is compiled once.
+    """
+
+    def __init__(self, **probes: ProbeSpec):
+        self.patterns: Dict[str, Pattern] = {}
+        self._alternatives: Dict[str, str] = {}
+        for name, spec in probes.items():
+            pattern, flags = (spec, 0) if isinstance(spec, str) else spec
+            self.patterns[name] = re.compile(pattern, flags)
+            self._alternatives[name] = _scoped(pattern, flags)
+        self._combined: Dict[Tuple[str, ...], Pattern] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.patterns
+
+    def _search_pattern(self, names: Tuple[str, ...]) -> Pattern:
+        pattern = self._combined.get(names)
+        if pattern is None:
+            alternatives = "|".join(self._alternatives[name] for name in names)
+            pattern = self._combined[names] = re.compile(f"(?=(?:{alternatives}))")
+        return pattern
+
+    def scan(self, source: str) -> 'ProbeHits':
+        """Hit map for one source, from one pass that stops once every probe has hit."""
+        hits = dict.fromkeys(self.patterns, False)
+        missing = tuple(self.patterns)
+        pos = 0
+        while missing:
+            found = self._search_pattern(missing).search(source, pos)
+            if found is None:
+                break
+            pos = found.start()
+            for name in missing:
+                if self.patterns[name].match(source, pos):
+                    hits[name] = True
+            missing = tuple(name for name in missing if not hits[name])
+            pos += 1
+        return ProbeHits(hits)
+
+
+class ProbeHits(Mapping):
+    """Probe name -> bool for one source."""
+
+    def __init__(self, hits: Dict[str, bool]):
+        self._hits = hits
+
+    def __getitem__(self, name: str) -> bool:
+        return self._hits[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._hits)
+
+    def __len__(self) -> int:
+        return len(self._hits)
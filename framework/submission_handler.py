@@ -1,10 +1,11 @@
 """Handles Canvas bulk download extraction and student submission discovery."""
 
+import os
 import zipfile
 import shutil
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from framework.utils import parse_canvas_filename, create_temp_dir
 
@@ -18,13 +19,45 @@ class StudentSubmission:
     java_files: List[Path] = field(default_factory=list)
     extract_dir: Optional[Path] = None
     error: str = ""
+    late: bool = False
+
+
+def _attempt_number(submission_id: str) -> int:
+    return int(submission_id) if submission_id.isdigit() else -1
+
+
+def select_latest_attempts(submissions: List[StudentSubmission]):
+    """
+    Keep only the newest attempt per student.
+    Attempts are grouped by canvas_id and ranked by submission ID (Canvas
+    assigns increasing IDs to resubmissions). Submissions without a
+    canvas_id cannot be grouped and are always kept.
+    Returns (selected, superseded), both in input order.
+    """
+    latest: Dict[str, StudentSubmission] = {}
+    for sub in submissions:
+        if not sub.canvas_id:
+            continue
+        current = latest.get(sub.canvas_id)
+        if current is None or _attempt_number(sub.submission_id) > _attempt_number(current.submission_id):
+            latest[sub.canvas_id] = sub
+
+    selected, superseded = [], []
+    for sub in submissions:
+        if not sub.canvas_id or latest[sub.canvas_id] is sub:
+            selected.append(sub)
+        else:
+            superseded.append(sub)
+    return selected, superseded
 
 
 class SubmissionHandler:
     """Discovers and extracts student submissions from Canvas downloads."""
 
-    def __init__(self, input_path: Path):
+    def __init__(self, input_path: Path, all_attempts: bool = False):
         self.input_path = Path(input_path)
+        self.all_attempts = all_attempts
+        self.superseded: List[StudentSubmission] = []
         self.temp_dir = create_temp_dir("submissions_")
 
     def discover_submissions(self) -> List[StudentSubmission]:
@@ -35,21 +68,45 @@ class SubmissionHandler:
         - A single Canvas bulk download .zip containing student zips
         - A single student .zip file
         """
+        return list(self.iter_submissions(sort=True))
+
+    @property
+    def streams(self) -> bool:
+        """Whether iter_submissions(sort=False) yields before the input is fully listed."""
+        return self.all_attempts and self.input_path.is_dir()
+
+    def iter_submissions(self, sort: bool = False) -> Iterator[StudentSubmission]:
+        """
+        Lazily yield submissions from the input path.
+        With all_attempts set and sort=False, directory entries are yielded
+        in os.scandir order as they are found, so grading can start before
+        a large directory is fully listed. Otherwise the listing completes
+        before the first yield (latest-attempt selection needs every attempt
+        of a student), and submissions are yielded by filename.
+        """
         if self.input_path.is_file() and self.input_path.suffix == '.zip':
             # Could be a single student zip or a Canvas bulk download
-            return self._handle_zip_file(self.input_path)
+            yield from self._handle_zip_file(self.input_path)
         elif self.input_path.is_dir():
-            return self._handle_directory(self.input_path)
-        else:
-            return []
-
-    def _handle_directory(self, directory: Path) -> List[StudentSubmission]:
-        """Process a directory of individual student zip files."""
-        submissions = []
-        for zip_file in sorted(directory.glob("*.zip")):
-            sub = self._parse_submission(zip_file)
-            submissions.append(sub)
-        return submissions
+            submissions = self._scan_directory(self.input_path)
+            if sort or not self.all_attempts:
+                submissions = sorted(submissions, key=lambda s: s.zip_path.name)
+            yield from self._select_attempts(submissions)
+
+    def _scan_directory(self, directory: Path) -> Iterator[StudentSubmission]:
+        """Yield a submission for each student zip file in a directory."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.zip') and not entry.name.startswith('.') and entry.is_file():
+                    yield self._parse_submission(Path(entry.path))
+
+    def _select_attempts(self, submissions: Iterable[StudentSubmission]) -> Iterable[StudentSubmission]:
+        """Drop superseded attempts unless every attempt should be graded."""
+        if self.all_attempts:
+            return submissions
+        selected, superseded = select_latest_attempts(list(submissions))
+        self.superseded.extend(superseded)
+        return selected
 
     def _handle_zip_file(self, zip_path: Path) -> List[StudentSubmission]:
         """Handle a single zip - either a bulk download or individual submission."""
@@ -73,14 +130,31 @@ class SubmissionHandler:
             return [sub]
 
     def _handle_bulk_download(self, bulk_zip: Path) -> List[StudentSubmission]:
-        """Extract a Canvas bulk download zip and process inner zips."""
+        """
+        Extract a Canvas bulk download zip and process inner zips.
+        Attempts are selected from the archive listing, so superseded
+        attempts are never extracted.
+        """
         extract_dir = self.temp_dir / "bulk"
         extract_dir.mkdir(parents=True, exist_ok=True)
 
         with zipfile.ZipFile(bulk_zip, 'r') as zf:
-            zf.extractall(extract_dir)
+            # Extracted path -> archive member name. Each member gets its own
+            # numbered folder: the same file name can appear in several
+            # folders of the archive, and the canvas fields are parsed from it
+            members = {}
+            names = [n for n in sorted(zf.namelist()) if n.endswith('.zip') and '__MACOSX' not in n]
+            for i, name in enumerate(names):
+                members[extract_dir / str(i) / Path(name).name] = name
+            submissions = list(self._select_attempts(
+                [self._parse_submission(path) for path in members]))
+
+            for sub in submissions:
+                sub.zip_path.parent.mkdir(exist_ok=True)
+                with zf.open(members[sub.zip_path]) as src, open(sub.zip_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
 
-        return self._handle_directory(extract_dir)
+        return submissions
 
     def _parse_submission(self, zip_path: Path) -> StudentSubmission:
         """Parse a single student submission zip."""
@@ -89,7 +163,8 @@ class SubmissionHandler:
             student_name=info["student_name"],
             canvas_id=info["canvas_id"],
             submission_id=info["submission_id"],
-            zip_path=zip_path
+            zip_path=zip_path,
+            late=info["late"]
         )
         return sub
 
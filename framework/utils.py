@@ -1,8 +1,13 @@
 """Utility functions for temp directory management and path helpers."""
 
+import os
+import stat
 import tempfile
 import shutil
 from pathlib import Path
+from typing import Optional
+
+_run_cache: Optional[Path] = None
 
 
 def create_temp_dir(prefix: str = "autograder_") -> Path:
@@ -11,6 +16,38 @@ def create_temp_dir(prefix: str = "autograder_") -> Path:
     return temp_dir
 
 
+def _private(path: Path) -> bool:
+    """Owned by this user and not writable by anyone else (always true where there are no uids)."""
+    info = path.lstat()
+    if not stat.S_ISDIR(info.st_mode):
+        return False
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        return False
+    return os.name == "nt" or not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def cache_dir() -> Path:
+    """
+    Private directory for results reused across runs (compiled helpers,
+    reference output): $XDG_CACHE_HOME/autograder or ~/.cache/autograder,
+    created 0700. Files found there are trusted, so if it is not owned by
+    this user or is writable by others, a fresh directory private to this
+    run is used instead and nothing carries over to the next run.
+    """
+    global _run_cache
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    path = Path(base) / "autograder"
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if _private(path):
+            return path
+    except OSError:
+        pass
+    if _run_cache is None:
+        _run_cache = create_temp_dir("autograder_cache_")  # mkdtemp creates it 0700
+    return _run_cache
+
+
 def cleanup_temp_dir(temp_dir: Path):
     """Remove a temporary directory and all contents."""
     if temp_dir and temp_dir.exists():
@@ -26,7 +63,8 @@ def parse_canvas_filename(filename: str) -> dict:
     """
     Parse a Canvas bulk download filename.
     Format: studentname_canvasID_submissionID_ProjectName.zip
-    Returns dict with student_name, canvas_id, submission_id, project_name.
+    Late submissions carry a marker: studentname_LATE_canvasID_submissionID_ProjectName.zip
+    Returns dict with student_name, canvas_id, submission_id, project_name, late.
     """
     stem = Path(filename).stem
     parts = stem.split('_')
@@ -34,11 +72,16 @@ def parse_canvas_filename(filename: str) -> dict:
     # Find the first all-digit segment (that's the canvas ID)
     for i, part in enumerate(parts):
         if part.isdigit() and i + 1 < len(parts) and parts[i + 1].isdigit():
+            name_parts = parts[:i]
+            late = bool(name_parts) and name_parts[-1].lower() == 'late'
+            if late:
+                name_parts = name_parts[:-1]
             return {
-                "student_name": '_'.join(parts[:i]),
+                "student_name": '_'.join(name_parts),
                 "canvas_id": parts[i],
                 "submission_id": parts[i + 1],
-                "project_name": '_'.join(parts[i + 2:])
+                "project_name": '_'.join(parts[i + 2:]),
+                "late": late
             }
 
     # Fallback: treat entire stem as student name
@@ -46,5 +89,6 @@ def parse_canvas_filename(filename: str) -> dict:
         "student_name": stem,
         "canvas_id": "",
         "submission_id": "",
-        "project_name": ""
+        "project_name": "",
+        "late": False
     }
@@ -0,0 +1,158 @@
+"""Per-student workspace lifecycle: pooled build dirs, eager cleanup and disk footprint tracking."""
+
+import os
+import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Set
+
+from framework.submission_handler import StudentSubmission
+
+
+def dir_size(path: Path) -> int:
+    """Total size in bytes of all regular files under a directory."""
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return total
+
+
+def format_bytes(num_bytes: int) -> str:
+    """Human-readable byte count (e.g. '12.3 MB')."""
+    if num_bytes < 1024:
+        return f"{num_bytes} B"
+    size = num_bytes / 1024
+    for unit in ('KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class Workspace:
+    """
+    A compile workspace: src/ (staged sources) and build/ (class files).
+    Directories are created once and remembered, so reusing a workspace for
+    another student only costs the file unlinks done by reset().
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.src_dir = self.root / "src"
+        self.build_dir = self.root / "build"
+        self._dirs: Set[Path] = set()
+        self.ensure_dir(self.src_dir)
+        self.ensure_dir(self.build_dir)
+
+    def ensure_dir(self, path: Path) -> Path:
+        """Create a directory unless this workspace already created it."""
+        if path not in self._dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(path)
+        return path
+
+    def reset(self):
+        """Empty the workspace, keeping the directory skeleton for the next user."""
+        for top in (self.src_dir, self.build_dir):
+            for dirpath, dirnames, filenames in os.walk(top):
+                for name in filenames:
+                    try:
+                        os.unlink(os.path.join(dirpath, name))
+                    except OSError:
+                        pass
+                # Symlinked directories are listed as dirs; unlink, don't descend
+                for name in list(dirnames):
+                    path = os.path.join(dirpath, name)
+                    if os.path.islink(path):
+                        os.unlink(path)
+                        dirnames.remove(name)
+
+
+class WorkspacePool:
+    """Pre-created workspaces handed out one per worker and reset on return."""
+
+    def __init__(self, root: Path, size: int = 1):
+        self.root = Path(root)
+        self._created = 0
+        self._free: List[Workspace] = [self._create() for _ in range(size)]
+
+    def _create(self) -> Workspace:
+        self._created += 1
+        return Workspace(self.root / f"workspace_{self._created}")
+
+    def acquire(self) -> Workspace:
+        """Take a free workspace, growing the pool if all are in use."""
+        return self._free.pop() if self._free else self._create()
+
+    def release(self, workspace: Workspace):
+        workspace.reset()
+        self._free.append(workspace)
+
+
+@dataclass
+class StudentWorkspace:
+    submission: StudentSubmission
+    workspace: Workspace
+
+
+class WorkspaceManager:
+    """
+    Owns every on-disk directory used while grading one student and
+    releases them as soon as the student's result is produced, including
+    when grading raises (or the run is interrupted). Build workspaces come
+    from a WorkspacePool and are reset rather than deleted. Tracks the peak
+    disk footprint of the run, sampled right before each release: what was
+    under root when the first student started (a bulk download's extracted
+    zips, say) plus the releasing student's own extract dir and workspace,
+    so a sample costs only that student's files.
+    """
+
+    def __init__(self, root: Path, pool_size: int = 1):
+        self.root = Path(root)
+        self.pool = WorkspacePool(self.root / "workspaces", size=pool_size)
+        self.peak_bytes = 0
+        self.released = 0
+        self._base_bytes: Optional[int] = None
+
+    @contextmanager
+    def student(self, submission: StudentSubmission) -> Iterator[StudentWorkspace]:
+        """Yield a workspace for one submission; release everything it used on exit."""
+        if self._base_bytes is None:
+            self._base_bytes = dir_size(self.root) if self.root.exists() else 0
+        workspace = StudentWorkspace(submission=submission, workspace=self.pool.acquire())
+        try:
+            yield workspace
+        finally:
+            self._release(workspace)
+
+    def _release(self, workspace: StudentWorkspace):
+        self.sample(workspace)
+        self.pool.release(workspace.workspace)
+        extract_dir: Optional[Path] = workspace.submission.extract_dir
+        if extract_dir and extract_dir.exists():
+            shutil.rmtree(extract_dir, ignore_errors=True)
+        workspace.submission.extract_dir = None
+        workspace.submission.java_files = []
+        self.released += 1
+
+    def sample(self, workspace: StudentWorkspace) -> int:
+        """Measure the footprint while this student's files exist and update the peak."""
+        current = self._base_bytes or 0
+        for path in (workspace.submission.extract_dir, workspace.workspace.root):
+            if path and path.exists():
+                current += dir_size(path)
+        self.peak_bytes = max(self.peak_bytes, current)
+        return current
@@ -14,10 +14,17 @@ Supports:
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
+from framework.class_analytics import build_match_matrix, numpy_available
+from framework.java_ast_analyzer import BACKENDS, DEFAULT_BACKEND, DEFAULT_PARSE_BUDGET
+from framework.property_checks import DEFAULT_SEED, PropertySuite, generate_loan_cases
+from framework.property_checks import numpy_available as property_checks_available
 from framework.submission_handler import SubmissionHandler
+from framework.reference_solution import ReferenceOutput, ReferenceSolutionError, load_reference
 from framework.report_generator import HTMLReportGenerator
 from framework.rubric import GradingResult
+from framework.workspace import WorkspaceManager, format_bytes
 
 
 ASSIGNMENT_GRADERS = {
@@ -45,6 +52,61 @@ def load_grader_class(assignment: str):
     return getattr(module, class_name)
 
 
+def grade_submission(GraderClass, handler: SubmissionHandler, sub, workspace,
+                     verbose: bool = False, analyzer_backend: str = DEFAULT_BACKEND,
+                     parse_budget: Optional[float] = DEFAULT_PARSE_BUDGET,
+                     reference: Optional[ReferenceOutput] = None,
+                     property_suite: Optional[PropertySuite] = None) -> GradingResult:
+    """Extract and grade one submission, printing its console status."""
+    if sub.error:
+        print(f"SKIP ({sub.error})")
+        return GradingResult(
+            student_name=sub.student_name,
+            student_id=sub.canvas_id,
+            total_score=0,
+            error_message=sub.error
+        )
+
+    # Extract java files
+    java_files = handler.extract_java_files(sub)
+
+    if not java_files:
+        print(f"SKIP ({sub.error or 'No Java files found'})")
+        return GradingResult(
+            student_name=sub.student_name,
+            student_id=sub.canvas_id,
+            total_score=0,
+            error_message=sub.error or "No Java files found in submission"
+        )
+
+    try:
+        grader = GraderClass(java_files, sub.student_name, sub.canvas_id,
+                             workspace=workspace.workspace, analyzer_backend=analyzer_backend,
+                             parse_budget=parse_budget, reference=reference,
+                             property_suite=property_suite)
+        result = grader.grade()
+        print(f"{result.total_score}/100 ({result.letter_grade})")
+
+        if verbose:
+            for item in result.rubric_items:
+                status = "PASS" if item.passed else "FAIL"
+                print(f"    [{status}] {item.description} ({'-' + str(item.deduction) if item.deduction else 'OK'})")
+            if result.oop_notes:
+                for note in result.oop_notes:
+                    print(f"    [OOP] {note}")
+            print()
+        return result
+
+    except Exception as e:
+        print(f"ERROR ({e})")
+        return GradingResult(
+            student_name=sub.student_name,
+            student_id=sub.canvas_id,
+            total_score=0,
+            error_message=str(e)
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Course Assignment Autograder',
@@ -53,7 +115,10 @@ def main():
   python grade.py pa1 ./submissions/pa1/
   python grade.py pa1 ./submissions/pa1/ --output pa1_grades.html
   python grade.py pa1 ./student_submission.zip
-  python grade.py pa1 ./canvas_bulk_download.zip"""
+  python grade.py pa1 ./canvas_bulk_download.zip
+  python grade.py pa1 ./canvas_bulk_download.zip --all-attempts
+  python grade.py pa2 ./submissions/pa2/ --reference ./solutions/PA2
+  python grade.py pa2 ./submissions/pa2/ --property-tests 2000"""
     )
     parser.add_argument('assignment', choices=ASSIGNMENT_GRADERS.keys(),
                         help='Assignment to grade')
@@ -63,6 +128,27 @@ def main():
                         help='Output HTML report path (default: <assignment>_report.html)')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Show detailed grading output')
+    parser.add_argument('--all-attempts', action='store_true',
+                        help='Grade every attempt instead of only the latest per student')
+    parser.add_argument('--sorted', action='store_true',
+                        help='With --all-attempts, grade in filename order after listing the whole '
+                             'input instead of as files are found (always the order otherwise)')
+    parser.add_argument('--analyzer', choices=BACKENDS, default=DEFAULT_BACKEND,
+                        help='Declaration analysis backend: full javalang parse, the faster '
+                             'declaration-only token scanner, or declarations recorded by javac '
+                             'while compiling (default: %(default)s)')
+    parser.add_argument('--parse-budget', type=float, default=DEFAULT_PARSE_BUDGET, metavar='SECONDS',
+                        help='Abandon a javalang parse after this many seconds and fall back to '
+                             'the declaration scanner; 0 disables the limit (default: %(default)s)')
+
+    parser.add_argument('--reference', type=Path, default=None, metavar='PROJECT',
+                        help='Instructor reference solution (project dir, zip or .java); its output, '
+                             'cached by source hash, is shown as the expected output')
+    parser.add_argument('--property-tests', type=int, default=0, metavar='N',
+                        help='Also call each student\'s payment method on N random loans in one JVM '
+                             'and report errors by region (requires numpy; default: off)')
+    parser.add_argument('--property-seed', type=int, default=DEFAULT_SEED,
+                        help='Seed for the random loans, shared by all students (default: %(default)s)')
 
     args = parser.parse_args()
 
@@ -79,74 +165,66 @@ def main():
     print(f"  Input: {args.input_path}")
     print(f"{'='*60}")
 
-    # Discover submissions
-    handler = SubmissionHandler(args.input_path)
-    submissions = handler.discover_submissions()
+    # Run the reference solution (or reuse its cached output) before any student
+    reference = None
+    if args.reference:
+        try:
+            reference = load_reference(args.reference)
+        except ReferenceSolutionError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"  Reference: {args.reference} ({'cached' if reference.cached else 'ran'}, "
+              f"{len(reference.tokens)} values)")
+        drifted = reference.missing(GraderClass.expected_values, GraderClass.value_tolerance)
+        if drifted:
+            print(f"  Warning: expected values not printed by the reference: {', '.join(drifted)}")
 
-    if not submissions:
-        print("No submissions found.")
-        sys.exit(1)
+    # Random loans and their expected payments are generated once for the whole class
+    property_suite = None
+    if args.property_tests > 0 and GraderClass.payment_property is not None:
+        if property_checks_available():
+            cases = generate_loan_cases(args.property_tests, args.property_seed)
+            property_suite = PropertySuite(GraderClass.payment_property, cases, GraderClass.value_tolerance)
+            print(f"  Property tests: {len(cases)} random loans (seed {args.property_seed})")
+        else:
+            print("  Property tests skipped (install numpy to enable)")
 
-    print(f"\nFound {len(submissions)} submission(s)\n")
+    # With --all-attempts a directory is graded while it is still being
+    # listed; latest-attempt selection needs the full listing first
+    handler = SubmissionHandler(args.input_path, all_attempts=args.all_attempts)
+    if handler.streams and not args.sorted:
+        submissions, total = handler.iter_submissions(), None
+    else:
+        submissions = handler.discover_submissions()
+        total = len(submissions)
+    print()
 
-    # Grade each submission
+    # Grade each submission; each student's extraction and build dirs are
+    # released as soon as their result is produced
+    workspaces = WorkspaceManager(handler.temp_dir)
     results = []
-    for i, sub in enumerate(submissions, 1):
-        print(f"[{i}/{len(submissions)}] Grading: {sub.student_name}...", end=" ")
-
-        if sub.error:
-            print(f"SKIP ({sub.error})")
-            result = GradingResult(
-                student_name=sub.student_name,
-                student_id=sub.canvas_id,
-                total_score=0,
-                error_message=sub.error
-            )
-            results.append(result)
-            continue
-
-        # Extract java files
-        java_files = handler.extract_java_files(sub)
-
-        if not java_files:
-            print(f"SKIP ({sub.error or 'No Java files found'})")
-            result = GradingResult(
-                student_name=sub.student_name,
-                student_id=sub.canvas_id,
-                total_score=0,
-                error_message=sub.error or "No Java files found in submission"
-            )
+    try:
+        for i, sub in enumerate(submissions, 1):
+            progress = f"{i}/{total}" if total is not None else str(i)
+            print(f"[{progress}] Grading: {sub.student_name}...", end=" ")
+            with workspaces.student(sub) as workspace:
+                result = grade_submission(GraderClass, handler, sub, workspace, args.verbose,
+                                          analyzer_backend=args.analyzer,
+                                          parse_budget=args.parse_budget, reference=reference,
+                                          property_suite=property_suite)
             results.append(result)
-            continue
+    finally:
+        handler.cleanup()
 
-        try:
-            grader = GraderClass(java_files, sub.student_name, sub.canvas_id)
-            result = grader.grade()
-            results.append(result)
-            print(f"{result.total_score}/100 ({result.letter_grade})")
-
-            if args.verbose:
-                for item in result.rubric_items:
-                    status = "PASS" if item.passed else "FAIL"
-                    print(f"    [{status}] {item.description} ({'-' + str(item.deduction) if item.deduction else 'OK'})")
-                if result.oop_notes:
-                    for note in result.oop_notes:
-                        print(f"    [OOP] {note}")
-                print()
-
-        except Exception as e:
-            print(f"ERROR ({e})")
-            result = GradingResult(
-                student_name=sub.student_name,
-                student_id=sub.canvas_id,
-                total_score=0,
-                error_message=str(e)
-            )
-            results.append(result)
+    if not results:
+        print("No submissions found.")
+        sys.exit(1)
 
     # Generate report
     output_path = args.output or Path(f"{args.assignment}_report.html")
-    reporter = HTMLReportGenerator(display_name, results)
+    expected_values = reference.labeled_values() if reference else GraderClass.expected_values
+    analytics = build_match_matrix(results, expected_values, GraderClass.value_tolerance)
+    reporter = HTMLReportGenerator(display_name, results, analytics)
     reporter.generate(output_path)
 
     # Console summary
@@ -154,16 +232,38 @@ def main():
     print(f"  GRADING COMPLETE")
     print(f"{'='*60}")
     print(f"  Students graded: {len(results)}")
+    if handler.superseded:
+        print(f"  Superseded attempts skipped: {len(handler.superseded)} (use --all-attempts to grade them)")
     if results:
         scores = [r.total_score for r in results]
         print(f"  Average score: {sum(scores)/len(scores):.1f}/100")
         print(f"  High: {max(scores)}/100  Low: {min(scores)}/100")
+    files_total = sum(r.files_total for r in results)
+    files_parsed = sum(r.files_parsed for r in results)
+    if files_total:
+        print(f"  Source files parsed: {files_parsed}/{files_total} "
+              f"({files_total - files_parsed} parses avoided)")
+    if analytics is not None:
+        worst = int(analytics.hit_rates.argmin())
+        print(f"  Least-matched value: {analytics.labels[worst]} "
+              f"({analytics.hit_counts[worst]}/{len(analytics.students)} students with output)")
+    elif GraderClass.expected_values and not numpy_available():
+        print("  Class analytics skipped (install numpy to enable)")
+    tested = [r.property_report for r in results if r.property_report is not None]
+    if tested:
+        failing = [p for p in tested if p.failures]
+        print(f"  Property tests: {len(tested) - len(failing)}/{len(tested)} students correct on every case")
+        regions = {}
+        for report in failing:
+            for name in report.failing_regions:
+                regions[name] = regions.get(name, 0) + 1
+        if regions:
+            common = sorted(regions.items(), key=lambda kv: -kv[1])
+            print(f"  Failing regions: {', '.join(f'{name} ({count})' for name, count in common)}")
+    print(f"  Peak disk usage: {format_bytes(workspaces.peak_bytes)}")
     print(f"  Report: {output_path.resolve()}")
     print(f"{'='*60}")
 
-    # Cleanup
-    handler.cleanup()
-
     return 0
 
 
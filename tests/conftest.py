@@ -0,0 +1,6 @@
+"""Make the repository importable when pytest is run from any directory."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
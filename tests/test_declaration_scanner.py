@@ -0,0 +1,92 @@
+"""The declaration scanner backend indexes the same declarations as a full javalang parse."""
+
+import pytest
+
+from framework.declaration_scanner import scan_declarations
+from framework.java_ast_analyzer import JavaASTAnalyzer
+
+pytest.importorskip("javalang")
+
+LOAN_ACCOUNT = """package pa2;
+
+public class LoanAccount {
+    private double principal;
+    private double annualInterestRate;
+    private int months;
+
+    public LoanAccount(double principal, double annualInterestRate, int months) {
+        this.principal = principal;
+        this.annualInterestRate = annualInterestRate;
+        this.months = months;
+    }
+
+    public double calculateMonthlyPayment() {
+        double monthlyInterest = annualInterestRate / 100 / 12;
+        return principal * (monthlyInterest / (1 - Math.pow(1 + monthlyInterest, -months)));
+    }
+
+    public double getPrincipal() { return principal; }
+
+    @Override
+    public String toString() {
+        return String.format("Principal: $%.2f%n", principal);
+    }
+}
+"""
+
+MIXED_TYPES = """package demo;
+import java.util.*;
+
+public class Outer extends Base implements Comparable<Outer>, Runnable {
+    private static final int LIMIT = 10, OTHER = 2;
+    protected List<Map<String, Integer>> table = new ArrayList<>();
+    int[] counts;
+    public Outer(int a, String... rest) { super(a); }
+    Outer() { this(1); }
+    @Override public int compareTo(Outer o) { return 0; }
+    public void run() { Runnable r = new Runnable() { public void run() {} }; }
+    static <T extends Number> T pick(T[] xs, java.util.function.Function<T, T> f) { return xs[0]; }
+    static class Node { Node next; Node(Node n) { next = n; } }
+    interface Visitor extends Runnable { void visit(Node n); }
+    enum Color { RED, GREEN; private final int x = 0; Color() {} int x() { return x; } }
+}
+
+class Second { static class Node { String label; } }
+
+interface Shape extends Comparable<Shape>, Cloneable { double area(); }
+
+enum Dir implements Runnable { N, S; public void run() {} }
+"""
+
+
+def _declarations(analyzer: JavaASTAnalyzer):
+    return analyzer._package, analyzer._class_infos(None)
+
+
+@pytest.mark.parametrize("source", [LOAN_ACCOUNT, MIXED_TYPES], ids=["loan_account", "mixed_types"])
+def test_scanner_matches_javalang(source):
+    parsed = JavaASTAnalyzer(source, backend='javalang')
+    scanned = JavaASTAnalyzer(source, backend='scanner')
+    assert parsed.parse_error is None
+    assert _declarations(scanned) == _declarations(parsed)
+
+
+def test_nested_types_are_keyed_by_qualified_name():
+    package, classes = scan_declarations(MIXED_TYPES)
+    assert package == "demo"
+    assert {"Outer.Node", "Second.Node", "Outer.Visitor", "Outer.Color"} <= set(classes)
+    assert [f.name for f in classes["Outer.Node"].fields] == ["next"]
+    assert [f.name for f in classes["Second.Node"].fields] == ["label"]
+
+
+def test_anonymous_class_members_are_not_indexed():
+    analyzer = JavaASTAnalyzer(MIXED_TYPES, backend='scanner')
+    assert [m.name for m in analyzer.get_methods("Outer")] == ["compareTo", "run", "pick"]
+
+
+def test_malformed_source_falls_back_to_the_scanner():
+    source = "public class Broken { private int x; void m( { }"
+    analyzer = JavaASTAnalyzer(source)
+    assert analyzer.parse_error is not None
+    assert analyzer.get_class_names() == ["Broken"]
+    assert [f.name for f in analyzer.get_fields("Broken")] == ["x"]
@@ -0,0 +1,146 @@
+"""Java arithmetic translated to NumPy, and the PA2 source formula check built on it."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+javalang = pytest.importorskip("javalang")
+
+from framework.formula_eval import MethodTranslator, UnsupportedFormula, find_class, translate  # noqa: E402
+from framework.property_checks import amortized_payments  # noqa: E402
+from framework.rubric import get_item  # noqa: E402
+from framework.source_bundle import SourceBundle  # noqa: E402
+from assignments.pa2.formula_checks import check_formula  # noqa: E402
+from assignments.pa2.rubric_items import create_pa2_rubric  # noqa: E402
+
+LOAN_ACCOUNT = """package pa2;
+
+public class LoanAccount {
+    private static final double MONTHS_PER_YEAR = 12.0;
+    private double principal;
+    private double annualInterestRate;
+    private int months;
+
+    public LoanAccount(double principal, double annualInterestRate, int months) {
+        this.principal = principal;
+        this.annualInterestRate = annualInterestRate;
+        this.months = months;
+    }
+
+    private double monthlyRate() {
+        return annualInterestRate / 100 / MONTHS_PER_YEAR;
+    }
+
+    public double calculateMonthlyPayment() {
+        double monthlyInterest = monthlyRate();
+        return principal * (monthlyInterest / (1 - Math.pow(1 + monthlyInterest, -months)));
+    }
+}
+"""
+
+MAIN = """package pa2;
+
+public class Main {
+    public static void main(String[] args) {
+        LoanAccount loan = new LoanAccount(25000.00, 4.25, 72);
+        System.out.println(loan.calculateMonthlyPayment());
+    }
+}
+"""
+
+
+def _method(body: str, fields: str = "int a; int b; double x;"):
+    tree = javalang.parse.parse(f"class T {{ {fields} double f() {{ {body} }} }}")
+    return translate(tree, "T", "f")
+
+
+def test_payment_formula_matches_the_reference():
+    tree = javalang.parse.parse(LOAN_ACCOUNT)
+    payment = translate(tree, "LoanAccount", "calculateMonthlyPayment")
+    principal = np.array([1000.0, 25000.0, 250000.0])
+    rate = np.array([0.5, 4.25, 3.1])
+    months = np.array([6, 72, 360])
+    computed = payment({"principal": principal, "annualInterestRate": rate, "months": months})
+    assert np.allclose(computed, amortized_payments(principal, rate, months))
+
+
+def test_int_division_truncates():
+    f = _method("return a / b;")
+    assert list(f({"a": [7, -7, 1], "b": [2, 2, 3]})) == [3, -3, 0]
+    g = _method("return (double) a / b;")
+    assert list(g({"a": [7, 1], "b": [2, 4]})) == [3.5, 0.25]
+
+
+def test_int_division_by_zero_is_nan():
+    f = _method("return a / b;")
+    assert np.isnan(f({"a": [1], "b": [0]})).all()
+
+
+def test_if_and_early_return_per_lane():
+    f = _method("if (b == 0) { return x; } double y = x * 2; if (y > 10) return 10; return y;")
+    assert list(f({"b": [0, 1, 1], "x": [3, 4, 6]})) == [3, 8, 10]
+
+
+def test_missing_field_value_is_unsupported():
+    f = _method("return x + a;")
+    with pytest.raises(UnsupportedFormula):
+        f({"x": [1.0]})
+
+
+@pytest.mark.parametrize("body", [
+    "double t = 0; for (int i = 0; i < b; i++) { t += x; } return t;",
+    "count++; return x;",
+    'return "abc".length();',
+    'String s = "x"; return x;',
+    "return java.util.Objects.hash(x);",
+])
+def test_unsupported_java_is_not_translated(body):
+    assert _method(body) is None
+
+
+def test_compile_reports_unsupported_constructs():
+    tree = javalang.parse.parse("class T { double x; double f() { while (x > 0) { x--; } return x; } }")
+    with pytest.raises(UnsupportedFormula):
+        MethodTranslator(find_class(tree, "T")).compile("f")
+
+
+def _la_calculate(tmp_path, loan_source: str, passed: bool = True):
+    (tmp_path / "LoanAccount.java").write_text(loan_source)
+    (tmp_path / "Main.java").write_text(MAIN)
+    bundle = SourceBundle(sorted(tmp_path.glob("*.java")))
+    items = create_pa2_rubric()
+    item = get_item(items, "la_calculate")
+    if not passed:
+        item.passed, item.deduction, item.notes = False, item.max_deduction, "Structure check failed"
+    check_formula(items, bundle)
+    return item
+
+
+def test_check_formula_verifies_a_correct_method(tmp_path):
+    item = _la_calculate(tmp_path, LOAN_ACCOUNT, passed=False)
+    assert (item.passed, item.deduction) == (True, 0)
+    assert "verified from source" in item.notes
+
+
+def test_check_formula_only_notes_a_wrong_method_that_passed(tmp_path):
+    item = _la_calculate(tmp_path, LOAN_ACCOUNT.replace("annualInterestRate / 100 /", "annualInterestRate /"))
+    assert (item.passed, item.deduction) == (True, 0)
+    assert "Formula incorrect" in item.notes
+
+
+def test_check_formula_leaves_a_divided_rate_alone(tmp_path):
+    # The constructor stores rate / 100, so the grid's rates are not what the method sees
+    source = (LOAN_ACCOUNT
+              .replace("this.annualInterestRate = annualInterestRate;",
+                       "this.annualInterestRate = annualInterestRate / 100.0;")
+              .replace("annualInterestRate / 100 /", "annualInterestRate /"))
+    item = _la_calculate(tmp_path, source, passed=False)
+    assert (item.passed, item.notes) == (False, "Structure check failed")
+
+
+@pytest.mark.parametrize("change", [
+    ("double monthlyInterest = monthlyRate();", "double monthlyInterest = monthlyRate(); count++;"),
+    ("return annualInterestRate / 100", 'String label = "rate"; return annualInterestRate / 100'),
+])
+def test_check_formula_leaves_untranslatable_source_alone(tmp_path, change):
+    item = _la_calculate(tmp_path, LOAN_ACCOUNT.replace(*change), passed=False)
+    assert (item.passed, item.notes) == (False, "Structure check failed")
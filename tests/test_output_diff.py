@@ -0,0 +1,71 @@
+"""The bounded line diff is a shortest edit script and its opcodes tile both outputs."""
+
+import random
+
+from framework.output_diff import diff_lines, diff_outputs, normalize_line
+
+
+def _lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def _check_tiling(diff, expected, actual):
+    """Opcodes cover every compared line of both sides, in order, and equal blocks really are equal."""
+    a = [normalize_line(line) for line in diff_lines(expected)]
+    b = [normalize_line(line) for line in diff_lines(actual)]
+    i = j = 0
+    for tag, i1, i2, j1, j2 in diff.opcodes:
+        assert (i1, j1) == (i, j)
+        assert tag in ('equal', 'replace', 'delete', 'insert')
+        if tag == 'equal':
+            assert a[i1:i2] == b[j1:j2]
+        if tag == 'delete':
+            assert j1 == j2
+        if tag == 'insert':
+            assert i1 == i2
+        i, j = i2, j2
+    assert (i, j) == (len(a), len(b))
+    return a, b
+
+
+def test_diff_is_optimal_on_random_outputs():
+    rng = random.Random(50)
+    for _ in range(300):
+        expected = "\n".join(rng.choice("abcd") for _ in range(rng.randint(0, 25)))
+        actual = "\n".join(rng.choice("abcde") for _ in range(rng.randint(0, 25)))
+        diff = diff_outputs(expected, actual)
+        assert not diff.approximate and not diff.truncated
+        a, b = _check_tiling(diff, expected, actual)
+        matched = sum(i2 - i1 for tag, i1, i2, _, _ in diff.opcodes if tag == 'equal')
+        assert matched == _lcs_length(a, b)
+        removed, added = diff.changed_lines
+        assert (removed, added) == (len(a) - matched, len(b) - matched)
+
+
+def test_whitespace_and_trailing_blank_lines_are_ignored():
+    diff = diff_outputs("Payment:  $393.98\nVIN: X\n", "  Payment: $393.98\nVIN: X  \n\n\n")
+    assert diff.identical
+    assert diff.opcodes == [('equal', 0, 2, 0, 2)]
+
+
+def test_too_many_edits_gives_one_replace_block():
+    expected = "\n".join(["head"] + [f"e{i}" for i in range(30)] + ["tail"])
+    actual = "\n".join(["head"] + [f"a{i}" for i in range(30)] + ["tail"])
+    diff = diff_outputs(expected, actual, max_edits=10)
+    assert diff.approximate
+    assert diff.opcodes == [('equal', 0, 1, 0, 1), ('replace', 1, 31, 1, 31), ('equal', 31, 32, 31, 32)]
+    _check_tiling(diff, expected, actual)
+
+
+def test_long_outputs_are_truncated():
+    expected = "\n".join(str(i) for i in range(20))
+    actual = "\n".join(str(i) for i in range(5))
+    diff = diff_outputs(expected, actual, max_lines=10)
+    assert diff.truncated
+    assert diff.opcodes == [('equal', 0, 5, 0, 5), ('delete', 5, 10, 5, 5)]
@@ -0,0 +1,56 @@
+"""OutputIndex lookups agree with a linear scan of the output's numbers."""
+
+import random
+import re
+
+from framework.output_index import OutputIndex
+
+OUTPUT = """Car Loan with:
+Principal: $25000.00
+Annual Interest Rate: 4.25%
+Monthly Payment: $393.98
+Primary Mortgage Loan with:
+Monthly Payment: $1067.54
+PMI Monthly Amount: $35.12
+Unsecured Loan with:
+Monthly Payment: $128.62
+"""
+
+
+def _linear_near(output, value, tolerance):
+    return [m.group() for m in re.finditer(r'\d+\.\d+', output) if abs(float(m.group()) - value) <= tolerance]
+
+
+def test_tokens_in_output_order():
+    index = OutputIndex(OUTPUT)
+    assert [t.text for t in index.tokens] == ["25000.00", "4.25", "393.98", "1067.54", "35.12", "128.62"]
+    assert index.tokens[2].decimals == 2
+    assert OUTPUT[index.tokens[2].start:].startswith("393.98")
+
+
+def test_contains_within_tolerance():
+    index = OutputIndex(OUTPUT)
+    assert index.contains(393.99, 0.01)
+    assert index.contains(393.97, 0.02)
+    assert not index.contains(393.95, 0.02)
+    assert not index.contains(72, 0.5)  # Integers are not tokens
+
+
+def test_matched_and_between():
+    index = OutputIndex(OUTPUT)
+    expected = {"car": 393.98, "mortgage": 1067.54, "missing": 999.99}
+    assert index.matched(expected, 0.02) == {"car", "mortgage"}
+    assert [t.text for t in index.between(100, 1100)] == ["393.98", "1067.54", "128.62"]
+
+
+def test_near_agrees_with_a_linear_scan():
+    rng = random.Random(7)
+    for _ in range(200):
+        numbers = [f"{rng.uniform(0, 50):.{rng.randint(1, 4)}f}" for _ in range(rng.randint(0, 30))]
+        output = " x ".join(numbers)
+        index = OutputIndex(output)
+        for _ in range(10):
+            value = rng.uniform(0, 50)
+            tolerance = rng.choice([0.0, 0.005, 0.01, 0.5, 3.0])
+            assert [t.text for t in index.near(value, tolerance)] == _linear_near(output, value, tolerance)
+            assert index.contains(value, tolerance) == bool(_linear_near(output, value, tolerance))
@@ -0,0 +1,91 @@
+"""Record segmentation of program output and the PA2 checks built on it."""
+
+import re
+
+import pytest
+
+from framework.output_records import RecordParser
+from framework.rubric import get_item
+from assignments.pa2.expected_values import get_expected_output_text
+from assignments.pa2.output_checks import RECORDS, check_output
+from assignments.pa2.rubric_items import create_pa2_rubric
+from assignments.pa3.output_checks import RECORDS as PA3_RECORDS
+
+
+def _trailing_headers(text: str) -> str:
+    """Move each "... Loan with:" header to the end of its block, as a toString printing the type last would."""
+    out, pending = [], None
+    for line in text.split("\n") + [""]:
+        if re.search(r'loan with', line, re.I):
+            pending = line
+            continue
+        if not line.strip() and pending:
+            out.append(pending)
+            pending = None
+        out.append(line)
+    return "\n".join(out)
+
+
+def test_expected_output_segments_into_loans():
+    parsed = RECORDS.parse(get_expected_output_text())
+    assert [r.kind for r in parsed.records] == ["car", "mortgage", "unsecured"]
+    assert parsed.numbers("car", "payment") == [393.98]
+    assert parsed.numbers("mortgage", "payment") == [1067.54]
+    assert parsed.numbers("mortgage", "pmi") == [35.12]
+    assert parsed.of_kind("car")[0].text("vin") == "IRQ3458977"
+
+
+def test_thousands_separators_are_read():
+    parsed = RECORDS.parse("Mortgage\nPrincipal: $250,000.00\nMonthly Payment: $1,067.54\n")
+    record = parsed.of_kind("mortgage")[0]
+    assert record.number_text("principal") == "250000.00"
+    assert record.number("payment") == 1067.54
+
+
+def test_first_section_and_first_label_win():
+    parser = RecordParser(sections={"a": r'alpha', "b": r'alpha|beta'}, fields={"x": r'\bx\b'})
+    parsed = parser.parse("ignored x 1\nalpha\nx = 2\nx = 3\nbeta x: 4\n")
+    assert [(r.kind, r.number("x")) for r in parsed.records] == [("a", 2.0), ("b", 4.0)]
+
+
+def test_containers_own_the_records_inside_them():
+    output = """Report for customer Jane Doe
+Car Loan with:
+Monthly Payment: $393.98
+Report for customer John Roe
+Car Loan with:
+Monthly Payment: $500.00
+"""
+    parsed = PA3_RECORDS.parse(output)
+    assert parsed.numbers("car", "payment") == [393.98, 500.0]
+    assert parsed.numbers("car", "payment", owner="jane") == [393.98]
+    assert parsed.numbers("car", "payment", owner="John Roe") == [500.0]
+
+
+def test_undeclared_container_is_rejected():
+    with pytest.raises(ValueError, match="not declared sections"):
+        RecordParser(sections={"a": "a"}, fields={}, containers=["b"])
+
+
+def _deductions(output: str):
+    items = create_pa2_rubric()
+    check_output(items, output)
+    return {item_id: get_item(items, item_id) for item_id in ("main_code", "la_calculate")}
+
+
+def test_expected_output_loses_nothing():
+    for item in _deductions(get_expected_output_text()).values():
+        assert item.deduction == 0 and item.passed
+
+
+def test_type_printed_after_the_fields_loses_nothing():
+    items = _deductions(_trailing_headers(get_expected_output_text()))
+    assert all(item.deduction == 0 and item.passed for item in items.values())
+    assert "found elsewhere" in items["main_code"].notes
+
+
+def test_wrong_payment_is_deducted():
+    items = _deductions(get_expected_output_text().replace("393.98", "412.50"))
+    main_code = items["main_code"]
+    assert main_code.deduction > 0 and not main_code.passed
+    assert "car loan payment printed as 412.50" in main_code.notes
@@ -0,0 +1,91 @@
+"""OverridePlan validation, dependency ordering and application."""
+
+import pytest
+
+from framework.output_index import OutputIndex
+from framework.overrides import MAX, Outcome, Override, OutputContext, OverridePlan, PredicateSet
+from framework.rubric import RubricItem, RubricSpec, get_item
+
+RUBRIC = RubricSpec([
+    RubricItem("calc", "Formula", "Payment formula", 10),
+    RubricItem("fmt", "Output", "Formatting", 4),
+])
+NO_PREDICATES = PredicateSet()
+
+
+def _rule(name, item="calc", after=(), **kwargs):
+    return Override(name, item=item, after=tuple(after), cases=kwargs.pop("cases", []), **kwargs)
+
+
+def _context(output=""):
+    return OutputContext(output, OutputIndex(output))
+
+
+def test_dependencies_run_first_and_the_rest_keep_declared_order():
+    plan = OverridePlan(RUBRIC, NO_PREDICATES, [
+        _rule("a", after=["c"]),
+        _rule("b"),
+        _rule("c", after=["d"]),
+        _rule("d"),
+        _rule("e", after=["a"]),
+    ])
+    assert [r.name for r in plan.order] == ["d", "c", "a", "b", "e"]
+
+
+@pytest.mark.parametrize("rules, message", [
+    ([_rule("a", after=["b"]), _rule("b", after=["a"])], "cycle"),
+    ([_rule("a", after=["a"])], "cycle"),
+    ([_rule("a", after=["missing"])], "unknown rules"),
+    ([_rule("a", item="nope")], "unknown rubric item"),
+    ([_rule("a"), _rule("a")], "Duplicate"),
+])
+def test_invalid_plans_are_rejected(rules, message):
+    with pytest.raises(ValueError, match=message):
+        OverridePlan(RUBRIC, NO_PREDICATES, rules)
+
+
+def test_apply_follows_only_if_passed_and_first_matching_case():
+    predicates = PredicateSet(found=lambda c: len(c.index.matched({"car": 393.98}, 0.02)))
+    plan = OverridePlan(RUBRIC, predicates, [
+        _rule("downgrade", only_if_passed=True, cases=[
+            (lambda p: p["found"] == 0, Outcome(MAX, False, "Formula incorrect: {found} payments found")),
+            (lambda p: True, Outcome(1, False, "unreachable when nothing is found")),
+        ]),
+        _rule("upgrade", only_if_passed=False, after=["downgrade"], cases=[
+            (lambda p: p["found"] > 0, Outcome(0, True, "Verified by output")),
+        ]),
+    ])
+    items = RUBRIC.instantiate()
+    plan.apply(items, plan.evaluate(_context("Monthly Payment: $500.00")))
+    calc = get_item(items, "calc")
+    # The upgrade rule runs after the downgrade, sees a failed item and no payments, and does nothing
+    assert (calc.deduction, calc.passed, calc.notes) == (10, False, "Formula incorrect: 0 payments found")
+
+    items = RUBRIC.instantiate()
+    get_item(items, "calc").passed = False
+    plan.apply(items, plan.evaluate(_context("Monthly Payment: $393.98")))
+    calc = get_item(items, "calc")
+    assert (calc.deduction, calc.passed, calc.notes) == (0, True, "Verified by output")
+
+
+def test_predicates_run_at_most_once():
+    calls = []
+    predicates = PredicateSet(found=lambda c: calls.append(1) or 0)
+    plan = OverridePlan(RUBRIC, predicates, [
+        _rule("a", cases=[(lambda p: p["found"] > 0, Outcome(0, True, ""))]),
+        _rule("b", item="fmt", cases=[(lambda p: p["found"] > 0, Outcome(0, True, ""))]),
+    ])
+    plan.apply(RUBRIC.instantiate(), plan.evaluate(_context()))
+    assert calls == [1]
+
+
+def test_annotate_only_adds_notes():
+    plan = OverridePlan(RUBRIC, NO_PREDICATES, [
+        _rule("a", cases=[(lambda p: True, Outcome(MAX, False, "wrong result"))]),
+    ])
+    items = RUBRIC.instantiate()
+    get_item(items, "calc").notes = "Structure ok"
+    plan.annotate(items, plan.evaluate(_context()), "Direct calls")
+    calc = get_item(items, "calc")
+    assert (calc.deduction, calc.passed) == (0, True)
+    assert calc.notes == "Structure ok; Direct calls: wrong result"
@@ -0,0 +1,77 @@
+"""Cross-file class lookup and inheritance through ProjectModel."""
+
+import pytest
+
+from framework.source_bundle import SourceBundle
+
+pytest.importorskip("javalang")
+
+SOURCES = {
+    "LoanAccount.java": """package pa2;
+public class LoanAccount {
+    private double principal;
+    public double calculateMonthlyPayment() { return 0; }
+}
+""",
+    "CarLoan.java": """package pa2;
+public class CarLoan extends LoanAccount {
+    private String vehicleVIN;
+    public CarLoan(double principal, double rate, int months, String vin) { }
+}
+""",
+    "UsedCarLoan.java": """package pa2;
+public class UsedCarLoan extends CarLoan {
+    private int mileage;
+}
+""",
+    "Main.java": """package pa2;
+public class Main {
+    public static void main(String[] args) { }
+}
+""",
+}
+
+
+@pytest.fixture
+def bundle(tmp_path):
+    paths = []
+    for name, text in SOURCES.items():
+        path = tmp_path / name
+        path.write_text(text)
+        paths.append(path)
+    return SourceBundle(paths)
+
+
+def test_lookup_ignores_case(bundle):
+    project = bundle.project
+    assert project.get("carloan").name == "CarLoan"
+    assert project.get("CARLOAN").path.name == "CarLoan.java"
+    assert project.get("Mortgage") is None
+
+
+def test_find_falls_back_to_substring(bundle):
+    assert bundle.project.find("Loan").name == "LoanAccount"
+    assert bundle.project.find("UsedCar").name == "UsedCarLoan"
+
+
+def test_inheritance_graph(bundle):
+    project = bundle.project
+    used = project.get("UsedCarLoan")
+    assert [s.name for s in project.ancestors(used)] == ["CarLoan", "LoanAccount"]
+    assert project.is_subclass(used, "loanaccount")
+    base = project.get("LoanAccount")
+    assert {s.name for s in project.descendants(base)} == {"CarLoan", "UsedCarLoan"}
+
+
+def test_inherited_members(bundle):
+    project = bundle.project
+    used = project.get("UsedCarLoan")
+    assert [f.name for f in project.fields(used)] == ["mileage"]
+    assert [f.name for f in project.fields(used, inherited=True)] == ["mileage", "vehicleVIN", "principal"]
+    assert [m.name for m in project.methods(used, inherited=True)] == ["calculateMonthlyPayment"]
+
+
+def test_only_files_a_lookup_needs_are_parsed(bundle):
+    bundle.project.get("CarLoan")
+    parsed = {sf.path.name for sf in bundle.files if sf.parsed}
+    assert parsed == {"CarLoan.java"}